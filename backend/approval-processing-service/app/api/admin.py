@@ -0,0 +1,136 @@
+import asyncio
+
+import aio_pika
+from aio_pika import Message
+from fastapi import APIRouter, HTTPException, Query, Request, status
+
+from app.core.queue import approval_queue
+from app.core.retry import (
+    DEAD_LETTER_QUEUE,
+    HEADER_ERROR,
+    HEADER_FAILED_AT,
+    HEADER_ORIGINAL_ROUTING_KEY,
+    HEADER_RETRY_COUNT,
+    RetryTopology,
+    describe_dead_letter,
+    fetch_dead_letters,
+    original_routing_key,
+)
+from app.core.sla import sla_monitor
+from app.schemas.admin import DeadLetterList, DeadLetterOut, QueueStats, ReplayResult
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+)
+
+# 동시에 두 요청이 같은 메시지를 get/nack 하며 섞이지 않도록 직렬화
+_dead_letter_lock = asyncio.Lock()
+
+
+def _get_channel(request: Request):
+    channel = getattr(request.app.state, "rabbit_channel", None)
+    if channel is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="RabbitMQ is not connected",
+        )
+    return channel
+
+
+@router.get(
+    "/dead-letters",
+    response_model=DeadLetterList,
+)
+async def list_dead_letters(
+    request: Request,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    DLQ(approval.dead)에 쌓인 메시지를 앞에서부터 최대 limit개 조회.
+    조회한 메시지는 nack(requeue=True)로 그대로 큐에 되돌린다.
+    """
+    channel = _get_channel(request)
+    async with _dead_letter_lock:
+        queue = await channel.get_queue(DEAD_LETTER_QUEUE)
+        total = queue.declaration_result.message_count
+        messages = await fetch_dead_letters(queue, limit)
+        try:
+            items = [DeadLetterOut(**describe_dead_letter(m)) for m in messages]
+        finally:
+            for message in messages:
+                await message.nack(requeue=True)
+
+    return DeadLetterList(total=total, messages=items)
+
+
+@router.post(
+    "/dead-letters/replay",
+    response_model=ReplayResult,
+)
+async def replay_dead_letters(
+    request: Request,
+    limit: int = Query(100, ge=1, le=10_000),
+):
+    """
+    DLQ 메시지를 원래 routing key로 메인 exchange에 다시 publish (재시도 횟수 초기화).
+    원인을 고친 뒤 (예: Approval Request Service 복구) 호출한다.
+    """
+    channel = _get_channel(request)
+    topology: RetryTopology = request.app.state.rabbit_retry_topology
+
+    replayed = 0
+    async with _dead_letter_lock:
+        queue = await channel.get_queue(DEAD_LETTER_QUEUE)
+        for message in await fetch_dead_letters(queue, limit):
+            headers = dict(message.headers or {})
+            for key in (
+                HEADER_RETRY_COUNT,
+                HEADER_ORIGINAL_ROUTING_KEY,
+                HEADER_ERROR,
+                HEADER_FAILED_AT,
+            ):
+                headers.pop(key, None)
+
+            try:
+                await topology.main_exchange.publish(
+                    Message(
+                        body=message.body,
+                        headers=headers,
+                        content_type=message.content_type or "application/json",
+                        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                        priority=message.priority,
+                    ),
+                    routing_key=original_routing_key(message),
+                )
+            except Exception:
+                await message.nack(requeue=True)
+                raise
+            await message.ack()
+            replayed += 1
+
+    return ReplayResult(replayed=replayed)
+
+
+@router.get(
+    "/queue/stats",
+    response_model=QueueStats,
+)
+async def queue_stats():
+    """
+    In-Memory 큐 카운터 (중복 적재로 버려진 건수, SLA 타이머/리마인드/에스컬레이션 포함).
+    """
+    stats = approval_queue.stats
+    return QueueStats(
+        pending=approval_queue.pending_count(),
+        enqueued=stats["enqueued"],
+        completed=stats["completed"],
+        duplicatePending=stats["duplicate_pending"],
+        duplicateCompleted=stats["duplicate_completed"],
+        reassigned=stats["reassigned"],
+        withdrawn=stats["withdrawn"],
+        droppedWithdrawn=stats["dropped_withdrawn"],
+        slaTimers=len(sla_monitor),
+        slaReminded=sla_monitor.stats["reminded"],
+        slaEscalated=sla_monitor.stats["escalated"],
+    )
@@ -1,46 +1,67 @@
-import os
-from typing import List
+import logging
+from typing import Dict, List, Optional, Tuple
 
-import httpx
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from app.core.deps import require_owned_approver
 from app.core.queue import WorkItem, approval_queue
-from app.schemas.process import ProcessAction, WorkItemOut
+from app.core.rabbitmq import schedule_result_retry
+from app.core.result_client import (
+    RESULT_BATCH_CALLBACK_PATH,
+    RESULT_CALLBACK_PATH,
+    ResultCallbackError,
+    send_result,
+)
+from app.schemas.process import (
+    BulkProcessItemResult,
+    BulkProcessRequest,
+    BulkProcessResponse,
+    ProcessAction,
+    WorkItemOut,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/process",
     tags=["process"],
+    # 샤딩 모드: approver를 소유한 레플리카에서만 처리
+    dependencies=[Depends(require_owned_approver)],
 )
 
-APPROVAL_REQUEST_BASE_URL = os.getenv(
-    "APPROVAL_REQUEST_BASE_URL",
-    "http://approval-request-service:8000",
-)
 
-
-async def _send_result_to_request_service(item: WorkItem) -> None:
-    """
-    Approval Request Service로 결재 결과를 REST로 전달.
-    """
-    payload = {
+def _result_payload(item: WorkItem) -> dict:
+    return {
         "requestId": item.request_id,
         "step": item.step,
-        "approverId": item.approver_id,
+        # 에스컬레이션된 건도 step의 원래 결재자로 결과를 반영
+        "approverId": item.original_approver_id,
         "status": item.status,  # "approved" / "rejected"
     }
 
-    async with httpx.AsyncClient(
-        base_url=APPROVAL_REQUEST_BASE_URL,
-        timeout=5.0,
-    ) as client:
-        resp = await client.post("/approvals/internal/result", json=payload)
-        if resp.status_code >= 400:
-            # 여기서 예외를 터뜨려도 되고, 로그만 남기고 넘겨도 됨
-            # 수업용이라면 로그 & 예외 둘 다 남겨도 좋음
+
+async def _send_result_to_request_service(request: Request, item: WorkItem) -> None:
+    """
+    Approval Request Service로 결재 결과를 전달 (gRPC, 설정에 따라 REST).
+    일시적인 실패(네트워크 오류, 5xx / UNAVAILABLE 등)는 재시도 큐에 적재해서 결과가 유실되지 않게 한다.
+    """
+    payload = _result_payload(item)
+
+    try:
+        await send_result(RESULT_CALLBACK_PATH, payload)
+    except ResultCallbackError as exc:
+        if not exc.retryable:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Failed to update approval result: {resp.status_code} {resp.text}",
+                detail=str(exc),
             )
+        logger.warning(
+            "Result callback failed, scheduling retry: requestId=%s, step=%s: %s",
+            item.request_id,
+            item.step,
+            exc,
+        )
+        await schedule_result_retry(request.app, RESULT_CALLBACK_PATH, payload, str(exc))
 
 
 @router.get(
@@ -49,8 +70,16 @@ async def _send_result_to_request_service(item: WorkItem) -> None:
 )
 async def list_pending(
     approver_id: int,
+    response: Response,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
 ):
-    items = approval_queue.list_items(approver_id)
+    """
+    결재자의 대기 목록을 우선순위 순으로 조회 (offset/limit 페이지네이션).
+    전체 대기 건수는 X-Total-Count 헤더로 전달.
+    """
+    items = approval_queue.list_items(approver_id, offset=offset, limit=limit)
+    response.headers["X-Total-Count"] = str(approval_queue.count(approver_id))
     return [
         WorkItemOut(
             requestId=i.request_id,
@@ -60,11 +89,88 @@ async def list_pending(
             title=i.title,
             content=i.content,
             status=i.status,
+            escalatedFrom=i.original_approver_id if i.escalated else None,
         )
         for i in items
     ]
 
 
+@router.post(
+    "/{approver_id}/bulk",
+    response_model=BulkProcessResponse,
+)
+async def process_bulk(
+    approver_id: int,
+    body: BulkProcessRequest,
+    request: Request,
+):
+    """
+    결재자가 여러 건을 한 번에 approve / reject 처리.
+    1) In-Memory 큐에서 WorkItem들을 제거 + 상태 변경
+    2) Approval Request Service에 일괄 결과 콜백 1회 (gRPC ReportResults 또는 /approvals/internal/results)
+    3) 건별 처리 결과 반환 (요청 순서 유지)
+    """
+    outcomes: List[Optional[BulkProcessItemResult]] = []
+    popped: List[Tuple[int, WorkItem]] = []  # (outcomes index, item)
+
+    for entry in body.items:
+        item = approval_queue.pop_item(approver_id, entry.requestId)
+        if item is None:
+            outcomes.append(
+                BulkProcessItemResult(requestId=entry.requestId, outcome="not_found")
+            )
+            continue
+        item.status = "approved" if entry.action == "approve" else "rejected"
+        popped.append((len(outcomes), item))
+        outcomes.append(None)
+
+    if popped:
+        payload = {"results": [_result_payload(item) for _, item in popped]}
+        try:
+            resp = await send_result(RESULT_BATCH_CALLBACK_PATH, payload)
+        except ResultCallbackError as exc:
+            if exc.retryable:
+                logger.warning(
+                    "Bulk result callback failed, scheduling retry: approverId=%s, items=%d: %s",
+                    approver_id,
+                    len(popped),
+                    exc,
+                )
+                await schedule_result_retry(
+                    request.app, RESULT_BATCH_CALLBACK_PATH, payload, str(exc)
+                )
+                outcome, detail = "queued", None
+            else:
+                # 일괄 요청 자체가 거부됨 → WorkItem을 큐에 되돌린다
+                for _, item in popped:
+                    item.status = "pending"
+                    approval_queue.restore(item)
+                outcome, detail = "failed", str(exc)
+
+            for idx, item in popped:
+                outcomes[idx] = BulkProcessItemResult(
+                    requestId=item.request_id,
+                    outcome=outcome,
+                    status=item.status if outcome == "queued" else None,
+                    detail=detail,
+                )
+        else:
+            applied: Dict[Tuple[int, int], dict] = {
+                (r["requestId"], r["step"]): r for r in (resp or {}).get("results", [])
+            }
+            for idx, item in popped:
+                r = applied.get((item.request_id, item.step), {})
+                ok = bool(r.get("applied"))
+                outcomes[idx] = BulkProcessItemResult(
+                    requestId=item.request_id,
+                    outcome="processed" if ok else "failed",
+                    status=item.status,
+                    detail=r.get("detail"),
+                )
+
+    return BulkProcessResponse(results=outcomes)
+
+
 @router.post(
     "/{approver_id}/{request_id}",
     response_model=WorkItemOut,
@@ -73,11 +179,12 @@ async def process_item(
     approver_id: int,
     request_id: int,
     action: ProcessAction,
+    request: Request,
 ):
     """
     결재자가 approve / reject 처리.
     1) In-Memory 큐에서 WorkItem 제거 + 상태 변경
-    2) Approval Request Service에 결재 결과 REST 콜백
+    2) Approval Request Service에 결재 결과 콜백 (gRPC 또는 REST, 일시 실패 시 재시도 큐)
     """
     item = approval_queue.pop_item(approver_id, request_id)
     if item is None:
@@ -89,7 +196,7 @@ async def process_item(
     item.status = "approved" if action.action == "approve" else "rejected"
 
     # Approval Request Service에 결과 전달
-    await _send_result_to_request_service(item)
+    await _send_result_to_request_service(request, item)
 
     return WorkItemOut(
         requestId=item.request_id,
@@ -99,4 +206,5 @@ async def process_item(
         title=item.title,
         content=item.content,
         status=item.status,
+        escalatedFrom=item.original_approver_id if item.escalated else None,
     )
@@ -0,0 +1,84 @@
+import os
+
+# ---- approverId 기반 샤딩 ----
+# 1 이하: 단일 큐(approval.work) 모드 (기존 동작)
+# 2 이상: approval.work.{shard} 큐 N개로 분산, 레플리카는 자기 샤드만 소비
+APPROVAL_SHARD_COUNT = int(os.getenv("APPROVAL_SHARD_COUNT", "1"))
+
+# 이 레플리카가 소비할 샤드 목록 (예: "0,2").
+# 비어 있으면 StatefulSet hostname의 ordinal(…-3 → 3)을 사용하고,
+# 그것도 없으면 모든 샤드를 소비한다.
+APPROVAL_SHARD_IDS = os.getenv("APPROVAL_SHARD_IDS", "")
+
+# 다른 샤드 소유 레플리카로 REST 요청을 넘길 때 사용할 base URL
+APPROVAL_SHARD_URL_TEMPLATE = os.getenv(
+    "APPROVAL_SHARD_URL_TEMPLATE",
+    "http://approval-processing-service-{shard}.approval-processing-service-shards:8000",
+)
+
+# ---- AMQP consumer 튜닝 ----
+# 브로커가 ack 없이 한 번에 밀어줄 수 있는 최대 메시지 수 (basic.qos)
+CONSUMER_PREFETCH_COUNT = int(os.getenv("CONSUMER_PREFETCH_COUNT", "256"))
+# 동시에 메시지를 처리하는 worker task 수
+CONSUMER_CONCURRENCY = int(os.getenv("CONSUMER_CONCURRENCY", "16"))
+# 몇 개씩 모아서 basic.ack(multiple=True)를 보낼지 (prefetch보다 작아야 함)
+CONSUMER_ACK_BATCH_SIZE = int(os.getenv("CONSUMER_ACK_BATCH_SIZE", "64"))
+# batch가 덜 찼어도 이 간격(초)마다 ack flush
+CONSUMER_ACK_FLUSH_INTERVAL = float(os.getenv("CONSUMER_ACK_FLUSH_INTERVAL", "0.05"))
+
+# ---- 재시도 / Dead Letter ----
+# 처리 실패 메시지의 최대 재시도 횟수 (초과 시 approval.dead 큐로 이동, 0이면 재시도 없이 바로 이동)
+RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "5"))
+# 첫 재시도 대기 시간(ms), 이후 2배씩 증가 (1s, 2s, 4s, ...)
+RETRY_BASE_DELAY_MS = int(os.getenv("RETRY_BASE_DELAY_MS", "1000"))
+
+# ---- ApprovalQueue 중복 제거 ----
+# 처리 완료된 (requestId, step, approverId)를 기억해두는 개수 (늦게 도착한 재전송 무시용)
+QUEUE_COMPLETED_CAPACITY = int(os.getenv("QUEUE_COMPLETED_CAPACITY", "100000"))
+
+# ---- 결재함 우선순위 ----
+def _parse_number_map(raw: str) -> dict:
+    # "LEAVE=14400,GENERAL=259200" -> {"LEAVE": 14400.0, "GENERAL": 259200.0}
+    result = {}
+    for pair in raw.split(","):
+        if "=" in pair:
+            name, value = pair.split("=", 1)
+            result[name.strip()] = float(value)
+    return result
+
+
+# 요청 타입별 목표 대기 시간(초): 적재 후 이 시간이 지나면 처리 목표 시각
+PRIORITY_TYPE_TARGET_SECONDS = _parse_number_map(
+    os.getenv("PRIORITY_TYPE_TARGET_SECONDS", "LEAVE=14400,GENERAL=259200")
+)
+PRIORITY_DEFAULT_TARGET_SECONDS = float(os.getenv("PRIORITY_DEFAULT_TARGET_SECONDS", "259200"))
+# 마감일(연차 시작일 등)보다 이만큼 앞서 처리되도록 (초)
+PRIORITY_DEADLINE_LEAD_SECONDS = float(os.getenv("PRIORITY_DEADLINE_LEAD_SECONDS", "86400"))
+# 사용자 정의 점수 함수 "package.module:function" (비우면 기본 함수)
+PRIORITY_SCORER = os.getenv("PRIORITY_SCORER", "")
+
+# 작업 큐 x-max-priority (기본 0 = 비활성, opt-in). approval-request-service와 같은 값이어야 한다.
+# durable 큐의 인자는 바꿀 수 없으므로 이미 배포된 브로커에서 켜려면 큐를 비우고 지운 뒤 다시 띄울 것
+# (docs/troubleshooting.md 7.3). 0이어도 consumer 쪽 결재함 정렬(priority + aging)은 그대로 동작한다.
+APPROVAL_QUEUE_MAX_PRIORITY = int(os.getenv("APPROVAL_QUEUE_MAX_PRIORITY", "0"))
+
+# ---- SLA 리마인드 / 에스컬레이션 ----
+SLA_ENABLED = os.getenv("SLA_ENABLED", "true").lower() in ("1", "true", "yes")
+# timing wheel 1 tick(초), 한 level의 칸 수, level 수 (1초 * 64^4 ≈ 194일)
+SLA_TICK_SECONDS = float(os.getenv("SLA_TICK_SECONDS", "1"))
+SLA_WHEEL_SLOTS = int(os.getenv("SLA_WHEEL_SLOTS", "64"))
+SLA_WHEEL_LEVELS = int(os.getenv("SLA_WHEEL_LEVELS", "4"))
+# 처리 목표 시각(우선순위의 due time)이 지난 뒤 리마인드를 반복하는 간격(초)
+SLA_REMINDER_INTERVAL_SECONDS = float(os.getenv("SLA_REMINDER_INTERVAL_SECONDS", "86400"))
+# 리마인드를 이 횟수만큼 보낸 뒤에도 대기 중이면 대체 결재자에게 넘긴다
+SLA_ESCALATE_AFTER_REMINDERS = int(os.getenv("SLA_ESCALATE_AFTER_REMINDERS", "1"))
+# 결재자별 대체 결재자 "3=10,4=10", 없으면 SLA_DEFAULT_FALLBACK_APPROVER_ID (0이면 에스컬레이션 안 함)
+SLA_FALLBACK_APPROVERS = {
+    int(k): int(v) for k, v in _parse_number_map(os.getenv("SLA_FALLBACK_APPROVERS", "")).items()
+}
+SLA_DEFAULT_FALLBACK_APPROVER_ID = int(os.getenv("SLA_DEFAULT_FALLBACK_APPROVER_ID", "0"))
+
+NOTIFICATION_SERVICE_BASE_URL = os.getenv(
+    "NOTIFICATION_SERVICE_BASE_URL",
+    "http://notification-service:8000",
+)
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from aio_pika.abc import AbstractIncomingMessage
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[AbstractIncomingMessage], Awaitable[None]]
+FailureHandler = Callable[[AbstractIncomingMessage, Exception], Awaitable[None]]
+
+
+class AckBatcher:
+    """
+    처리 완료된 메시지를 모아서 basic.ack(multiple=True) 한 번으로 ack.
+
+    - delivery tag는 채널 단위로 수신 순서대로 증가하므로, 수신 순서를 기록해두고
+      "앞에서부터 연속으로 완료된 구간"까지만 multiple ack를 보낸다.
+      (동시 처리로 완료 순서가 뒤섞여도 미완료 메시지가 ack되지 않음)
+    - batch_size개가 모이거나 flush()가 호출되면 전송.
+    - 채널이 다시 열리면 delivery tag가 1부터 다시 시작하므로 tag가 아니라 메시지 객체로 구분한다.
+      reset() 이전 채널에서 받은 메시지의 settle은 무시한다 (브로커가 이미 재전달함).
+    """
+
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size = max(batch_size, 1)
+        # key: id(message), value: 미완료면 None, 완료면 (message, ack 대상 여부)
+        # OrderedDict로 수신 순서(= 현재 채널의 delivery tag 순서)를 유지한다.
+        # 메시지는 settle될 때까지 worker가 참조하고 있으므로 살아 있는 동안 id가 겹치지 않는다.
+        self._inflight: "OrderedDict[int, Optional[Tuple[AbstractIncomingMessage, bool]]]" = (
+            OrderedDict()
+        )
+        self._last_settled: Optional[AbstractIncomingMessage] = None
+        self._pending_acks = 0
+
+    def track(self, message: AbstractIncomingMessage) -> None:
+        self._inflight[id(message)] = None
+
+    def is_current(self, message: AbstractIncomingMessage) -> bool:
+        """현재 채널에서 받은, 아직 settle되지 않은 메시지인지 (reset 이전 메시지면 False)."""
+        return id(message) in self._inflight
+
+    def reset(self) -> None:
+        """채널 재연결 시 호출: 이전 채널의 delivery tag는 더 이상 유효하지 않다."""
+        self._inflight.clear()
+        self._last_settled = None
+        self._pending_acks = 0
+
+    def settle(self, message: AbstractIncomingMessage, acked: bool = True) -> bool:
+        """
+        메시지 완료 표시. acked=False는 이미 reject/nack으로 개별 처리된 경우.
+        multiple ack를 보내야 하면 True 반환.
+        """
+        key = id(message)
+        if key not in self._inflight:
+            # reset() 이전 채널의 메시지: 같은 번호의 새 delivery tag를 건드리지 않도록 무시
+            return False
+        self._inflight[key] = (message, acked)
+
+        # 앞에서부터 연속으로 완료된 구간을 잘라낸다
+        while self._inflight:
+            head = next(iter(self._inflight.values()))
+            if head is None:
+                break
+            self._inflight.popitem(last=False)
+            settled, was_acked = head
+            if was_acked:
+                self._last_settled = settled
+                self._pending_acks += 1
+
+        return self._pending_acks >= self.batch_size
+
+    async def flush(self) -> None:
+        if not self._pending_acks or self._last_settled is None:
+            return
+        message = self._last_settled
+        self._pending_acks = 0
+        self._last_settled = None
+        # 이 tag 이하의 메시지는 모두 완료(ack 또는 개별 reject)된 상태
+        await message.ack(multiple=True)
+
+
+class AmqpWorkerPool:
+    """
+    prefetch로 받은 메시지를 고정 개수의 worker task가 동시에 처리하는 consumer.
+
+    - queue.consume(pool.submit)로 등록
+    - handler가 예외 없이 끝나면 AckBatcher로 묶어서 ack
+    - handler가 예외를 던지면 on_failure(재시도 큐/DLQ로 재발행)가 성공한 경우 ack,
+      on_failure가 없거나 실패하면 해당 메시지만 nack(requeue=True)로 브로커에 반환
+    """
+
+    def __init__(
+        self,
+        handler: MessageHandler,
+        concurrency: int,
+        ack_batch_size: int,
+        ack_flush_interval: float,
+        on_failure: Optional[FailureHandler] = None,
+    ) -> None:
+        self._handler = handler
+        self._on_failure = on_failure
+        self._concurrency = max(concurrency, 1)
+        self._flush_interval = ack_flush_interval
+        self._acks = AckBatcher(ack_batch_size)
+        self._ack_lock = asyncio.Lock()
+        # prefetch_count가 in-flight 개수를 제한하므로 별도 maxsize는 두지 않는다
+        self._queue: "asyncio.Queue[AbstractIncomingMessage]" = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"amqp-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+        self._flusher = asyncio.create_task(self._flush_loop(), name="amqp-ack-flusher")
+
+    async def submit(self, message: AbstractIncomingMessage) -> None:
+        self._acks.track(message)
+        self._queue.put_nowait(message)
+
+    def reset(self, *_args) -> None:
+        self._acks.reset()
+
+    async def stop(self) -> None:
+        """큐에 남은 메시지를 모두 처리하고 ack를 flush한 뒤 worker 종료."""
+        await self._queue.join()
+        for task in self._workers:
+            task.cancel()
+        if self._flusher:
+            self._flusher.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        if self._flusher:
+            await asyncio.gather(self._flusher, return_exceptions=True)
+        async with self._ack_lock:
+            await self._acks.flush()
+
+    async def _worker(self) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                try:
+                    await self._handler(message)
+                except Exception as exc:
+                    await self._handle_failure(message, exc)
+                else:
+                    await self._settle(message, acked=True)
+            finally:
+                self._queue.task_done()
+
+    async def _handle_failure(self, message: AbstractIncomingMessage, exc: Exception) -> None:
+        if not self._acks.is_current(message):
+            # 이전 채널의 메시지는 채널이 닫힐 때 브로커가 이미 재전달했으므로 재발행 / nack 하지 않는다
+            logger.warning("Dropping failure of stale delivery (delivery_tag=%s): %r", message.delivery_tag, exc)
+            return
+        if self._on_failure is not None:
+            try:
+                await self._on_failure(message, exc)
+            except Exception:
+                logger.exception(
+                    "Failure handler failed (delivery_tag=%s), returning message to broker",
+                    message.delivery_tag,
+                )
+            else:
+                # 재시도 큐/DLQ로 넘어갔으므로 원본은 ack
+                await self._settle(message, acked=True)
+                return
+        else:
+            logger.error(
+                "Failed to handle message (delivery_tag=%s): %r",
+                message.delivery_tag,
+                exc,
+            )
+
+        await message.nack(requeue=True)
+        await self._settle(message, acked=False)
+
+    async def _settle(self, message: AbstractIncomingMessage, acked: bool) -> None:
+        async with self._ack_lock:
+            if self._acks.settle(message, acked=acked):
+                await self._acks.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            async with self._ack_lock:
+                await self._acks.flush()
@@ -0,0 +1,23 @@
+from fastapi import HTTPException, Request, status
+
+from app.core.sharding import approver_shard, is_owned_approver, shard_base_url
+
+
+async def require_owned_approver(approver_id: int, request: Request) -> None:
+    """
+    샤딩 모드에서 approver의 소유 샤드가 이 레플리카가 아니면
+    소유 레플리카로 307 Redirect (메서드/바디 유지).
+    """
+    if is_owned_approver(approver_id):
+        return
+
+    shard = approver_shard(approver_id)
+    location = shard_base_url(shard) + request.url.path
+    if request.url.query:
+        location += f"?{request.url.query}"
+
+    raise HTTPException(
+        status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+        detail=f"Approver {approver_id} is owned by shard {shard}",
+        headers={"Location": location},
+    )
@@ -0,0 +1,145 @@
+import heapq
+import importlib
+from datetime import datetime, time, timezone
+from typing import Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from app.core.config import (
+    PRIORITY_DEADLINE_LEAD_SECONDS,
+    PRIORITY_DEFAULT_TARGET_SECONDS,
+    PRIORITY_SCORER,
+    PRIORITY_TYPE_TARGET_SECONDS,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class IndexedHeap(Generic[K, V]):
+    """
+    key로 위치를 추적하는 binary min-heap.
+    - push / remove(key): O(log n)
+    - contains: O(1)
+    - smallest(n): 정렬된 상위 n개, 전체 정렬 없이 O(n log n)
+      (heap 구조를 따라 내려가며 후보만 본다)
+    """
+
+    __slots__ = ("_heap", "_pos", "_seq")
+
+    def __init__(self) -> None:
+        # entry: (score, seq, key, value) - 같은 score면 먼저 들어온 것 우선
+        self._heap: List[Tuple[float, int, K, V]] = []
+        self._pos: Dict[K, int] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._pos
+
+    def push(self, key: K, value: V, score: float) -> None:
+        if key in self._pos:
+            raise KeyError(f"duplicate key: {key!r}")
+        self._seq += 1
+        self._heap.append((score, self._seq, key, value))
+        self._pos[key] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def remove(self, key: K) -> Optional[V]:
+        idx = self._pos.pop(key, None)
+        if idx is None:
+            return None
+        value = self._heap[idx][3]
+        last = self._heap.pop()
+        if idx < len(self._heap):
+            self._heap[idx] = last
+            self._pos[last[2]] = idx
+            self._sift_down(idx)
+            self._sift_up(idx)
+        return value
+
+    def smallest(self, n: int) -> List[V]:
+        """score 오름차순 상위 n개."""
+        if n <= 0 or not self._heap:
+            return []
+        out: List[V] = []
+        frontier = [(self._heap[0][0], self._heap[0][1], 0)]
+        while frontier and len(out) < n:
+            _, _, idx = heapq.heappop(frontier)
+            out.append(self._heap[idx][3])
+            for child in (2 * idx + 1, 2 * idx + 2):
+                if child < len(self._heap):
+                    entry = self._heap[child]
+                    heapq.heappush(frontier, (entry[0], entry[1], child))
+        return out
+
+    def _less(self, i: int, j: int) -> bool:
+        a, b = self._heap[i], self._heap[j]
+        return (a[0], a[1]) < (b[0], b[1])
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][2]] = i
+        self._pos[heap[j][2]] = j
+
+    def _sift_up(self, idx: int) -> None:
+        while idx > 0:
+            parent = (idx - 1) >> 1
+            if not self._less(idx, parent):
+                break
+            self._swap(idx, parent)
+            idx = parent
+
+    def _sift_down(self, idx: int) -> None:
+        size = len(self._heap)
+        while True:
+            smallest = idx
+            for child in (2 * idx + 1, 2 * idx + 2):
+                if child < size and self._less(child, smallest):
+                    smallest = child
+            if smallest == idx:
+                return
+            self._swap(idx, smallest)
+            idx = smallest
+
+
+# ---- 우선순위 점수 ----
+# score가 작을수록 먼저 처리. 시간이 지나도 항목 간 순서가 바뀌지 않는 값이어야
+# heap을 다시 정렬하지 않고도 aging이 성립한다. 기본 점수는 "처리 목표 시각":
+#   due = min(적재 시각 + 요청 타입별 목표 대기 시간, 마감일 - 여유 시간)
+# 오래 기다린 일반 건은 due가 점점 앞쪽이 되어, 나중에 들어온 긴급 건보다 앞설 수 있다.
+
+
+def _deadline_timestamp(item) -> Optional[float]:
+    if item.deadline is None:
+        return None
+    start_of_day = datetime.combine(item.deadline, time.min, tzinfo=timezone.utc)
+    return start_of_day.timestamp()
+
+
+def due_at(item) -> float:
+    """처리 목표 시각 (epoch초). SLA 리마인드도 이 시각을 기준으로 한다."""
+    target = PRIORITY_TYPE_TARGET_SECONDS.get(
+        item.request_type, PRIORITY_DEFAULT_TARGET_SECONDS
+    )
+    due = item.enqueued_at + target
+    deadline = _deadline_timestamp(item)
+    if deadline is not None:
+        due = min(due, deadline - PRIORITY_DEADLINE_LEAD_SECONDS)
+    return due
+
+
+def default_score(item) -> float:
+    return due_at(item)
+
+
+def load_scorer() -> Callable[..., float]:
+    """
+    PRIORITY_SCORER="package.module:function" 이면 해당 함수를, 없으면 default_score 사용.
+    함수는 WorkItem을 받아 float(작을수록 우선)를 반환해야 한다.
+    """
+    if not PRIORITY_SCORER:
+        return default_score
+    module_name, _, attr = PRIORITY_SCORER.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
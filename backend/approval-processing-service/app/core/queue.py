@@ -1,51 +1,341 @@
-from collections import defaultdict, deque
-from dataclasses import dataclass
-from typing import Deque, Dict, List, Optional
+import time
+import weakref
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, List, Optional, Protocol, Set, Tuple
+
+from app.core.config import QUEUE_COMPLETED_CAPACITY
+from app.core.priority import IndexedHeap, load_scorer
+
+# (request_id, step, approver_id)
+WorkKey = Tuple[int, int, int]
+
+
+class _Payload:
+    """결재 요청 1건의 title/content. 같은 requestId의 WorkItem들이 공유한다."""
+
+    __slots__ = ("title", "content", "__weakref__")
+
+    def __init__(self, title: str, content: str) -> None:
+        self.title = title
+        self.content = content
+
+
+class PayloadStore:
+    """
+    requestId별 title/content를 한 벌만 보관하는 저장소.
+
+    값은 WeakValueDictionary로 들고 있으므로 CPython의 참조 카운트가 곧 refcount:
+    해당 requestId의 마지막 WorkItem이 사라지면 항목도 자동으로 제거된다.
+    """
+
+    def __init__(self) -> None:
+        self._payloads: "weakref.WeakValueDictionary[int, _Payload]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def intern(self, request_id: int, title: str, content: str) -> _Payload:
+        payload = self._payloads.get(request_id)
+        if payload is None or payload.title != title or payload.content != content:
+            payload = _Payload(title, content)
+            self._payloads[request_id] = payload
+        return payload
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+
+payload_store = PayloadStore()
 
 
-@dataclass
 class WorkItem:
-    request_id: int
-    step: int
-    requester_id: int
-    approver_id: int
-    title: str
-    content: str
-    status: str = "pending"
+    """
+    결재자 1명이 처리할 step 1건.
+
+    대기 건이 많아질 때를 대비해 __slots__로 인스턴스 dict를 없애고,
+    title/content는 PayloadStore에서 requestId 단위로 공유한다.
+    (5단계 결재여도 본문은 메모리에 한 벌만 존재)
+    """
+
+    __slots__ = (
+        "request_id",
+        "step",
+        "requester_id",
+        "approver_id",
+        "status",
+        "request_type",
+        "deadline",
+        "enqueued_at",
+        "original_approver_id",
+        "_payload",
+    )
+
+    def __init__(
+        self,
+        request_id: int,
+        step: int,
+        requester_id: int,
+        approver_id: int,
+        title: str,
+        content: str,
+        status: str = "pending",
+        request_type: str = "GENERAL",
+        deadline: Optional[date] = None,
+        enqueued_at: Optional[float] = None,
+        original_approver_id: Optional[int] = None,
+    ) -> None:
+        self.request_id = request_id
+        self.step = step
+        self.requester_id = requester_id
+        self.approver_id = approver_id
+        self.status = status
+        # 우선순위 계산용: 요청 타입, 마감일(연차 시작일 등), 적재 시각(epoch초)
+        self.request_type = request_type
+        self.deadline = deadline
+        self.enqueued_at = time.time() if enqueued_at is None else enqueued_at
+        # SLA 에스컬레이션으로 대체 결재자에게 넘어온 경우 원래 step의 결재자
+        # (결과 콜백은 원래 결재자 기준으로 보낸다)
+        self.original_approver_id = (
+            approver_id if original_approver_id is None else original_approver_id
+        )
+        self._payload = payload_store.intern(request_id, title, content)
+
+    @property
+    def title(self) -> str:
+        return self._payload.title
+
+    @property
+    def content(self) -> str:
+        return self._payload.content
+
+    @property
+    def key(self) -> WorkKey:
+        return (self.request_id, self.step, self.approver_id)
+
+    @property
+    def escalated(self) -> bool:
+        return self.original_approver_id != self.approver_id
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WorkItem):
+            return NotImplemented
+        return (
+            self.key == other.key
+            and self.requester_id == other.requester_id
+            and self.status == other.status
+            and self.title == other.title
+            and self.content == other.content
+        )
+
+    __hash__ = None  # dataclass(eq=True)와 동일하게 unhashable
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkItem(request_id={self.request_id}, step={self.step}, "
+            f"requester_id={self.requester_id}, approver_id={self.approver_id}, "
+            f"title={self.title!r}, status={self.status!r})"
+        )
+
+
+class QueueListener(Protocol):
+    """ApprovalQueue 변경 알림 (SLA 타이머 등록/취소용). 동기 함수, O(1)로 끝나야 한다."""
+
+    def on_enqueued(self, item: WorkItem) -> None: ...
+
+    def on_removed(self, item: WorkItem) -> None: ...
 
 
 class ApprovalQueue:
     """
     approverId별로 처리 대기 중인 WorkItem을 보관하는 In-Memory 큐.
+
+    결재자별 결재함은 우선순위 heap(IndexedHeap)이다.
+    - 점수 함수(load_scorer)로 요청 타입 / 마감일 / 대기 시간을 반영해 정렬
+    - 적재 / requestId로 제거: O(log n)
+
+    AMQP 재전송 / gRPC 중복 호출로 같은 (requestId, step, approverId)가 여러 번 들어와도
+    한 번만 적재된다 (at-least-once 전달을 그대로 받아도 안전).
+    - 대기 중인 key → _pending 인덱스로 O(1) 판별
+    - 이미 처리된 key → 최근 처리 목록(크기 제한 LRU)으로 늦은 재전송 무시
+
+    요청자가 회수한 요청은 remove_request로 _by_request 인덱스를 통해 스캔 없이 제거하고,
+    회수 목록(크기 제한 LRU)에 남겨서 회수 이벤트보다 늦게 도착한 WorkItem도 버린다.
     """
 
-    def __init__(self) -> None:
-        # key: approverId, value: deque of WorkItem
-        self._queues: Dict[int, Deque[WorkItem]] = defaultdict(deque)
+    def __init__(
+        self,
+        completed_capacity: int = QUEUE_COMPLETED_CAPACITY,
+        scorer: Optional[Callable[[WorkItem], float]] = None,
+    ) -> None:
+        # key: approverId, value: 결재함 heap (key: WorkKey)
+        self._queues: Dict[int, IndexedHeap[WorkKey, WorkItem]] = {}
+        # key: (request_id, step, approver_id), value: 대기 중인 WorkItem
+        self._pending: Dict[WorkKey, WorkItem] = {}
+        # key: request_id, value: 대기 중인 WorkKey들 (스캔 없이 requestId로 찾기)
+        self._by_request: Dict[int, Set[WorkKey]] = {}
+        # 최근 처리 완료된 key (오래된 것부터 밀려남)
+        self._completed: "OrderedDict[WorkKey, None]" = OrderedDict()
+        self._completed_capacity = completed_capacity
+        # 최근 회수된 request_id
+        self._withdrawn: "OrderedDict[int, None]" = OrderedDict()
+        self._score = scorer or load_scorer()
+        self._listeners: List[QueueListener] = []
+        self.stats: Dict[str, int] = {
+            "enqueued": 0,
+            "completed": 0,
+            "duplicate_pending": 0,
+            "duplicate_completed": 0,
+            "reassigned": 0,
+            "withdrawn": 0,
+            "dropped_withdrawn": 0,
+        }
+
+    def add_listener(self, listener: QueueListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: QueueListener) -> None:
+        self._listeners.remove(listener)
+
+    def enqueue(self, item: WorkItem) -> bool:
+        """
+        WorkItem 적재. 중복이면 적재하지 않고 False 반환.
+        """
+        key = item.key
+        if key in self._pending:
+            self.stats["duplicate_pending"] += 1
+            return False
+        if key in self._completed:
+            self.stats["duplicate_completed"] += 1
+            return False
+        if item.request_id in self._withdrawn:
+            self.stats["dropped_withdrawn"] += 1
+            return False
+
+        heap = self._queues.get(item.approver_id)
+        if heap is None:
+            heap = self._queues[item.approver_id] = IndexedHeap()
+        heap.push(key, item, self._score(item))
+        self._pending[key] = item
+        self._by_request.setdefault(item.request_id, set()).add(key)
+        self.stats["enqueued"] += 1
+        for listener in self._listeners:
+            listener.on_enqueued(item)
+        return True
+
+    def restore(self, item: WorkItem) -> bool:
+        """
+        pop_item으로 꺼냈지만 처리하지 못한 WorkItem을 다시 적재 (완료 기록 취소).
+        """
+        self._completed.pop(item.key, None)
+        return self.enqueue(item)
 
-    def enqueue(self, item: WorkItem) -> None:
-        self._queues[item.approver_id].append(item)
+    def list_items(
+        self,
+        approver_id: int,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[WorkItem]:
+        """
+        우선순위 순으로 정렬된 결재함 (offset/limit 페이지네이션).
+        """
+        heap = self._queues.get(approver_id)
+        if not heap:
+            return []
+        end = len(heap) if limit is None else min(offset + limit, len(heap))
+        return heap.smallest(end)[offset:]
 
-    def list_items(self, approver_id: int) -> List[WorkItem]:
-        return list(self._queues.get(approver_id, []))
+    def count(self, approver_id: int) -> int:
+        heap = self._queues.get(approver_id)
+        return len(heap) if heap else 0
 
     def pop_item(self, approver_id: int, request_id: int) -> Optional[WorkItem]:
         """
-        해당 approver의 큐에서 request_id에 해당하는 WorkItem을 찾아 제거 후 반환.
+        해당 approver의 결재함에서 request_id에 해당하는 WorkItem을 제거 후 반환.
+        (같은 요청에 같은 결재자가 여러 step이면 가장 앞 step)
         """
-        q = self._queues.get(approver_id)
-        if not q:
+        keys = [k for k in self._by_request.get(request_id, ()) if k[2] == approver_id]
+        if not keys:
             return None
+        item = self._remove(min(keys))
+        self._mark_completed(item.key)
+        return item
+
+    def remove_request(self, request_id: int) -> List[WorkItem]:
+        """
+        회수된 요청의 대기 WorkItem을 모두 제거 (결재자/step 무관).
+        _by_request 인덱스로 해당 key만 찾으므로 O(k log n), k = 그 요청의 대기 step 수.
+        """
+        self._withdrawn[request_id] = None
+        self._withdrawn.move_to_end(request_id)
+        if len(self._withdrawn) > self._completed_capacity:
+            self._withdrawn.popitem(last=False)
+
+        removed = [self._remove(key) for key in list(self._by_request.get(request_id, ()))]
+        for item in removed:
+            self._remember_completed(item.key)
+        self.stats["withdrawn"] += len(removed)
+        return removed
+
+    def get(self, key: WorkKey) -> Optional[WorkItem]:
+        return self._pending.get(key)
+
+    def reassign(self, key: WorkKey, approver_id: int) -> Optional[WorkItem]:
+        """
+        대기 중인 WorkItem을 다른 결재자의 결재함으로 옮긴다 (SLA 에스컬레이션).
+        원래 key는 완료 처리해서 늦게 도착한 재전송이 원래 결재자에게 다시 쌓이지 않게 한다.
+        """
+        item = self._pending.get(key)
+        if item is None:
+            return None
+        moved = WorkItem(
+            request_id=item.request_id,
+            step=item.step,
+            requester_id=item.requester_id,
+            approver_id=approver_id,
+            title=item.title,
+            content=item.content,
+            status=item.status,
+            request_type=item.request_type,
+            deadline=item.deadline,
+            enqueued_at=item.enqueued_at,
+            original_approver_id=item.original_approver_id,
+        )
+        if moved.key in self._pending:
+            return None
+        self._remove(key)
+        self._remember_completed(key)
+        self._completed.pop(moved.key, None)
+        self.enqueue(moved)
+        self.stats["reassigned"] += 1
+        return moved
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _remove(self, key: WorkKey) -> WorkItem:
+        item = self._pending.pop(key)
+        heap = self._queues[item.approver_id]
+        heap.remove(key)
+        if not heap:
+            # 결재함이 비면 key도 제거
+            del self._queues[item.approver_id]
+        keys = self._by_request[item.request_id]
+        keys.discard(key)
+        if not keys:
+            del self._by_request[item.request_id]
+        for listener in self._listeners:
+            listener.on_removed(item)
+        return item
+
+    def _mark_completed(self, key: WorkKey) -> None:
+        self._remember_completed(key)
+        self.stats["completed"] += 1
 
-        for idx, item in enumerate(q):
-            if item.request_id == request_id:
-                # deque에서 제거
-                del q[idx]
-                if not q:
-                    # 큐가 비면 key도 제거
-                    del self._queues[approver_id]
-                return item
-        return None
+    def _remember_completed(self, key: WorkKey) -> None:
+        self._completed[key] = None
+        self._completed.move_to_end(key)
+        if len(self._completed) > self._completed_capacity:
+            self._completed.popitem(last=False)
 
 
 # 전역 인스턴스 (REST와 gRPC가 함께 사용)
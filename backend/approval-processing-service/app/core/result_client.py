@@ -0,0 +1,172 @@
+import os
+from typing import Any, Dict, List, Optional
+
+import grpc
+import httpx
+
+from app.grpc_stubs import approval_pb2, approval_pb2_grpc
+
+APPROVAL_REQUEST_BASE_URL = os.getenv(
+    "APPROVAL_REQUEST_BASE_URL",
+    "http://approval-request-service:8000",
+)
+
+# 결과 콜백 전송 방식: grpc (기본, 채널 1개를 재사용) / rest (기존 HTTP 콜백)
+RESULT_CALLBACK_TRANSPORT = os.getenv("RESULT_CALLBACK_TRANSPORT", "grpc").lower()
+APPROVAL_REQUEST_GRPC_TARGET = os.getenv(
+    "APPROVAL_REQUEST_GRPC_TARGET",
+    "approval-request-service:50052",
+)
+# RPC 1회의 deadline (초)
+RESULT_GRPC_TIMEOUT = float(os.getenv("RESULT_GRPC_TIMEOUT", "5"))
+
+# 재시도 큐 메시지의 path 값으로도 쓰인다 (전송 방식과 무관하게 단건/일괄 구분)
+RESULT_CALLBACK_PATH = "/approvals/internal/result"
+RESULT_BATCH_CALLBACK_PATH = "/approvals/internal/results"
+
+# 재시도하면 성공할 수 있는 gRPC status (그 외는 요청 자체의 문제)
+_RETRYABLE_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.ABORTED,
+        grpc.StatusCode.INTERNAL,
+        grpc.StatusCode.UNKNOWN,
+    }
+)
+
+_CHANNEL_OPTIONS = [
+    # 유휴 구간에도 연결을 유지해서 결재 처리 시 재연결(TCP + HTTP/2 handshake)을 피한다
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+_channel: Optional[grpc.aio.Channel] = None
+_stub: Optional[approval_pb2_grpc.ApprovalResultStub] = None
+
+
+class ResultCallbackError(Exception):
+    """
+    Approval Request Service 결과 콜백 실패.
+    retryable=False면 (4xx 등) 재시도해도 성공할 수 없는 요청.
+    """
+
+    def __init__(self, message: str, retryable: bool) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+async def post_result(path: str, payload: Dict[str, Any]) -> Optional[Any]:
+    """
+    Approval Request Service로 결재 결과를 REST로 전달.
+    응답 바디가 있으면 (일괄 콜백) JSON으로 반환.
+    """
+    try:
+        async with httpx.AsyncClient(
+            base_url=APPROVAL_REQUEST_BASE_URL,
+            timeout=5.0,
+        ) as client:
+            resp = await client.post(path, json=payload)
+    except httpx.HTTPError as exc:
+        raise ResultCallbackError(f"Result callback failed: {exc!r}", retryable=True) from exc
+
+    if resp.status_code >= 400:
+        raise ResultCallbackError(
+            f"Failed to update approval result: {resp.status_code} {resp.text}",
+            retryable=resp.status_code >= 500 or resp.status_code == 429,
+        )
+    return resp.json() if resp.content else None
+
+
+def _get_stub() -> approval_pb2_grpc.ApprovalResultStub:
+    """
+    Approval Request Service gRPC 채널 (프로세스당 1개, 최초 호출 시 생성).
+    HTTP/2 연결 하나에 동시 RPC가 다중화된다.
+    """
+    global _channel, _stub
+    if _stub is None:
+        _channel = grpc.aio.insecure_channel(
+            APPROVAL_REQUEST_GRPC_TARGET, options=_CHANNEL_OPTIONS
+        )
+        _stub = approval_pb2_grpc.ApprovalResultStub(_channel)
+    return _stub
+
+
+def _to_request(payload: Dict[str, Any]) -> approval_pb2.ApprovalResultRequest:
+    return approval_pb2.ApprovalResultRequest(
+        requestId=payload["requestId"],
+        step=payload["step"],
+        approverId=payload["approverId"],
+        status=payload["status"],
+    )
+
+
+def _rpc_error(exc: grpc.aio.AioRpcError) -> ResultCallbackError:
+    return ResultCallbackError(
+        f"Result RPC failed: {exc.code().name} {exc.details()}",
+        retryable=exc.code() in _RETRYABLE_CODES,
+    )
+
+
+async def report_result(payload: Dict[str, Any]) -> None:
+    """결재 결과 1건을 gRPC ReportResult로 전달."""
+    try:
+        await _get_stub().ReportResult(
+            _to_request(payload), timeout=RESULT_GRPC_TIMEOUT, wait_for_ready=True
+        )
+    except grpc.aio.AioRpcError as exc:
+        raise _rpc_error(exc) from exc
+
+
+async def report_results(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    결재 결과 여러 건을 gRPC ReportResults(client streaming)로 전달.
+    반환 형식은 REST 일괄 콜백 응답({"results": [...]})과 같다.
+    """
+    requests: List[approval_pb2.ApprovalResultRequest] = [
+        _to_request(r) for r in payload["results"]
+    ]
+    try:
+        reply = await _get_stub().ReportResults(
+            iter(requests), timeout=RESULT_GRPC_TIMEOUT, wait_for_ready=True
+        )
+    except grpc.aio.AioRpcError as exc:
+        raise _rpc_error(exc) from exc
+
+    return {
+        "results": [
+            {
+                "requestId": r.requestId,
+                "step": r.step,
+                "approverId": r.approverId,
+                "applied": r.applied,
+                "finalStatus": r.finalStatus or None,
+                "detail": r.detail or None,
+            }
+            for r in reply.results
+        ]
+    }
+
+
+async def send_result(path: str, payload: Dict[str, Any]) -> Optional[Any]:
+    """
+    RESULT_CALLBACK_TRANSPORT 설정에 따라 gRPC 또는 REST로 결재 결과 전달.
+    path는 단건(RESULT_CALLBACK_PATH) / 일괄(RESULT_BATCH_CALLBACK_PATH) 구분.
+    """
+    if RESULT_CALLBACK_TRANSPORT != "grpc":
+        return await post_result(path, payload)
+    if path == RESULT_BATCH_CALLBACK_PATH:
+        return await report_results(payload)
+    await report_result(payload)
+    return None
+
+
+async def close_result_client() -> None:
+    global _channel, _stub
+    if _channel is not None:
+        await _channel.close()
+    _channel = None
+    _stub = None
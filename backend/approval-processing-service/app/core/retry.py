@@ -0,0 +1,262 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import aio_pika
+from aio_pika import ExchangeType, Message
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractQueue,
+)
+
+from app.core.config import RETRY_BASE_DELAY_MS, RETRY_MAX_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대기 큐: TTL이 지나면 메인 exchange로 dead-letter 되어 원래 큐로 돌아간다
+RETRY_EXCHANGE = "approval.retry"
+RETRY_QUEUE_PREFIX = "approval.retry"
+
+# 최종 실패 메시지 보관
+DEAD_LETTER_EXCHANGE = "approval.dlx"
+DEAD_LETTER_QUEUE = "approval.dead"
+DEAD_LETTER_ROUTING_KEY = "approval.dead"
+
+HEADER_RETRY_COUNT = "x-retry-count"
+HEADER_RETRY_TIER = "x-retry-tier"
+HEADER_ORIGINAL_ROUTING_KEY = "x-original-routing-key"
+HEADER_ERROR = "x-error"
+HEADER_FAILED_AT = "x-failed-at"
+
+
+class NonRetryableError(Exception):
+    """
+    재시도해도 결과가 같은 실패 (JSON 파싱 실패, 필수 키 누락 등).
+    재시도 큐를 거치지 않고 바로 DLQ로 보낸다.
+    """
+
+
+def retry_delay_ms(tier: int) -> int:
+    """tier 0, 1, 2, ... → base, base*2, base*4, ... (exponential backoff)"""
+    return RETRY_BASE_DELAY_MS * (2 ** tier)
+
+
+def retry_queue_name(tier: int) -> str:
+    return f"{RETRY_QUEUE_PREFIX}.{retry_delay_ms(tier)}ms"
+
+
+@dataclass
+class RetryTopology:
+    main_exchange: AbstractExchange
+    retry_exchange: AbstractExchange
+    dead_letter_exchange: AbstractExchange
+    dead_letter_queue: AbstractQueue
+
+
+async def declare_retry_topology(
+    channel: AbstractChannel,
+    main_exchange: AbstractExchange,
+) -> RetryTopology:
+    """
+    DLX/DLQ + 지수 백오프 재시도 큐 선언.
+
+    approval.retry (headers exchange)
+      └─ x-retry-tier=n → approval.retry.{delay}ms (x-message-ttl=delay,
+                           x-dead-letter-exchange=approval)
+                           → TTL 만료 시 원래 routing key 그대로 메인 exchange로 복귀
+    approval.dlx (direct) ─ approval.dead → approval.dead (DLQ)
+    """
+    retry_exchange = await channel.declare_exchange(
+        RETRY_EXCHANGE,
+        ExchangeType.HEADERS,
+        durable=True,
+    )
+    for tier in range(RETRY_MAX_ATTEMPTS):
+        queue = await channel.declare_queue(
+            retry_queue_name(tier),
+            durable=True,
+            arguments={
+                "x-message-ttl": retry_delay_ms(tier),
+                # routing key를 지정하지 않으면 publish할 때의 routing key를 그대로 사용
+                "x-dead-letter-exchange": main_exchange.name,
+            },
+        )
+        await queue.bind(
+            retry_exchange,
+            arguments={"x-match": "all", HEADER_RETRY_TIER: tier},
+        )
+
+    dead_letter_exchange = await channel.declare_exchange(
+        DEAD_LETTER_EXCHANGE,
+        ExchangeType.DIRECT,
+        durable=True,
+    )
+    dead_letter_queue = await channel.declare_queue(DEAD_LETTER_QUEUE, durable=True)
+    await dead_letter_queue.bind(dead_letter_exchange, routing_key=DEAD_LETTER_ROUTING_KEY)
+
+    return RetryTopology(
+        main_exchange=main_exchange,
+        retry_exchange=retry_exchange,
+        dead_letter_exchange=dead_letter_exchange,
+        dead_letter_queue=dead_letter_queue,
+    )
+
+
+def _copy_message(
+    body: bytes,
+    headers: Dict[str, Any],
+    content_type: Optional[str],
+    priority: Optional[int] = None,
+) -> Message:
+    return Message(
+        body=body,
+        headers=headers,
+        content_type=content_type or "application/json",
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        # 재시도 후 원래 큐로 돌아갈 때도 AMQP priority 유지
+        priority=priority,
+    )
+
+
+def original_routing_key(message: AbstractIncomingMessage) -> str:
+    headers = message.headers or {}
+    key = headers.get(HEADER_ORIGINAL_ROUTING_KEY)
+    if isinstance(key, bytes):
+        key = key.decode("utf-8")
+    return key or message.routing_key or ""
+
+
+def retry_count(message: AbstractIncomingMessage) -> int:
+    return int((message.headers or {}).get(HEADER_RETRY_COUNT, 0))
+
+
+async def publish_for_retry(
+    topology: RetryTopology,
+    routing_key: str,
+    body: bytes,
+    headers: Optional[Dict[str, Any]] = None,
+    attempt: int = 0,
+    error: str = "",
+    priority: Optional[int] = None,
+) -> None:
+    """
+    attempt번째 재시도 대기 큐에 적재 (TTL 후 routing_key로 메인 exchange에 복귀).
+    그 tier의 대기 큐가 없으면 (RETRY_MAX_ATTEMPTS=0 등) 받을 큐 없이 버려지지 않도록 DLQ로 보낸다.
+    """
+    if attempt >= RETRY_MAX_ATTEMPTS:
+        logger.error(
+            "No retry tier %s (RETRY_MAX_ATTEMPTS=%s), dead-lettering (routing_key=%s): %s",
+            attempt,
+            RETRY_MAX_ATTEMPTS,
+            routing_key,
+            error,
+        )
+        await publish_dead_letter(topology, routing_key, body, headers, error, priority)
+        return
+    headers = dict(headers or {})
+    headers.update(
+        {
+            HEADER_RETRY_COUNT: attempt + 1,
+            HEADER_RETRY_TIER: attempt,
+            HEADER_ORIGINAL_ROUTING_KEY: routing_key,
+            HEADER_ERROR: error[:500],
+        }
+    )
+    await topology.retry_exchange.publish(
+        _copy_message(body, headers, None, priority),
+        routing_key=routing_key,
+    )
+
+
+async def publish_dead_letter(
+    topology: RetryTopology,
+    routing_key: str,
+    body: bytes,
+    headers: Optional[Dict[str, Any]] = None,
+    error: str = "",
+    priority: Optional[int] = None,
+) -> None:
+    headers = dict(headers or {})
+    headers.update(
+        {
+            HEADER_ORIGINAL_ROUTING_KEY: routing_key,
+            HEADER_ERROR: error[:500],
+            HEADER_FAILED_AT: datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    headers.pop(HEADER_RETRY_TIER, None)
+    await topology.dead_letter_exchange.publish(
+        _copy_message(body, headers, None, priority),
+        routing_key=DEAD_LETTER_ROUTING_KEY,
+    )
+
+
+async def retry_or_dead_letter(
+    topology: RetryTopology,
+    message: AbstractIncomingMessage,
+    exc: BaseException,
+) -> None:
+    """
+    처리 실패한 메시지를 재시도 큐 또는 DLQ로 넘긴다.
+    (호출한 쪽은 이 함수가 성공하면 원본 메시지를 ack)
+    """
+    routing_key = original_routing_key(message)
+    attempts = retry_count(message)
+    error = f"{type(exc).__name__}: {exc}"
+    headers = dict(message.headers or {})
+
+    if isinstance(exc, NonRetryableError) or attempts >= RETRY_MAX_ATTEMPTS:
+        logger.error(
+            "Dead-lettering message (routing_key=%s, attempts=%s): %s",
+            routing_key,
+            attempts,
+            error,
+        )
+        await publish_dead_letter(
+            topology, routing_key, message.body, headers, error, message.priority
+        )
+        return
+
+    logger.warning(
+        "Scheduling retry %s/%s in %sms (routing_key=%s): %s",
+        attempts + 1,
+        RETRY_MAX_ATTEMPTS,
+        retry_delay_ms(attempts),
+        routing_key,
+        error,
+    )
+    await publish_for_retry(
+        topology, routing_key, message.body, headers, attempts, error, message.priority
+    )
+
+
+def describe_dead_letter(message: AbstractIncomingMessage) -> Dict[str, Any]:
+    headers = message.headers or {}
+
+    def _text(value: Any) -> Any:
+        return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
+    return {
+        "routingKey": original_routing_key(message),
+        "retryCount": retry_count(message),
+        "error": _text(headers.get(HEADER_ERROR)),
+        "failedAt": _text(headers.get(HEADER_FAILED_AT)),
+        "body": message.body.decode("utf-8", "replace"),
+    }
+
+
+async def fetch_dead_letters(
+    queue: AbstractQueue,
+    limit: int,
+) -> List[AbstractIncomingMessage]:
+    """DLQ에서 최대 limit개를 basic.get으로 가져온다 (ack/nack는 호출한 쪽 책임)."""
+    messages: List[AbstractIncomingMessage] = []
+    for _ in range(limit):
+        message = await queue.get(no_ack=False, fail=False)
+        if message is None:
+            break
+        messages.append(message)
+    return messages
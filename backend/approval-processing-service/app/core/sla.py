@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.config import (
+    NOTIFICATION_SERVICE_BASE_URL,
+    SLA_DEFAULT_FALLBACK_APPROVER_ID,
+    SLA_ESCALATE_AFTER_REMINDERS,
+    SLA_FALLBACK_APPROVERS,
+    SLA_REMINDER_INTERVAL_SECONDS,
+    SLA_TICK_SECONDS,
+    SLA_WHEEL_LEVELS,
+    SLA_WHEEL_SLOTS,
+)
+from app.core.priority import due_at
+from app.core.queue import ApprovalQueue, WorkItem, WorkKey, approval_queue
+from app.core.sharding import is_owned_approver
+from app.core.timing_wheel import TimerHandle, TimingWheel
+
+logger = logging.getLogger(__name__)
+
+# 한 tick에 만료된 알림을 /notify/batch 요청 1번에 몇 항목씩 보낼지 (notification-service 상한 500)
+_NOTIFY_BATCH_SIZE = 500
+
+
+class SlaMonitor:
+    """
+    대기 중인 WorkItem의 처리 목표 시각(due_at)을 timing wheel로 추적.
+
+    - ApprovalQueue listener: 적재 시 타이머 등록, pop_item 등으로 빠지면 O(1) 취소
+      (WorkItem마다 asyncio task를 만들지 않고, task 1개가 tick마다 wheel을 진행)
+    - 만료 시: 결재자에게 리마인드 알림 → SLA_REMINDER_INTERVAL_SECONDS 후 다시 확인
+    - 리마인드를 SLA_ESCALATE_AFTER_REMINDERS번 보내도 대기 중이고 대체 결재자가 있으면
+      대체 결재자의 결재함으로 옮긴다 (결과 콜백은 원래 결재자 기준)
+    """
+
+    def __init__(
+        self,
+        queue: ApprovalQueue,
+        tick_seconds: float = SLA_TICK_SECONDS,
+        slots: int = SLA_WHEEL_SLOTS,
+        levels: int = SLA_WHEEL_LEVELS,
+        reminder_interval: float = SLA_REMINDER_INTERVAL_SECONDS,
+        escalate_after: int = SLA_ESCALATE_AFTER_REMINDERS,
+        fallbacks: Optional[Dict[int, int]] = None,
+        default_fallback: int = SLA_DEFAULT_FALLBACK_APPROVER_ID,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._queue = queue
+        self._tick = tick_seconds
+        self._clock = clock
+        self._wheel = TimingWheel(slots, levels, start_tick=self._floor_tick(clock()))
+        self._reminder_interval = reminder_interval
+        self._escalate_after = escalate_after
+        self._fallbacks = SLA_FALLBACK_APPROVERS if fallbacks is None else fallbacks
+        self._default_fallback = default_fallback
+        # key: WorkKey, value: 등록된 타이머 / 지금까지 보낸 리마인드 수
+        self._timers: Dict[WorkKey, TimerHandle] = {}
+        self._reminders: Dict[WorkKey, int] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats: Dict[str, int] = {"reminded": 0, "escalated": 0}
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    # ---- ApprovalQueue listener ----
+
+    def on_enqueued(self, item: WorkItem) -> None:
+        self._arm(item.key, due_at(item))
+
+    def on_removed(self, item: WorkItem) -> None:
+        handle = self._timers.pop(item.key, None)
+        if handle is not None:
+            self._wheel.cancel(handle)
+        self._reminders.pop(item.key, None)
+
+    # ---- lifecycle ----
+
+    async def start(self) -> None:
+        self._client = httpx.AsyncClient(base_url=NOTIFICATION_SERVICE_BASE_URL, timeout=5.0)
+        self._queue.add_listener(self)
+        self._task = asyncio.create_task(self._run(), name="sla-monitor")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._queue.remove_listener(self)
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._tick)
+            try:
+                await self.advance()
+            except Exception:
+                logger.exception("SLA tick failed")
+
+    async def advance(self, now: Optional[float] = None) -> int:
+        """now까지 wheel을 진행하고 만료된 타이머를 처리. 처리한 건수 반환."""
+        now = self._clock() if now is None else now
+        expired = self._wheel.advance(self._floor_tick(now))
+        notifications: List[dict] = []  # /notify/batch 항목 {"employeeIds", "payload"}
+        for handle in expired:
+            key = handle.payload
+            if self._timers.get(key) is handle:
+                del self._timers[key]
+            notifications.extend(self._fire(key, now))
+
+        batches = [
+            notifications[start:start + _NOTIFY_BATCH_SIZE]
+            for start in range(0, len(notifications), _NOTIFY_BATCH_SIZE)
+        ]
+        await asyncio.gather(*(self._notify(batch) for batch in batches))
+        return len(expired)
+
+    # ---- 내부 ----
+
+    def _floor_tick(self, ts: float) -> int:
+        return math.floor(ts / self._tick)
+
+    def _arm(self, key: WorkKey, at: float) -> None:
+        old = self._timers.get(key)
+        if old is not None:
+            self._wheel.cancel(old)
+        # 올림: 목표 시각보다 먼저 울리지 않게
+        self._timers[key] = self._wheel.schedule(math.ceil(at / self._tick), key)
+
+    def _fallback_for(self, item: WorkItem) -> Optional[int]:
+        if item.escalated:
+            # 한 번 넘어간 건은 다시 넘기지 않고 리마인드만
+            return None
+        fallback = self._fallbacks.get(item.approver_id, self._default_fallback)
+        if not fallback or fallback == item.approver_id:
+            return None
+        if not is_owned_approver(fallback):
+            # 다른 샤드 소유 결재자의 결재함은 이 레플리카에서 바꿀 수 없다
+            logger.warning(
+                "Fallback approver %s is not owned by this shard, reminding instead",
+                fallback,
+            )
+            return None
+        return fallback
+
+    def _fire(self, key: WorkKey, now: float) -> List[dict]:
+        """만료된 key 처리 후 보낼 알림 항목({"employeeIds", "payload"}) 목록 반환."""
+        item = self._queue.get(key)
+        if item is None:
+            return []
+
+        base = {
+            "requestId": item.request_id,
+            "step": item.step,
+            "title": item.title,
+            "overdueSeconds": max(int(now - due_at(item)), 0),
+        }
+        sent = self._reminders.get(key, 0)
+        fallback = self._fallback_for(item)
+
+        if fallback is not None and sent >= self._escalate_after:
+            moved = self._queue.reassign(key, fallback)
+            if moved is not None:
+                self._arm(moved.key, now + self._reminder_interval)
+                self.stats["escalated"] += 1
+                logger.info(
+                    "Escalated WorkItem: requestId=%s, step=%s, approverId %s -> %s",
+                    item.request_id,
+                    item.step,
+                    item.approver_id,
+                    fallback,
+                )
+                # 대체 결재자 + 원래 결재자에게 같은 알림 (본문은 1회만 직렬화)
+                return [
+                    {
+                        "employeeIds": [fallback, item.approver_id],
+                        "payload": {
+                            **base,
+                            "type": "approval_escalated",
+                            "fromApproverId": item.approver_id,
+                        },
+                    }
+                ]
+
+        self._reminders[key] = sent + 1
+        self._arm(key, now + self._reminder_interval)
+        self.stats["reminded"] += 1
+        return [
+            {
+                "employeeIds": [item.approver_id],
+                "payload": {"type": "approval_reminder", **base},
+            }
+        ]
+
+    async def _notify(self, items: List[dict]) -> None:
+        if self._client is None:
+            return
+        try:
+            response = await self._client.post("/notify/batch", json={"items": items})
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            # 알림 실패는 다음 리마인드 주기에 다시 시도되므로 로그만 남긴다
+            logger.warning(
+                "SLA notification failed: items=%s, requestIds=%s: %r",
+                len(items),
+                [item["payload"]["requestId"] for item in items[:10]],
+                exc,
+            )
+
+
+# 전역 인스턴스 (main.py startup에서 start)
+sla_monitor = SlaMonitor(approval_queue)
@@ -0,0 +1,114 @@
+from typing import Any, Dict, List, Optional
+
+
+class TimerHandle:
+    """TimingWheel.schedule()이 돌려주는 타이머. cancel()에 그대로 넘긴다."""
+
+    __slots__ = ("expire_tick", "payload", "_bucket")
+
+    def __init__(self, expire_tick: int, payload: Any) -> None:
+        self.expire_tick = expire_tick
+        self.payload = payload
+        # 현재 들어 있는 slot (만료/취소되면 None)
+        self._bucket: Optional[Dict["TimerHandle", None]] = None
+
+    @property
+    def active(self) -> bool:
+        return self._bucket is not None
+
+
+class TimingWheel:
+    """
+    계층형 timing wheel (Varghese & Lauck, 리눅스 커널 타이머와 같은 방식).
+
+    - level k의 slot 1칸 = slots^k tick, level 하나가 slots칸
+      (slots=64, levels=4, tick=1초면 64^4초 ≈ 194일까지 표현)
+    - schedule / cancel: O(1) (slot은 dict라서 handle로 바로 삭제)
+    - advance: tick마다 level 0의 slot 1개를 비우고, 상위 level의 slot이 한 바퀴 돌 때마다
+      그 slot의 타이머를 아래 level로 다시 배치(cascade). 타이머 1개당 최대 levels번 이동.
+
+    시간 단위는 정수 tick이다. 실제 시간 ↔ tick 변환은 호출한 쪽(SlaMonitor) 책임.
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 4, start_tick: int = 0) -> None:
+        if slots < 2 or levels < 1:
+            raise ValueError("slots must be >= 2 and levels >= 1")
+        self.slots = slots
+        self.levels = levels
+        self.now = start_tick
+        self._wheels: List[List[Dict[TimerHandle, None]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._spans = [slots ** level for level in range(levels)]
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, expire_tick: int, payload: Any) -> TimerHandle:
+        """expire_tick에 만료될 타이머 등록 (이미 지난 tick이면 다음 advance에서 만료)."""
+        handle = TimerHandle(expire_tick, payload)
+        self._place(handle, max(expire_tick, self.now + 1))
+        self._count += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        bucket = handle._bucket
+        if bucket is None:
+            return False
+        del bucket[handle]
+        handle._bucket = None
+        self._count -= 1
+        return True
+
+    def advance(self, to_tick: int) -> List[TimerHandle]:
+        """to_tick까지 시간을 진행하고 만료된 타이머 목록을 반환 (만료 순서)."""
+        expired: List[TimerHandle] = []
+        while self.now < to_tick:
+            self.now += 1
+            self._cascade()
+            bucket = self._wheels[0][self.now % self.slots]
+            if not bucket:
+                continue
+            handles = list(bucket)
+            bucket.clear()
+            for handle in handles:
+                if handle.expire_tick > self.now:
+                    # 표현 범위를 넘어서 임시로 놓였던 타이머 → 다시 배치
+                    self._place(handle, handle.expire_tick)
+                    continue
+                handle._bucket = None
+                expired.append(handle)
+                self._count -= 1
+        return expired
+
+    def _place(self, handle: TimerHandle, expire: int) -> None:
+        for level, span in enumerate(self._spans):
+            # 현재 tick과 같은 바퀴 안(slots칸 이내)에 들어오는 가장 낮은 level
+            if expire // span - self.now // span < self.slots:
+                slot = (expire // span) % self.slots
+                break
+        else:
+            # 표현 범위를 넘으면 최상위 level의 마지막 칸에 두고, cascade될 때 다시 배치
+            level, span = self.levels - 1, self._spans[-1]
+            slot = (self.now // span + self.slots - 1) % self.slots
+        bucket = self._wheels[level][slot]
+        bucket[handle] = None
+        handle._bucket = bucket
+
+    def _cascade(self) -> None:
+        # now가 slots^k의 배수면 level k의 현재 칸이 돌아온 것 → 위 level부터 내려보낸다
+        top = 0
+        for level in range(1, self.levels):
+            if self.now % self._spans[level]:
+                break
+            top = level
+        for level in range(top, 0, -1):
+            bucket = self._wheels[level][(self.now // self._spans[level]) % self.slots]
+            if not bucket:
+                continue
+            handles = list(bucket)
+            bucket.clear()
+            for handle in handles:
+                # 만료 tick이 now면 level 0의 현재 칸으로 → 곧바로 advance에서 만료
+                self._place(handle, max(handle.expire_tick, self.now))
@@ -3,6 +3,7 @@ import logging
 import grpc
 
 from app.core.queue import WorkItem, approval_queue
+from app.core.sharding import approver_shard, is_owned_approver
 from app.grpc_stubs import approval_pb2, approval_pb2_grpc
 
 logger = logging.getLogger(__name__)
@@ -22,12 +23,24 @@ class ApprovalService(approval_pb2_grpc.ApprovalServicer):
         ApprovalRequest 메시지를 받아서 각 approverId별 큐에 WorkItem으로 적재.
         """
         logger.info(
-            "Received RequestApproval: requestId=%s, requesterId=%s, steps=%d",
-            request.requestId,
-            request.requesterId,
-            len(request.steps),
+            "Received RequestApproval",
+            extra={
+                "requestId": request.requestId,
+                "requesterId": request.requesterId,
+                "steps": len(request.steps),
+            },
         )
 
+        # 샤딩 모드: 이 레플리카가 소유하지 않은 approver의 step은 받지 않는다
+        # (클라이언트가 샤드별로 나눠서 호출해야 함)
+        foreign = [s.approverId for s in request.steps if not is_owned_approver(s.approverId)]
+        if foreign:
+            await context.abort(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "approvers not owned by this shard: "
+                + ", ".join(f"{a}->shard {approver_shard(a)}" for a in foreign),
+            )
+
         for step in request.steps:
             item = WorkItem(
                 request_id=request.requestId,
@@ -37,13 +50,16 @@ class ApprovalService(approval_pb2_grpc.ApprovalServicer):
                 title=request.title,
                 content=request.content,
             )
-            approval_queue.enqueue(item)
-            logger.info(
-                "Enqueued WorkItem: requestId=%s, step=%s, approverId=%s",
-                item.request_id,
-                item.step,
-                item.approver_id,
-            )
+            fields = {
+                "requestId": item.request_id,
+                "step": item.step,
+                "approverId": item.approver_id,
+            }
+            # step마다 찍히는 로그는 DEBUG (필요하면 LOG_SAMPLING으로 샘플링)
+            if not approval_queue.enqueue(item):
+                logger.debug("Duplicate WorkItem ignored", extra=fields)
+                continue
+            logger.debug("Enqueued WorkItem", extra=fields)
 
         return approval_pb2.ApprovalResponse(
             requestId=request.requestId,
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x61pproval.proto\x12\x08\x61pproval\"8\n\x04Step\x12\x0c\n\x04step\x18\x01 \x01(\x05\x12\x12\n\napproverId\x18\x02 \x01(\x03\x12\x0e\n\x06status\x18\x03 \x01(\t\"x\n\x0f\x41pprovalRequest\x12\x11\n\trequestId\x18\x01 \x01(\x03\x12\x13\n\x0brequesterId\x18\x02 \x01(\x03\x12\r\n\x05title\x18\x03 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\t\x12\x1d\n\x05steps\x18\x05 \x03(\x0b\x32\x0e.approval.Step\"6\n\x10\x41pprovalResponse\x12\x11\n\trequestId\x18\x01 \x01(\x03\x12\x0f\n\x07message\x18\x02 \x01(\t2T\n\x08\x41pproval\x12H\n\x0fRequestApproval\x12\x19.approval.ApprovalRequest\x1a\x1a.approval.ApprovalResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x61pproval.proto\x12\x08\x61pproval\"8\n\x04Step\x12\x0c\n\x04step\x18\x01 \x01(\x05\x12\x12\n\napproverId\x18\x02 \x01(\x03\x12\x0e\n\x06status\x18\x03 \x01(\t\"x\n\x0f\x41pprovalRequest\x12\x11\n\trequestId\x18\x01 \x01(\x03\x12\x13\n\x0brequesterId\x18\x02 \x01(\x03\x12\r\n\x05title\x18\x03 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\t\x12\x1d\n\x05steps\x18\x05 \x03(\x0b\x32\x0e.approval.Step\"6\n\x10\x41pprovalResponse\x12\x11\n\trequestId\x18\x01 \x01(\x03\x12\x0f\n\x07message\x18\x02 \x01(\t\"\\\n\x15\x41pprovalResultRequest\x12\x11\n\trequestId\x18\x01 \x01(\x03\x12\x0c\n\x04step\x18\x02 \x01(\x05\x12\x12\n\napproverId\x18\x03 \x01(\x03\x12\x0e\n\x06status\x18\x04 \x01(\t\"\x80\x01\n\x13\x41pprovalResultReply\x12\x11\n\trequestId\x18\x01 \x01(\x03\x12\x0c\n\x04step\x18\x02 \x01(\x05\x12\x12\n\napproverId\x18\x03 \x01(\x03\x12\x0f\n\x07\x61pplied\x18\x04 \x01(\x08\x12\x13\n\x0b\x66inalStatus\x18\x05 \x01(\t\x12\x0e\n\x06\x64\x65tail\x18\x06 \x01(\t\"J\n\x18\x41pprovalResultBatchReply\x12.\n\x07results\x18\x01 \x03(\x0b\x32\x1d.approval.ApprovalResultReply2T\n\x08\x41pproval\x12H\n\x0fRequestApproval\x12\x19.approval.ApprovalRequest\x1a\x1a.approval.ApprovalResponse2\xb8\x01\n\x0e\x41pprovalResult\x12N\n\x0cReportResult\x12\x1f.approval.ApprovalResultRequest\x1a\x1d.approval.ApprovalResultReply\x12V\n\rReportResults\x12\x1f.approval.ApprovalResultRequest\x1a\".approval.ApprovalResultBatchReply(\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,6 +37,14 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_APPROVALREQUEST']._serialized_end=206
   _globals['_APPROVALRESPONSE']._serialized_start=208
   _globals['_APPROVALRESPONSE']._serialized_end=262
-  _globals['_APPROVAL']._serialized_start=264
-  _globals['_APPROVAL']._serialized_end=348
+  _globals['_APPROVALRESULTREQUEST']._serialized_start=264
+  _globals['_APPROVALRESULTREQUEST']._serialized_end=356
+  _globals['_APPROVALRESULTREPLY']._serialized_start=359
+  _globals['_APPROVALRESULTREPLY']._serialized_end=487
+  _globals['_APPROVALRESULTBATCHREPLY']._serialized_start=489
+  _globals['_APPROVALRESULTBATCHREPLY']._serialized_end=563
+  _globals['_APPROVAL']._serialized_start=565
+  _globals['_APPROVAL']._serialized_end=649
+  _globals['_APPROVALRESULT']._serialized_start=652
+  _globals['_APPROVALRESULT']._serialized_end=836
 # @@protoc_insertion_point(module_scope)
@@ -96,3 +96,120 @@ class Approval(object):
             timeout,
             metadata,
             _registered_method=True)
+
+
+class ApprovalResultStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.ReportResult = channel.unary_unary(
+                '/approval.ApprovalResult/ReportResult',
+                request_serializer=approval__pb2.ApprovalResultRequest.SerializeToString,
+                response_deserializer=approval__pb2.ApprovalResultReply.FromString,
+                _registered_method=True)
+        self.ReportResults = channel.stream_unary(
+                '/approval.ApprovalResult/ReportResults',
+                request_serializer=approval__pb2.ApprovalResultRequest.SerializeToString,
+                response_deserializer=approval__pb2.ApprovalResultBatchReply.FromString,
+                _registered_method=True)
+
+
+class ApprovalResultServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def ReportResult(self, request, context):
+        """결재 1건. 반영 실패는 status code로 (NOT_FOUND / INVALID_ARGUMENT / FAILED_PRECONDITION)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReportResults(self, request_iterator, context):
+        """일괄 결재: client streaming, 건별 반영 결과를 한 번에 반환 (일부 실패해도 OK)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ApprovalResultServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'ReportResult': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReportResult,
+                    request_deserializer=approval__pb2.ApprovalResultRequest.FromString,
+                    response_serializer=approval__pb2.ApprovalResultReply.SerializeToString,
+            ),
+            'ReportResults': grpc.stream_unary_rpc_method_handler(
+                    servicer.ReportResults,
+                    request_deserializer=approval__pb2.ApprovalResultRequest.FromString,
+                    response_serializer=approval__pb2.ApprovalResultBatchReply.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'approval.ApprovalResult', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('approval.ApprovalResult', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ApprovalResult(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def ReportResult(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/approval.ApprovalResult/ReportResult',
+            approval__pb2.ApprovalResultRequest.SerializeToString,
+            approval__pb2.ApprovalResultReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReportResults(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/approval.ApprovalResult/ReportResults',
+            approval__pb2.ApprovalResultRequest.SerializeToString,
+            approval__pb2.ApprovalResultBatchReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
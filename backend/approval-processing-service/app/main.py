@@ -2,10 +2,15 @@ import logging
 
 from fastapi import FastAPI
 
+from app.api.admin import router as admin_router
 from app.api.process import router as process_router
+from app.core.config import SLA_ENABLED
+from app.core.log import setup_logging, shutdown_logging
 from app.core.rabbitmq import start_consumer, close_consumer
+from app.core.result_client import close_result_client
+from app.core.sla import sla_monitor
 
-logging.basicConfig(level=logging.INFO)
+setup_logging("approval-processing-service")
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
@@ -16,6 +21,7 @@ app = FastAPI(
 
 # REST 라우터 등록
 app.include_router(process_router)
+app.include_router(admin_router)
 
 
 @app.get("/health")
@@ -36,6 +42,9 @@ async def root():
 
 @app.on_event("startup")
 async def on_startup():
+    if SLA_ENABLED:
+        # consumer보다 먼저 listener를 등록해야 처음 적재되는 WorkItem부터 타이머가 걸린다
+        await sla_monitor.start()
     logger.info("Starting RabbitMQ consumer for Approval Processing Service")
     await start_consumer(app)
 
@@ -44,3 +53,7 @@ async def on_startup():
 async def on_shutdown():
     logger.info("Shutting down RabbitMQ consumer for Approval Processing Service")
     await close_consumer(app)
+    if SLA_ENABLED:
+        await sla_monitor.stop()
+    await close_result_client()
+    shutdown_logging()
@@ -0,0 +1,34 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class DeadLetterOut(BaseModel):
+    routingKey: str
+    retryCount: int
+    error: Optional[str] = None
+    failedAt: Optional[str] = None
+    body: str
+
+
+class DeadLetterList(BaseModel):
+    total: int
+    messages: List[DeadLetterOut]
+
+
+class ReplayResult(BaseModel):
+    replayed: int
+
+
+class QueueStats(BaseModel):
+    pending: int
+    enqueued: int
+    completed: int
+    duplicatePending: int
+    duplicateCompleted: int
+    reassigned: int
+    withdrawn: int
+    droppedWithdrawn: int
+    slaTimers: int
+    slaReminded: int
+    slaEscalated: int
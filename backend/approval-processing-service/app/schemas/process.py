@@ -1,3 +1,5 @@
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -9,10 +11,34 @@ class WorkItemOut(BaseModel):
     title: str
     content: str
     status: str
+    # SLA 에스컬레이션으로 넘어온 건이면 원래 결재자
+    escalatedFrom: Optional[int] = None
 
     class Config:
-        from_attributes = True  # dataclass -> Pydantic 변환용
+        from_attributes = True  # WorkItem -> Pydantic 변환용
 
 
 class ProcessAction(BaseModel):
     action: str = Field(..., pattern="^(approve|reject)$")
+
+
+class BulkProcessItem(BaseModel):
+    requestId: int
+    action: str = Field(..., pattern="^(approve|reject)$")
+
+
+class BulkProcessRequest(BaseModel):
+    items: List[BulkProcessItem] = Field(..., min_length=1, max_length=500)
+
+
+class BulkProcessItemResult(BaseModel):
+    requestId: int
+    # processed: 결과 반영 완료 / queued: 콜백 실패로 재시도 큐에 적재
+    # not_found: 대기 중인 WorkItem 없음 / failed: Approval Request Service가 거부
+    outcome: Literal["processed", "queued", "not_found", "failed"]
+    status: Optional[str] = None  # "approved" / "rejected"
+    detail: Optional[str] = None
+
+
+class BulkProcessResponse(BaseModel):
+    results: List[BulkProcessItemResult]
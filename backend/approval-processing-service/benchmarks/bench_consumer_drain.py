@@ -0,0 +1,158 @@
+"""
+AMQP consumer backlog drain 벤치마크 (RabbitMQ 없이 in-process stand-in 사용).
+
+장애 후 쌓인 approval.work 메시지 N개를 비우는 데 걸리는 시간을
+prefetch / worker 수 / ack batch 설정별로 비교한다.
+
+stand-in 브로커 모델:
+- 미ack 메시지가 prefetch_count 미만일 때만 다음 메시지를 push
+- basic.ack가 브로커에 도착해 window가 열리기까지 rtt초가 걸림
+
+실행 (approval-processing-service 디렉터리에서):
+    python -m benchmarks.bench_consumer_drain --messages 100000 --rtt 0.0005
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from app.core import rabbitmq
+from app.core.consumer import AmqpWorkerPool
+from app.core.queue import ApprovalQueue
+
+
+class FakeMessage:
+    __slots__ = ("delivery_tag", "body", "_broker")
+
+    def __init__(self, broker: "FakeBroker", delivery_tag: int, body: bytes) -> None:
+        self._broker = broker
+        self.delivery_tag = delivery_tag
+        self.body = body
+
+    async def ack(self, multiple: bool = False) -> None:
+        self._broker.on_ack(self.delivery_tag, multiple)
+
+    async def nack(self, multiple: bool = False, requeue: bool = True) -> None:
+        self._broker.on_ack(self.delivery_tag, multiple)
+
+
+class FakeBroker:
+    """prefetch window와 ack 왕복 지연만 흉내내는 단일 큐 브로커."""
+
+    def __init__(self, bodies: List[bytes], prefetch: int, rtt: float) -> None:
+        self._bodies = bodies
+        self._next = 0
+        self._prefetch = prefetch  # 0 = 무제한 (basic.qos 미설정)
+        self._rtt = rtt
+        self._unacked: set[int] = set()
+        self._callback: Optional[Callable[[FakeMessage], Awaitable[None]]] = None
+        self.ack_frames = 0
+        self.done = asyncio.Event()
+
+    def consume(self, callback: Callable[[FakeMessage], Awaitable[None]]) -> None:
+        self._callback = callback
+        self._pump()
+
+    def on_ack(self, tag: int, multiple: bool) -> None:
+        self.ack_frames += 1
+        if multiple:
+            settled = {t for t in self._unacked if t <= tag}
+        else:
+            settled = {tag}
+        asyncio.get_running_loop().call_later(self._rtt, self._release, settled)
+
+    def _release(self, settled: set) -> None:
+        self._unacked -= settled
+        if self._next >= len(self._bodies) and not self._unacked:
+            self.done.set()
+            return
+        self._pump()
+
+    def _pump(self) -> None:
+        while self._next < len(self._bodies) and (
+            self._prefetch == 0 or len(self._unacked) < self._prefetch
+        ):
+            tag = self._next + 1
+            self._unacked.add(tag)
+            message = FakeMessage(self, tag, self._bodies[self._next])
+            self._next += 1
+            # aio_pika도 메시지마다 task를 만들어 callback을 호출한다
+            asyncio.ensure_future(self._callback(message))
+
+
+def _make_bodies(count: int, approvers: int) -> List[bytes]:
+    bodies = []
+    for i in range(1, count + 1):
+        bodies.append(
+            json.dumps(
+                {
+                    "requestId": i,
+                    "requesterId": 1,
+                    "title": f"결재 요청 {i}",
+                    "content": "backlog drain benchmark",
+                    "steps": [
+                        {"step": 1, "approverId": 2 + i % approvers, "status": "pending"},
+                        {"step": 2, "approverId": 1, "status": "pending"},
+                    ],
+                }
+            ).encode("utf-8")
+        )
+    return bodies
+
+
+async def _run(
+    bodies: List[bytes], prefetch: int, concurrency: int, batch: int, rtt: float
+) -> tuple[float, int]:
+    rabbitmq.approval_queue = ApprovalQueue()
+    broker = FakeBroker(bodies, prefetch=prefetch, rtt=rtt)
+    pool = AmqpWorkerPool(
+        rabbitmq._handle_message,
+        concurrency=concurrency,
+        ack_batch_size=batch,
+        ack_flush_interval=0.005,
+    )
+    await pool.start()
+
+    started = time.perf_counter()
+    broker.consume(pool.submit)
+    await broker.done.wait()
+    elapsed = time.perf_counter() - started
+
+    await pool.stop()
+    return elapsed, broker.ack_frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--approvers", type=int, default=500)
+    parser.add_argument("--rtt", type=float, default=0.0005, help="ack 왕복 지연(초)")
+    args = parser.parse_args()
+
+    bodies = _make_bodies(args.messages, args.approvers)
+    scenarios = [
+        # (이름, prefetch, concurrency, ack batch)
+        ("prefetch=1, 1 worker, per-message ack", 1, 1, 1),
+        ("prefetch=32, 4 workers, per-message ack", 32, 4, 1),
+        ("prefetch=256, 16 workers, batch ack 64", 256, 16, 64),
+        ("prefetch=1024, 16 workers, batch ack 256", 1024, 16, 256),
+    ]
+
+    # prefetch=1은 메시지당 rtt가 그대로 걸리므로 일부만 측정 후 환산
+    print(f"messages={args.messages}, rtt={args.rtt * 1000:.2f}ms")
+    print(f"{'scenario':<45} {'msg/s':>12} {'drain(s)':>10} {'ack frames':>11}")
+    for name, prefetch, concurrency, batch in scenarios:
+        sample = bodies
+        if prefetch == 1:
+            sample = bodies[: min(len(bodies), 2_000)]
+        elapsed, frames = asyncio.run(_run(sample, prefetch, concurrency, batch, args.rtt))
+        rate = len(sample) / elapsed
+        print(
+            f"{name:<45} {rate:>12,.0f} {args.messages / rate:>10.2f} "
+            f"{frames * len(bodies) // len(sample):>11,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
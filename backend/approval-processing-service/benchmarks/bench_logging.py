@@ -0,0 +1,101 @@
+"""
+메시지 처리 경로의 로그 비용 벤치마크.
+
+이벤트 루프(호출한 쓰레드)에서 로그 1건당 걸리는 시간을 비교한다.
+출력은 `cat > /dev/null` 파이프로 보내고, 배포 환경(PYTHONUNBUFFERED=1)처럼 줄 단위로 write 한다.
+
+- print      : 기존 _handle_message처럼 WorkItem repr을 print
+- stream     : logging.StreamHandler (포맷 + write가 호출 쓰레드에서)
+- queue      : app.core.log의 QueueHandler → QueueListener (포맷 + write는 별도 쓰레드)
+- queue+1%   : queue + LOG_SAMPLING 0.01
+
+실행 (approval-processing-service 디렉터리에서):
+    python -m benchmarks.bench_logging --records 200000
+"""
+import argparse
+import contextlib
+import logging
+import logging.handlers
+import queue
+import subprocess
+import time
+
+from app.core import log as app_log
+from app.core.queue import WorkItem
+
+
+def _item(n: int) -> WorkItem:
+    return WorkItem(
+        request_id=n,
+        step=1,
+        requester_id=1,
+        approver_id=2 + n % 100,
+        title="출장비 정산",
+        content="내용",
+    )
+
+
+def _bench_print(records: int, devnull) -> float:
+    item = _item(0)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(devnull):
+        for _ in range(records):
+            print(f"[RabbitMQ] WorkItem added: {item}")
+    return time.perf_counter() - start
+
+
+def _bench_logger(records: int, handler: logging.Handler) -> float:
+    logger = logging.getLogger("bench.rabbitmq")
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    item = _item(0)
+    start = time.perf_counter()
+    for _ in range(records):
+        logger.info(
+            "[RabbitMQ] WorkItem added",
+            extra={"requestId": item.request_id, "step": item.step, "approverId": item.approver_id},
+        )
+    return time.perf_counter() - start
+
+
+def _queue_handler(devnull, rates=None):
+    log_queue = queue.SimpleQueue()
+    handler = app_log._InProcessQueueHandler(log_queue)
+    if rates:
+        handler.addFilter(app_log.SamplingFilter(rates))
+    stream = logging.StreamHandler(devnull)
+    stream.setFormatter(app_log.JsonFormatter("bench"))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    return handler, listener
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    sink = subprocess.Popen(["cat"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+    with open(sink.stdin.fileno(), "w", buffering=1, closefd=False) as devnull:
+        results = [("print", _bench_print(args.records, devnull))]
+
+        stream = logging.StreamHandler(devnull)
+        stream.setFormatter(app_log.JsonFormatter("bench"))
+        results.append(("stream", _bench_logger(args.records, stream)))
+
+        for name, rates in (("queue", None), ("queue+1%", {"bench": 0.01})):
+            handler, listener = _queue_handler(devnull, rates)
+            listener.start()
+            results.append((name, _bench_logger(args.records, handler)))
+            listener.stop()
+    sink.stdin.close()
+    sink.wait()
+
+    print(f"records={args.records:,} (caller-thread time only)")
+    print(f"{'method':<10} {'total(s)':>9} {'us/record':>10}")
+    for name, elapsed in results:
+        print(f"{name:<10} {elapsed:>9.2f} {elapsed / args.records * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
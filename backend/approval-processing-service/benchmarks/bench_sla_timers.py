@@ -0,0 +1,120 @@
+"""
+SLA 타이머 벤치마크: timing wheel vs asyncio 타이머.
+
+대기 WorkItem N개에 타이머를 걸고 → 절반을 취소(pop_item)하고 → 나머지를 만료시킬 때
+걸리는 시간과 메모리(tracemalloc)를 비교한다.
+
+- task     : WorkItem마다 asyncio.sleep 하는 task 1개 (가장 단순한 구현)
+- call_later: loop.call_later 핸들 1개 (asyncio 내부 heap, 등록/취소 O(log n))
+- wheel    : TimingWheel (등록/취소 O(1), task 1개가 tick마다 진행)
+
+실행 (approval-processing-service 디렉터리에서):
+    python -m benchmarks.bench_sla_timers --timers 1000000
+"""
+import argparse
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from app.core.timing_wheel import TimingWheel
+
+# 타이머 만료 시각 범위 (tick = 초): 1초 ~ 3일
+_MAX_DELAY = 3 * 24 * 3600
+
+
+def _delays(count: int) -> List[int]:
+    rng = random.Random(42)
+    return [rng.randint(1, _MAX_DELAY) for _ in range(count)]
+
+
+async def _bench_task(delays: List[int]) -> Tuple[float, float, int]:
+    async def sleeper(delay: int) -> None:
+        await asyncio.sleep(delay)
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(sleeper(d)) for d in delays]
+    await asyncio.sleep(0)  # 모든 task가 sleep에 진입할 때까지
+    scheduled = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for task in tasks[::2]:
+        task.cancel()
+    for task in tasks[1::2]:
+        task.cancel()  # 만료 대신 취소 (실제 시간만큼 기다릴 수 없으므로)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return scheduled, time.perf_counter() - start, memory
+
+
+async def _bench_call_later(delays: List[int]) -> Tuple[float, float, int]:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    handles = [loop.call_later(d, lambda: None) for d in delays]
+    scheduled = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for handle in handles:
+        handle.cancel()
+    await asyncio.sleep(0)
+    return scheduled, time.perf_counter() - start, memory
+
+
+async def _bench_wheel(delays: List[int]) -> Tuple[float, float, int]:
+    wheel = TimingWheel(slots=64, levels=4)
+    start = time.perf_counter()
+    handles = [wheel.schedule(d, n) for n, d in enumerate(delays)]
+    scheduled = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    for handle in handles[::2]:
+        wheel.cancel(handle)
+    # 나머지 절반은 실제로 만료시킨다 (3일치 tick을 한 번에 진행)
+    fired = len(wheel.advance(_MAX_DELAY))
+    assert fired == len(handles) - len(handles[::2])
+    return scheduled, time.perf_counter() - start, memory
+
+
+def _run(bench: Callable, delays: List[int]) -> Tuple[float, float, int]:
+    # 1회차: 시간 측정 (tracemalloc 오버헤드 없이), 2회차: 메모리 측정
+    gc.collect()
+    scheduled, finished, _ = asyncio.run(bench(delays))
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    _, _, memory = asyncio.run(bench(delays))
+    tracemalloc.stop()
+    return scheduled, finished, memory - base
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--timers", type=int, default=1_000_000)
+    parser.add_argument(
+        "--skip-task",
+        action="store_true",
+        help="task 방식 생략 (타이머 수가 많으면 오래 걸림)",
+    )
+    args = parser.parse_args()
+
+    delays = _delays(args.timers)
+    benches = [("call_later", _bench_call_later), ("wheel", _bench_wheel)]
+    if not args.skip_task:
+        benches.insert(0, ("task", _bench_task))
+
+    print(f"timers={args.timers:,} (delay 1s ~ {_MAX_DELAY // 3600}h, half cancelled)")
+    print(f"{'method':<11} {'schedule(s)':>12} {'cancel+expire(s)':>17} {'bytes/timer':>12}")
+    for name, bench in benches:
+        scheduled, finished, memory = _run(bench, delays)
+        print(
+            f"{name:<11} {scheduled:>12.2f} {finished:>17.2f} "
+            f"{memory / args.timers:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+대기 WorkItem 메모리 벤치마크 (tracemalloc).
+
+RequestApproval처럼 요청 1건의 모든 step을 적재했을 때,
+대기 건 1개당 몇 바이트를 쓰는지 비교한다.
+
+- legacy : 기존 @dataclass WorkItem + step마다 title/content 사본 + approver별 deque
+- compact: 현재 WorkItem(__slots__, requestId별 payload 공유) + ApprovalQueue(중복 제거 인덱스 포함)
+
+실행 (approval-processing-service 디렉터리에서):
+    python -m benchmarks.bench_workitem_memory --items 1000000 --steps 5 --content-bytes 256
+"""
+import argparse
+import gc
+import tracemalloc
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Callable
+
+from app.core.queue import ApprovalQueue, WorkItem, payload_store
+
+
+@dataclass
+class LegacyWorkItem:
+    request_id: int
+    step: int
+    requester_id: int
+    approver_id: int
+    title: str
+    content: str
+    status: str = "pending"
+
+
+def _copy(text: str) -> str:
+    # 메시지/프로토버프에서 꺼낼 때마다 새 str 객체가 만들어지는 상황을 흉내
+    return (text + ".")[:-1]
+
+
+def _fill_legacy(items: int, steps: int, approvers: int, title: str, content: str) -> object:
+    queues = defaultdict(deque)
+    for n in range(items):
+        request_id, step = divmod(n, steps)
+        approver_id = 2 + (request_id * steps + step) % approvers
+        queues[approver_id].append(
+            LegacyWorkItem(
+                request_id=request_id,
+                step=step + 1,
+                requester_id=1,
+                approver_id=approver_id,
+                title=_copy(title),
+                content=_copy(content),
+            )
+        )
+    return queues
+
+
+def _fill_compact(items: int, steps: int, approvers: int, title: str, content: str) -> object:
+    queue = ApprovalQueue()
+    for n in range(items):
+        request_id, step = divmod(n, steps)
+        approver_id = 2 + (request_id * steps + step) % approvers
+        queue.enqueue(
+            WorkItem(
+                request_id=request_id,
+                step=step + 1,
+                requester_id=1,
+                approver_id=approver_id,
+                title=_copy(title),
+                content=_copy(content),
+            )
+        )
+    return queue
+
+
+def _measure(fill: Callable[..., object], *args) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    store = fill(*args)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    gc.collect()
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--steps", type=int, default=5, help="요청당 결재 단계 수")
+    parser.add_argument("--approvers", type=int, default=5_000)
+    parser.add_argument("--content-bytes", type=int, default=256)
+    args = parser.parse_args()
+
+    title = "출장비 정산 결재 요청"
+    content = ("가" * args.content_bytes)[: args.content_bytes]
+    fill_args = (args.items, args.steps, args.approvers, title, content)
+
+    print(
+        f"items={args.items:,}, steps/request={args.steps}, "
+        f"approvers={args.approvers:,}, content={args.content_bytes} chars"
+    )
+    print(f"{'layout':<10} {'total(MB)':>10} {'bytes/item':>11}")
+    for name, fill in (("legacy", _fill_legacy), ("compact", _fill_compact)):
+        used = _measure(fill, *fill_args)
+        print(f"{name:<10} {used / 1024 / 1024:>10.1f} {used / args.items:>11.1f}")
+
+    assert len(payload_store) == 0, "payload store should be empty once items are released"
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,34 @@
+import logging
 import os
 from datetime import datetime, date
-from typing import List
-from pymongo import ReturnDocument
+from typing import Dict, List, Tuple
+from pymongo import ReplaceOne, ReturnDocument
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, status
 from fastapi.encoders import jsonable_encoder
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from app.core.db import get_approvals_collection
-from app.core.rabbitmq import publish_approval
+from app.core.rabbitmq import publish_approval, publish_notification, publish_withdrawn
+from app.core.sharding import current_approver_id
 from app.schemas.approval import (
     ApprovalCreate,
     ApprovalDocument,
+    ApprovalResultBatch,
+    ApprovalResultBatchOut,
+    ApprovalResultItemOut,
     ApprovalResultUpdate,
+    ApprovalWithdraw,
     StepMessage,
     ApprovalWorkMessage,
 )
+from app.schemas.message import (
+    ApprovalWithdrawnMessage,
+    NotificationEntry,
+    NotificationEnvelope,
+    NotificationMessage,
+)
 
 router = APIRouter(
     prefix="/approvals",
@@ -28,25 +40,40 @@ EMPLOYEE_SERVICE_BASE_URL = os.getenv(
     "http://employee-service:8000",
 )
 
-NOTIFICATION_SERVICE_BASE_URL = os.getenv(
-    "NOTIFICATION_SERVICE_BASE_URL",
-    "http://notification-service:8000",
-)
+logger = logging.getLogger(__name__)
 
 
 async def _send_notification(
-    employee_id: int,
+    app: FastAPI,
+    employee_ids: List[int],
     payload: dict,
 ) -> None:
     """
-    Notification Service에 REST로 알림 전달.
+    같은 알림을 받는 직원들에게 RabbitMQ(notification exchange)로 메시지 1개를 publish.
+    어느 notification-service 레플리카에 접속해 있든 전달된다.
+    결재 문서 topic(request:{requestId})을 구독 중인 세션에도 전달된다.
+    알림 실패로 결재 처리 자체가 실패하지 않도록 예외는 로그만 남긴다.
     """
-    async with httpx.AsyncClient(
-        base_url=NOTIFICATION_SERVICE_BASE_URL,
-        timeout=5.0,
-    ) as client:
-        # 실패해도 서비스 전체가 죽지 않게 try/except로 감싸도 됨
-        await client.post("/notify", json={"employeeId": employee_id, **payload})
+    employee_ids = list(dict.fromkeys(employee_ids))  # 요청자 == 결재자인 경우 1번만
+    try:
+        await publish_notification(
+            app,
+            NotificationEnvelope(
+                entries=[
+                    NotificationEntry(
+                        employeeIds=employee_ids,
+                        topics=[f"request:{payload['requestId']}"],
+                        message=NotificationMessage(**payload),
+                    )
+                ]
+            ),
+        )
+    except Exception:
+        logger.warning(
+            "Failed to publish notification",
+            exc_info=True,
+            extra={"employeeIds": employee_ids, "type": payload.get("type")},
+        )
 
 
 async def _validate_employees(payload: ApprovalCreate) -> None:
@@ -103,6 +130,30 @@ def _serialize_document(raw: dict) -> ApprovalDocument:
     return ApprovalDocument(**data)
 
 
+def _build_work_message(doc: dict) -> ApprovalWorkMessage:
+    """
+    결재 Document -> RabbitMQ로 보낼 ApprovalWorkMessage.
+    LEAVE 타입은 연차 시작일을 deadline으로 넘겨 결재자 대기열에서 우선 처리되게 한다.
+    """
+    leave_info = doc.get("leaveInfo") or {}
+    return ApprovalWorkMessage(
+        requestId=doc["requestId"],
+        requesterId=doc["requesterId"],
+        title=doc["title"],
+        content=doc["content"],
+        steps=[
+            StepMessage(
+                step=s["step"],
+                approverId=s["approverId"],
+                status=s["status"],
+            )
+            for s in doc["steps"]
+        ],
+        requestType=doc.get("requestType") or "GENERAL",
+        deadline=leave_info.get("startDate"),
+    )
+
+
 async def _confirm_leave_if_needed(doc: dict) -> None:
     """
     연차 타입(LEAVE)의 결재가 최종 승인된 경우,
@@ -210,20 +261,7 @@ async def create_approval(
     await collection.insert_one(doc)
 
     # 4. RabbitMQ로 첫 번째 WorkItem 전달
-    work_message = ApprovalWorkMessage(
-        requestId=doc["requestId"],
-        requesterId=doc["requesterId"],
-        title=doc["title"],
-        content=doc["content"],
-        steps=[
-            StepMessage(
-                step=s["step"],
-                approverId=s["approverId"],
-                status=s["status"],
-            )
-            for s in doc["steps"]
-        ],
-    )
+    work_message = _build_work_message(doc)
     await publish_approval(request.app, work_message)
 
     # Response: {"requestId": 1}
@@ -267,31 +305,106 @@ async def get_approval(
 
 
 @router.post(
-    "/internal/result",
-    status_code=status.HTTP_204_NO_CONTENT,
+    "/{request_id}/withdraw",
+    response_model=ApprovalDocument,
 )
-async def update_approval_result(
-    payload: ApprovalResultUpdate,
+async def withdraw_approval(
+    request_id: int,
+    payload: ApprovalWithdraw,
     request: Request,
     collection: AsyncIOMotorCollection = Depends(get_approvals_collection),
 ):
     """
-    Approval Processing Service에서 호출하는 내부용 API.
+    요청자가 결재 요청을 회수.
 
-    1) requestId로 Document 조회
-    2) 해당 step + approverId 매칭되는 step 상태 변경 + updatedAt 갱신
-    3) finalStatus 재계산
-    4) finalStatus가 in_progress이면 다음 step을 위해 RabbitMQ로 메시지 재전송
-    5) requesterId / approverId에게 Notification Service 통해 알림
-    6) LEAVE 타입이면서 최종 approved인 경우 Employee Service에 연차 확정 요청
+    1) finalStatus가 pending / in_progress인 경우에만 원자적으로 withdrawn으로 변경
+       (find_one_and_update 조건부 갱신 → 동시에 들어온 결재 결과와 경합해도 한쪽만 성공)
+    2) approval.withdrawn 이벤트 publish → Processing Service가 대기 WorkItem 제거
+    3) 현재 결재자에게 알림
     """
-    doc = await collection.find_one({"requestId": payload.requestId})
-    if not doc:
+    now = datetime.utcnow()
+    doc = await collection.find_one_and_update(
+        {
+            "requestId": request_id,
+            "requesterId": payload.requesterId,
+            "finalStatus": {"$in": list(WITHDRAWABLE_STATUSES)},
+        },
+        {
+            "$set": {
+                "finalStatus": WITHDRAWN_STATUS,
+                "withdrawnAt": now,
+                "withdrawReason": payload.reason,
+                "updatedAt": now,
+            }
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+
+    if doc is None:
+        # 조건에 맞지 않은 이유 구분
+        existing = await collection.find_one({"requestId": request_id})
+        if not existing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Approval request not found",
+            )
+        if existing["requesterId"] != payload.requesterId:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the requester can withdraw this approval request",
+            )
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Approval request not found",
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Approval request is already {existing['finalStatus']}",
         )
 
+    await publish_withdrawn(
+        request.app,
+        ApprovalWithdrawnMessage(
+            requestId=doc["requestId"],
+            requesterId=doc["requesterId"],
+            withdrawnAt=now,
+        ),
+    )
+
+    # 현재 결재자 + request topic 구독자에게 알림
+    approver_id = current_approver_id(doc["steps"])
+    await _send_notification(
+        request.app,
+        [approver_id] if approver_id is not None else [],
+        {
+            "type": "approval_withdrawn",
+            "requestId": doc["requestId"],
+            "requesterId": doc["requesterId"],
+            "title": doc["title"],
+        },
+    )
+
+    return _serialize_document(doc)
+
+
+class _StepNotFound(Exception):
+    pass
+
+
+class _Withdrawn(Exception):
+    pass
+
+
+# 더 이상 결과를 반영하지 않는 상태
+WITHDRAWN_STATUS = "withdrawn"
+# 회수 가능한 상태 (최종 결과가 나오기 전)
+WITHDRAWABLE_STATUSES = ("pending", "in_progress")
+
+
+def _apply_result(doc: dict, payload: ApprovalResultUpdate) -> str:
+    """
+    Document(dict)에 결재 결과 1건을 반영하고 재계산한 finalStatus 반환. (DB 저장 X)
+    매칭되는 step이 없으면 _StepNotFound, 이미 회수된 요청이면 _Withdrawn.
+    """
+    if doc.get("finalStatus") == WITHDRAWN_STATUS:
+        raise _Withdrawn()
+
     steps = doc.get("steps", [])
     target_step = None
     for step in steps:
@@ -303,10 +416,7 @@ async def update_approval_result(
             break
 
     if target_step is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Matching approval step not found",
-        )
+        raise _StepNotFound()
 
     # step 상태/시간 갱신
     target_step["status"] = payload.status
@@ -326,26 +436,22 @@ async def update_approval_result(
     doc["steps"] = steps
     doc["finalStatus"] = final_status
     doc["updatedAt"] = datetime.utcnow()
+    return final_status
 
-    await collection.replace_one({"_id": doc["_id"]}, doc)
 
+async def _after_result(
+    app: FastAPI,
+    doc: dict,
+    payload: ApprovalResultUpdate,
+    final_status: str,
+) -> None:
+    """
+    결과 저장 이후 후속 처리: 다음 step publish, 연차 확정, 알림.
+    """
     # 다음 step이 남아 있는 경우(= in_progress) → RabbitMQ로 다음 WorkItem 전달
     if final_status == "in_progress":
-        work_message = ApprovalWorkMessage(
-            requestId=doc["requestId"],
-            requesterId=doc["requesterId"],
-            title=doc["title"],
-            content=doc["content"],
-            steps=[
-                StepMessage(
-                    step=s["step"],
-                    approverId=s["approverId"],
-                    status=s["status"],
-                )
-                for s in doc["steps"]
-            ],
-        )
-        await publish_approval(request.app, work_message)
+        work_message = _build_work_message(doc)
+        await publish_approval(app, work_message)
 
     # 최종 approved + LEAVE 타입이면 Employee Service에 연차 확정 요청
     if final_status == "approved":
@@ -362,9 +468,198 @@ async def update_approval_result(
         "title": doc["title"],
     }
 
-    # 요청자에게 알림
-    await _send_notification(doc["requesterId"], notify_payload)
-    # 해당 결재자에게도 알림
-    await _send_notification(payload.approverId, notify_payload)
+    await _send_notification(app, [doc["requesterId"], payload.approverId], notify_payload)
+
+
+async def record_result(
+    app: FastAPI,
+    collection: AsyncIOMotorCollection,
+    payload: ApprovalResultUpdate,
+) -> str:
+    """
+    결재 결과 1건 반영 (REST /internal/result, gRPC ReportResult 공통).
+    반영할 수 없으면 HTTPException (404 / 400 / 409).
+
+    1) requestId로 Document 조회
+    2) 해당 step + approverId 매칭되는 step 상태 변경 + updatedAt 갱신
+    3) finalStatus 재계산
+    4) finalStatus가 in_progress이면 다음 step을 위해 RabbitMQ로 메시지 재전송
+    5) requesterId / approverId에게 Notification Service 통해 알림
+    6) LEAVE 타입이면서 최종 approved인 경우 Employee Service에 연차 확정 요청
+    """
+    doc = await collection.find_one({"requestId": payload.requestId})
+    if not doc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Approval request not found",
+        )
+
+    try:
+        final_status = _apply_result(doc, payload)
+    except _StepNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Matching approval step not found",
+        )
+    except _Withdrawn:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Approval request has been withdrawn",
+        )
+
+    # 조회 이후에 회수됐으면 덮어쓰지 않는다
+    result = await collection.replace_one(
+        {"_id": doc["_id"], "finalStatus": {"$ne": WITHDRAWN_STATUS}},
+        doc,
+    )
+    if result.matched_count == 0:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Approval request has been withdrawn",
+        )
+
+    await _after_result(app, doc, payload, final_status)
+    return final_status
+
+
+async def record_results(
+    app: FastAPI,
+    collection: AsyncIOMotorCollection,
+    results: List[ApprovalResultUpdate],
+) -> List[ApprovalResultItemOut]:
+    """
+    결재 결과 여러 건 반영 (REST /internal/results, gRPC ReportResults 공통).
+
+    1) 관련 Document를 한 번의 find($in)로 조회
+    2) 결과를 메모리에서 순서대로 반영 (record_result와 같은 규칙)
+    3) 변경된 Document를 bulk_write 한 번으로 저장
+    4) 건별 후속 처리 (다음 step publish, 연차 확정, 알림). 실패해도 다른 건은 계속 처리하고
+       해당 건의 detail에 남긴다 (applied=True: 결과는 저장됨, 재전송할 필요 없음)
+    결과는 건별로 applied 여부를 돌려준다.
+    """
+    request_ids = {r.requestId for r in results}
+    docs: Dict[int, dict] = {
+        doc["requestId"]: doc
+        async for doc in collection.find({"requestId": {"$in": list(request_ids)}})
+    }
+
+    outcomes: List[ApprovalResultItemOut] = []
+    applied: List[Tuple[int, dict, ApprovalResultUpdate, str]] = []  # (outcomes 위치, ...)
+    for payload in results:
+        doc = docs.get(payload.requestId)
+        if doc is None:
+            outcomes.append(
+                ApprovalResultItemOut(
+                    **payload.model_dump(include={"requestId", "step", "approverId"}),
+                    applied=False,
+                    detail="Approval request not found",
+                )
+            )
+            continue
+
+        try:
+            final_status = _apply_result(doc, payload)
+        except (_StepNotFound, _Withdrawn) as exc:
+            outcomes.append(
+                ApprovalResultItemOut(
+                    **payload.model_dump(include={"requestId", "step", "approverId"}),
+                    applied=False,
+                    detail=(
+                        "Approval request has been withdrawn"
+                        if isinstance(exc, _Withdrawn)
+                        else "Matching approval step not found"
+                    ),
+                )
+            )
+            continue
+
+        applied.append((len(outcomes), doc, payload, final_status))
+        outcomes.append(
+            ApprovalResultItemOut(
+                **payload.model_dump(include={"requestId", "step", "approverId"}),
+                applied=True,
+                finalStatus=final_status,
+            )
+        )
+
+    # 같은 Document에 여러 건이 반영돼도 최종 상태로 한 번만 저장
+    changed = {id(doc): doc for _, doc, _, _ in applied}
+    withdrawn_ids = set()
+    if changed:
+        write = await collection.bulk_write(
+            [
+                # 조회 이후에 회수된 Document는 덮어쓰지 않는다
+                ReplaceOne({"_id": doc["_id"], "finalStatus": {"$ne": WITHDRAWN_STATUS}}, doc)
+                for doc in changed.values()
+            ],
+            ordered=False,
+        )
+        if write.matched_count < len(changed):
+            # 필터에 걸려 저장되지 않은 Document = 조회와 bulk_write 사이에 회수된 요청
+            # (저장 직후 회수된 요청도 여기 잡히지만, 회수된 요청이라 후속 처리를 건너뛰는 게 맞다)
+            withdrawn_ids = {
+                d["_id"]
+                async for d in collection.find(
+                    {
+                        "_id": {"$in": [doc["_id"] for doc in changed.values()]},
+                        "finalStatus": WITHDRAWN_STATUS,
+                    },
+                    {"_id": 1},
+                )
+            }
+
+    for index, doc, payload, final_status in applied:
+        if doc["_id"] in withdrawn_ids:
+            outcomes[index] = ApprovalResultItemOut(
+                **payload.model_dump(include={"requestId", "step", "approverId"}),
+                applied=False,
+                detail="Approval request has been withdrawn",
+            )
+            continue
+        # 결과는 이미 저장됐으므로 한 건의 후속 처리 실패로 배치 전체를 500으로 만들지 않는다
+        # (호출 측이 배치를 재시도하면 성공한 건의 다음 step / 알림이 중복 발행된다)
+        try:
+            await _after_result(app, doc, payload, final_status)
+        except Exception as exc:
+            logger.exception(
+                "follow-up after approval result failed",
+                extra={"requestId": payload.requestId, "step": payload.step},
+            )
+            outcomes[index].detail = f"Result saved but follow-up failed: {type(exc).__name__}"
+
+    return outcomes
+
+
+@router.post(
+    "/internal/result",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def update_approval_result(
+    payload: ApprovalResultUpdate,
+    request: Request,
+    collection: AsyncIOMotorCollection = Depends(get_approvals_collection),
+):
+    """
+    Approval Processing Service에서 호출하는 내부용 API.
+    (RESULT_CALLBACK_TRANSPORT=rest일 때 사용, 기본은 gRPC ReportResult)
+    """
+    await record_result(request.app, collection, payload)
 
     # 204 No Content
+
+
+@router.post(
+    "/internal/results",
+    response_model=ApprovalResultBatchOut,
+)
+async def update_approval_results(
+    batch: ApprovalResultBatch,
+    request: Request,
+    collection: AsyncIOMotorCollection = Depends(get_approvals_collection),
+):
+    """
+    Approval Processing Service의 일괄 결재(bulk)에서 호출하는 내부용 API.
+    건별 applied 여부를 돌려준다 (일부 실패해도 200).
+    """
+    outcomes = await record_results(request.app, collection, batch.results)
+    return ApprovalResultBatchOut(results=outcomes)
@@ -1,9 +1,12 @@
 import logging
 import os
-from typing import Any, Dict
+from collections import defaultdict
+from typing import Any, Dict, List
 
 import grpc
 
+from app.core.rabbitmq import APPROVAL_SHARD_COUNT
+from app.core.sharding import shard_for_approver
 from app.grpc_stubs import approval_pb2, approval_pb2_grpc
 
 logger = logging.getLogger(__name__)
@@ -13,40 +16,57 @@ APPROVAL_PROCESSING_GRPC_TARGET = os.getenv(
     "approval-processing-service:50051",
 )
 
+# 샤딩 모드에서 샤드별 gRPC 대상 (StatefulSet + headless Service 기준)
+APPROVAL_PROCESSING_GRPC_TARGET_TEMPLATE = os.getenv(
+    "APPROVAL_PROCESSING_GRPC_TARGET_TEMPLATE",
+    "approval-processing-service-{shard}.approval-processing-service-shards:50051",
+)
+
+
+def _grpc_target_for_shard(shard: int) -> str:
+    if APPROVAL_SHARD_COUNT <= 1:
+        return APPROVAL_PROCESSING_GRPC_TARGET
+    return APPROVAL_PROCESSING_GRPC_TARGET_TEMPLATE.format(shard=shard)
+
 
 async def send_approval_request(doc: Dict[str, Any]) -> None:
     """
     MongoDB에 저장된 approval document를 기반으로
     Approval Processing Service에 gRPC RequestApproval를 호출하는 함수.
     """
-    steps = [
-        approval_pb2.Step(
-            step=step["step"],
-            approverId=step["approverId"],
-            status=step["status"],
+    # approverId의 소유 샤드별로 step을 묶어서 해당 샤드에만 전달
+    steps_by_shard: Dict[int, List[approval_pb2.Step]] = defaultdict(list)
+    for step in doc["steps"]:
+        shard = shard_for_approver(step["approverId"], APPROVAL_SHARD_COUNT)
+        steps_by_shard[shard].append(
+            approval_pb2.Step(
+                step=step["step"],
+                approverId=step["approverId"],
+                status=step["status"],
+            )
         )
-        for step in doc["steps"]
-    ]
-
-    request = approval_pb2.ApprovalRequest(
-        requestId=doc["requestId"],
-        requesterId=doc["requesterId"],
-        title=doc["title"],
-        content=doc["content"],
-        steps=steps,
-    )
-
-    logger.info(
-        "Sending RequestApproval via gRPC: target=%s, requestId=%s",
-        APPROVAL_PROCESSING_GRPC_TARGET,
-        doc["requestId"],
-    )
-
-    async with grpc.aio.insecure_channel(APPROVAL_PROCESSING_GRPC_TARGET) as channel:
-        stub = approval_pb2_grpc.ApprovalStub(channel)
-        response = await stub.RequestApproval(request)
+
+    for shard, steps in steps_by_shard.items():
+        target = _grpc_target_for_shard(shard)
+        request = approval_pb2.ApprovalRequest(
+            requestId=doc["requestId"],
+            requesterId=doc["requesterId"],
+            title=doc["title"],
+            content=doc["content"],
+            steps=steps,
+        )
+
         logger.info(
-            "Received Response from RequestApproval: requestId=%s, message=%s",
-            response.requestId,
-            response.message,
+            "Sending RequestApproval via gRPC: target=%s, requestId=%s",
+            target,
+            doc["requestId"],
         )
+
+        async with grpc.aio.insecure_channel(target) as channel:
+            stub = approval_pb2_grpc.ApprovalStub(channel)
+            response = await stub.RequestApproval(request)
+            logger.info(
+                "Received Response from RequestApproval: requestId=%s, message=%s",
+                response.requestId,
+                response.message,
+            )
@@ -0,0 +1,37 @@
+from typing import Iterable, Mapping, Optional
+
+# approverId 기반 샤딩에 사용하는 해시 함수.
+# approval-processing-service의 app/core/sharding.py와 반드시 동일해야 한다.
+
+
+def jump_consistent_hash(key: int, num_buckets: int) -> int:
+    """
+    Jump Consistent Hash (Lamping & Veach).
+    - 버킷(샤드) 수가 N -> N+1로 늘어날 때 약 1/(N+1)의 key만 이동한다.
+    - 별도의 링/테이블 없이 O(log N)으로 계산된다.
+    """
+    if num_buckets <= 1:
+        return 0
+
+    key &= 0xFFFFFFFFFFFFFFFF
+    b, j = -1, 0
+    while j < num_buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return b
+
+
+def shard_for_approver(approver_id: int, shard_count: int) -> int:
+    return jump_consistent_hash(int(approver_id), shard_count)
+
+
+def current_approver_id(steps: Iterable[Mapping]) -> Optional[int]:
+    """
+    pending 상태인 step 중 step 번호가 가장 작은 step의 approverId.
+    (Approval Processing Service가 WorkItem을 만드는 기준과 동일)
+    """
+    pending = [s for s in steps if s.get("status") == "pending"]
+    if not pending:
+        return None
+    return min(pending, key=lambda s: s["step"])["approverId"]
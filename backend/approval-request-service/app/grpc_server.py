@@ -0,0 +1,115 @@
+import logging
+import os
+from typing import AsyncIterator, Optional
+
+import grpc
+from fastapi import FastAPI, HTTPException, status
+from pydantic import ValidationError
+
+from app.api.approvals import record_result, record_results
+from app.core.db import get_collection
+from app.grpc_stubs import approval_pb2, approval_pb2_grpc
+from app.schemas.approval import ApprovalResultUpdate
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_REQUEST_GRPC_PORT = int(os.getenv("APPROVAL_REQUEST_GRPC_PORT", "50052"))
+
+# record_result의 HTTPException → gRPC status code
+_STATUS_CODES = {
+    status.HTTP_400_BAD_REQUEST: grpc.StatusCode.INVALID_ARGUMENT,
+    status.HTTP_404_NOT_FOUND: grpc.StatusCode.NOT_FOUND,
+    status.HTTP_409_CONFLICT: grpc.StatusCode.FAILED_PRECONDITION,
+}
+
+
+def _to_update(message: approval_pb2.ApprovalResultRequest) -> ApprovalResultUpdate:
+    return ApprovalResultUpdate(
+        requestId=message.requestId,
+        step=message.step,
+        approverId=message.approverId,
+        status=message.status,
+    )
+
+
+class ApprovalResultService(approval_pb2_grpc.ApprovalResultServicer):
+    """
+    Approval Processing Service가 결재 결과를 보고하는 gRPC 서버.
+    REST /approvals/internal/result(s)와 같은 로직(record_result / record_results)을 사용한다.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self._app = app
+
+    async def ReportResult(
+        self,
+        request: approval_pb2.ApprovalResultRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> approval_pb2.ApprovalResultReply:
+        try:
+            payload = _to_update(request)
+        except ValidationError as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
+        try:
+            final_status = await record_result(self._app, get_collection(), payload)
+        except HTTPException as exc:
+            await context.abort(
+                _STATUS_CODES.get(exc.status_code, grpc.StatusCode.INTERNAL),
+                str(exc.detail),
+            )
+
+        return approval_pb2.ApprovalResultReply(
+            requestId=payload.requestId,
+            step=payload.step,
+            approverId=payload.approverId,
+            applied=True,
+            finalStatus=final_status,
+        )
+
+    async def ReportResults(
+        self,
+        request_iterator: AsyncIterator[approval_pb2.ApprovalResultRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> approval_pb2.ApprovalResultBatchReply:
+        updates = []
+        async for message in request_iterator:
+            try:
+                updates.append(_to_update(message))
+            except ValidationError as exc:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
+        if not updates:
+            return approval_pb2.ApprovalResultBatchReply()
+
+        outcomes = await record_results(self._app, get_collection(), updates)
+        logger.info("ReportResults applied", extra={"results": len(outcomes)})
+        return approval_pb2.ApprovalResultBatchReply(
+            results=[
+                approval_pb2.ApprovalResultReply(
+                    requestId=o.requestId,
+                    step=o.step,
+                    approverId=o.approverId,
+                    applied=o.applied,
+                    finalStatus=o.finalStatus or "",
+                    detail=o.detail or "",
+                )
+                for o in outcomes
+            ]
+        )
+
+
+async def start_grpc_server(app: FastAPI) -> None:
+    server = grpc.aio.server()
+    approval_pb2_grpc.add_ApprovalResultServicer_to_server(ApprovalResultService(app), server)
+    server.add_insecure_port(f"[::]:{APPROVAL_REQUEST_GRPC_PORT}")
+    await server.start()
+    app.state.grpc_server = server
+    logger.info("gRPC ApprovalResult server started on port %s", APPROVAL_REQUEST_GRPC_PORT)
+
+
+async def stop_grpc_server(app: FastAPI, grace: Optional[float] = 5.0) -> None:
+    server = getattr(app.state, "grpc_server", None)
+    if server:
+        # 처리 중인 RPC는 grace 초 동안 마무리
+        await server.stop(grace)
@@ -1,7 +1,11 @@
 from fastapi import FastAPI
 
 from app.api.approvals import router as approvals_router
+from app.core.log import setup_logging, shutdown_logging
 from app.core.rabbitmq import init_rabbitmq, close_rabbitmq
+from app.grpc_server import start_grpc_server, stop_grpc_server
+
+setup_logging("approval-request-service")
 
 app = FastAPI(
     title="Approval Request Service",
@@ -32,11 +36,15 @@ async def on_startup():
     # await init_db()
     # 2) RabbitMQ 연결
     await init_rabbitmq(app)
+    # 3) 결재 결과 보고용 gRPC 서버 (Approval Processing Service → 이 서비스)
+    await start_grpc_server(app)
 
 
 @app.on_event("shutdown")
 async def on_shutdown():
+    await stop_grpc_server(app)
     await close_rabbitmq(app)
+    shutdown_logging()
 
 
 app.include_router(approvals_router)
@@ -76,6 +76,18 @@ class ApprovalDocument(BaseModel):
     requestType: Literal["GENERAL", "LEAVE"] = "GENERAL"
     leaveInfo: Optional[LeaveInfo] = None
 
+    # 요청자가 회수한 경우 (finalStatus = "withdrawn")
+    withdrawnAt: Optional[datetime] = None
+    withdrawReason: Optional[str] = None
+
+
+class ApprovalWithdraw(BaseModel):
+    """
+    POST /approvals/{request_id}/withdraw 요청 바디
+    """
+    requesterId: int = Field(..., ge=1)
+    reason: Optional[str] = None
+
 
 class ApprovalResultUpdate(BaseModel):
     requestId: int
@@ -84,6 +96,26 @@ class ApprovalResultUpdate(BaseModel):
     status: Literal["approved", "rejected"]
 
 
+class ApprovalResultBatch(BaseModel):
+    """
+    POST /approvals/internal/results 요청 바디 (일괄 결재 결과)
+    """
+    results: List[ApprovalResultUpdate] = Field(..., min_length=1, max_length=1000)
+
+
+class ApprovalResultItemOut(BaseModel):
+    requestId: int
+    step: int
+    approverId: int
+    applied: bool
+    finalStatus: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class ApprovalResultBatchOut(BaseModel):
+    results: List[ApprovalResultItemOut]
+
+
 class StepMessage(BaseModel):
     step: int
     approverId: int
@@ -96,3 +128,6 @@ class ApprovalWorkMessage(BaseModel):
     title: str
     content: str
     steps: List[StepMessage]
+    # 결재자 대기열 우선순위 계산용 (processing service)
+    requestType: str = "GENERAL"
+    deadline: Optional[date] = None
@@ -1,6 +1,9 @@
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.event_id import next_event_id
 
 
 class StepMessage(BaseModel):
@@ -15,3 +18,43 @@ class ApprovalWorkMessage(BaseModel):
     title: str
     content: str
     steps: List[StepMessage]
+    # 결재자 대기열 우선순위 계산용 (processing service)
+    requestType: str = "GENERAL"
+    deadline: Optional[date] = None
+
+
+class ApprovalWithdrawnMessage(BaseModel):
+    """결재 회수 이벤트 (approval.withdrawn). processing service가 대기 WorkItem을 제거한다."""
+    requestId: int
+    requesterId: int
+    withdrawnAt: datetime
+
+
+class NotificationMessage(BaseModel):
+    """
+    알림 본문. type별 필드(requestId, finalStatus 등)는 그대로 전달.
+    eventId는 시간순으로 증가하므로 클라이언트가 재접속할 때 lastEventId로 놓친 알림을 받을 수 있다.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    eventId: str = Field(default_factory=lambda: str(next_event_id()))
+    type: str
+
+
+class NotificationEntry(BaseModel):
+    """
+    같은 알림을 받는 직원 목록 + 본문 (본문은 notification-service에서 1회만 직렬화).
+    본문에는 employeeId를 넣지 않는다. 직원에게 전달할 때 notification-service가 받는 직원의 id를 붙인다.
+    topics(request:{id} 등)를 구독 중인 세션(대시보드)에도 같은 알림이 전달된다.
+    """
+    employeeIds: List[int]
+    topics: List[str] = []
+    message: NotificationMessage
+
+
+class NotificationEnvelope(BaseModel):
+    """
+    알림 이벤트 (notification fanout exchange).
+    notification-service 레플리카 모두가 받아서 자기에게 연결된 employeeIds 세션에만 전달한다.
+    """
+    entries: List[NotificationEntry]
@@ -2,12 +2,13 @@ from datetime import datetime, date
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, and_
+from sqlalchemy import and_, func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.db import MYSQL_DUPLICATE_ENTRY, MYSQL_NO_REFERENCED_ROW, mysql_error_code
 from app.core.deps import get_db
 from app.models.attendance import AttendanceRecord
-from app.models.employee import Employee as EmployeeModel
 from app.schemas.attendance import AttendanceCheckIn, AttendanceCheckOut, AttendanceRecordRead
 
 router = APIRouter(
@@ -26,51 +27,44 @@ async def check_in(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    출근 처리:
-    - 오늘(attendance_date 기준)에 이미 check_out 되지 않은 레코드가 있으면 400
-    - 없으면 새 attendance_records 레코드 생성
+    출근 처리: INSERT 한 번.
+    - 없는 직원이면 FK(fk_attendance_employee) 위반 → 400 "Employee not found"
+    - 오늘 check_out 되지 않은 레코드가 이미 있으면
+      UNIQUE(employee_id, open_date) 위반 → 400 "Already checked in today"
+    동시에 두 번 출근해도 DB 제약이 한 건만 통과시킨다.
     """
-    now = datetime.utcnow()
+    # DATETIME 컬럼은 초 단위까지 저장하므로 응답도 같은 값으로 (refresh 없이 돌려줌)
+    now = datetime.utcnow().replace(microsecond=0)
     today = now.date()
 
-    # 먼저 직원이 존재하는지 확인
-    emp_stmt = select(EmployeeModel).where(EmployeeModel.id == payload.employee_id)
-    emp_res = await db.execute(emp_stmt)
-    emp_obj = emp_res.scalar_one_or_none()
-    if emp_obj is None:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Employee not found")
-
-    stmt = (
-        select(AttendanceRecord)
-        .where(
-            and_(
-                AttendanceRecord.employee_id == payload.employee_id,
-                AttendanceRecord.attendance_date == today,
-                AttendanceRecord.check_out.is_(None),
-            )
-        )
+    stmt = insert(AttendanceRecord).values(
+        employee_id=payload.employee_id,
+        attendance_date=today,
+        check_in=now,
     )
-    result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Already checked in today",
-        )
+    try:
+        result = await db.execute(stmt)
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        code = mysql_error_code(exc)
+        if code == MYSQL_NO_REFERENCED_ROW:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Employee not found")
+        if code == MYSQL_DUPLICATE_ENTRY:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Already checked in today",
+            )
+        raise
 
-    record = AttendanceRecord(
+    return AttendanceRecordRead(
+        id=result.inserted_primary_key[0],
         employee_id=payload.employee_id,
         attendance_date=today,
         check_in=now,
         check_out=None,
         work_minutes=None,
     )
-    db.add(record)
-    await db.commit()
-    await db.refresh(record)
-
-    return AttendanceRecordRead.model_validate(record)
 
 
 @router.post(
@@ -82,38 +76,44 @@ async def check_out(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    퇴근 처리:
-    - 오늘 출근 기록 중 check_out이 아직 없는 레코드를 찾아서
-      check_out 시간 세팅 + work_minutes 계산
+    퇴근 처리: UPDATE ... WHERE check_out IS NULL 한 번으로
+    check_out 시간 세팅 + work_minutes를 SQL(TIMESTAMPDIFF)로 계산.
+    바뀐 행이 없으면 오늘 출근 기록이 없는 것 → 400.
+    MySQL엔 UPDATE ... RETURNING이 없어 응답은 같은 트랜잭션에서 방금 잠근 행을 다시 읽어 만든다.
     """
-    now = datetime.utcnow()
+    now = datetime.utcnow().replace(microsecond=0)
     today = now.date()
 
+    open_record = and_(
+        AttendanceRecord.employee_id == payload.employee_id,
+        AttendanceRecord.attendance_date == today,
+    )
     stmt = (
-        select(AttendanceRecord)
-        .where(
-            and_(
-                AttendanceRecord.employee_id == payload.employee_id,
-                AttendanceRecord.attendance_date == today,
-                AttendanceRecord.check_out.is_(None),
-            )
+        update(AttendanceRecord)
+        .where(open_record, AttendanceRecord.check_out.is_(None))
+        .values(
+            check_out=now,
+            work_minutes=func.timestampdiff(text("MINUTE"), AttendanceRecord.check_in, now),
         )
+        .execution_options(synchronize_session=False)
     )
     result = await db.execute(stmt)
-    record = result.scalar_one_or_none()
 
-    if record is None:
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No active attendance record for today",
         )
 
-    record.check_out = now
-    delta = now - record.check_in
-    record.work_minutes = int(delta.total_seconds() // 60)
-
+    closed = await db.execute(
+        select(AttendanceRecord)
+        .where(open_record, AttendanceRecord.check_out == now)
+        .order_by(AttendanceRecord.id.desc())
+        .limit(1)
+    )
+    record = closed.scalar_one()
     await db.commit()
-    await db.refresh(record)
 
     return AttendanceRecordRead.model_validate(record)
 
@@ -0,0 +1,407 @@
+import csv
+import json
+from datetime import datetime, timezone, tzinfo
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import and_, exists, func, insert, select, text, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import MYSQL_DUPLICATE_ENTRY, MYSQL_NO_REFERENCED_ROW, mysql_error_code
+from app.core.deps import get_db
+from app.models.attendance import AttendanceRecord
+from app.models.employee import Employee as EmployeeModel
+from app.schemas.attendance import AttendanceBulkLineError, AttendanceBulkResult
+
+router = APIRouter(
+    prefix="/attendance",
+    tags=["attendance"],
+)
+
+_NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/json-lines"}
+_CSV_TYPES = {"text/csv", "application/csv"}
+_FIELDS = ("employee_id", "timestamp", "type")
+_KINDS = {"in", "out"}
+# migrations 0005: 같은 직원 + 출근 시각 = 이미 등록된 기록
+_CHECK_IN_KEY = "uq_attendance_records_employee_id_check_in"
+
+
+class _Punch(NamedTuple):
+    line: int
+    employee_id: int
+    at: datetime
+    kind: str  # "in" / "out"
+
+
+class _HeaderError(ValueError):
+    """CSV 헤더가 잘못됨: 그 줄에 에러를 남기고 나머지 본문은 처리하지 않는다."""
+
+
+def _punch(line: int, employee_id, timestamp, kind, tz: tzinfo) -> _Punch:
+    try:
+        employee_id = int(employee_id)
+    except (TypeError, ValueError):
+        raise ValueError("employee_id must be an integer")
+    try:
+        at = datetime.fromisoformat(str(timestamp))
+    except ValueError:
+        raise ValueError("timestamp must be ISO 8601")
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=tz)  # 오프셋 없는 시각은 ?tz= 시간대 (기본 UTC)
+    # check-in API와 같이 UTC naive로 저장
+    at = at.astimezone(timezone.utc).replace(tzinfo=None)
+    kind = str(kind).strip().lower()
+    if kind not in _KINDS:
+        raise ValueError("type must be 'in' or 'out'")
+    return _Punch(line, employee_id, at.replace(microsecond=0), kind)
+
+
+def _ndjson_parser(tz: tzinfo) -> Callable[[int, str], Optional[_Punch]]:
+    def parse(line: int, text_line: str) -> Optional[_Punch]:
+        try:
+            obj = json.loads(text_line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON: {exc.msg}")
+        if not isinstance(obj, dict):
+            raise ValueError("expected a JSON object")
+        missing = [f for f in _FIELDS if f not in obj]
+        if missing:
+            raise ValueError(f"missing field(s): {', '.join(missing)}")
+        return _punch(line, obj["employee_id"], obj["timestamp"], obj["type"], tz)
+
+    return parse
+
+
+def _csv_parser(tz: tzinfo) -> Callable[[int, str], Optional[_Punch]]:
+    """첫 줄은 헤더 (employee_id,timestamp,type, 순서 무관). 따옴표 안 줄바꿈은 지원하지 않음."""
+    columns: Dict[str, int] = {}
+
+    def parse(line: int, text_line: str) -> Optional[_Punch]:
+        row = next(csv.reader([text_line]))
+        if not columns:
+            header = [c.strip().lower() for c in row]
+            missing = [f for f in _FIELDS if f not in header]
+            if missing:
+                raise _HeaderError(f"CSV header missing column(s): {', '.join(missing)}")
+            columns.update({f: header.index(f) for f in _FIELDS})
+            return None
+        if len(row) <= max(columns.values()):
+            raise ValueError(f"expected at least {max(columns.values()) + 1} columns")
+        return _punch(line, *(row[columns[f]].strip() for f in _FIELDS), tz)
+
+    return parse
+
+
+async def _lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    본문을 받는 대로 줄 단위로 내보낸다. 버퍼에는 마지막 미완성 줄만 남는다.
+    max_line_bytes보다 긴 줄은 내용 대신 None (버퍼에 쌓지 않고 다음 줄바꿈까지 버림).
+    """
+    buffer = b""
+    skipping = False  # 지금 줄이 이미 너무 길어 버리는 중
+    number = 0
+    async for chunk in chunks:
+        *complete, buffer = (buffer + chunk).split(b"\n")
+        for raw in complete:
+            number += 1
+            yield number, None if skipping or len(raw) > max_line_bytes else raw
+            skipping = False
+        if skipping or len(buffer) > max_line_bytes:
+            skipping, buffer = True, b""
+    if skipping:
+        yield number + 1, None
+    elif buffer:
+        yield number + 1, buffer
+
+
+class _BulkIngest:
+    """
+    출입 기록을 직원별로 in → out 짝지어 attendance_records 행으로 만들고, chunk_size건마다 한 번에 INSERT.
+
+    - in 다음 out: check_out / work_minutes까지 채운 행 1건
+    - 짝이 없는 in (다음 in이 다른 날이거나 업로드 끝까지 out이 없음): 미퇴근 행으로 INSERT
+    - 같은 날 in이 또 오면 그 줄은 에러 ("Already checked in today", check-in API와 같음)
+    - 업로드 안에 짝이 없는 out: 이미 DB에 열려 있는 그날 기록을 UPDATE로 닫는다 (check-out API와 같음)
+    - 같은 직원 + 출근 시각의 기록이 이미 있으면 (같은 export를 다시 올림) 새로 넣지 않고 건너뛴다.
+      DB에는 미퇴근인데 이번 업로드에 out까지 있으면 그 기록을 닫는다.
+    직원별로 시간순 정렬된 export를 전제로 한다.
+    """
+
+    def __init__(self, db: AsyncSession, chunk_size: int, max_errors: int) -> None:
+        self.db = db
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.pending: Dict[int, _Punch] = {}         # employee_id → 아직 out이 없는 in
+        self.rows: List[Tuple[Tuple[int, ...], dict]] = []  # (원본 줄 번호들, INSERT 값)
+        self.orphan_outs: List[_Punch] = []
+        self.result = AttendanceBulkResult(
+            lines=0,
+            punches=0,
+            records_inserted=0,
+            open_records=0,
+            records_closed=0,
+            duplicates_skipped=0,
+            errors_total=0,
+            errors_truncated=False,
+            errors=[],
+        )
+
+    def error(self, lines: Tuple[int, ...], message: str) -> None:
+        for line in lines:
+            self.result.errors_total += 1
+            if len(self.result.errors) < self.max_errors:
+                self.result.errors.append(AttendanceBulkLineError(line=line, error=message))
+            else:
+                self.result.errors_truncated = True
+
+    async def add(self, punch: _Punch) -> None:
+        self.result.punches += 1
+        previous = self.pending.get(punch.employee_id)
+        if punch.kind == "in":
+            if previous is not None:
+                if previous.at.date() == punch.at.date():
+                    self.error((punch.line,), "Already checked in today")
+                    return
+                self._queue(previous, None)
+            self.pending[punch.employee_id] = punch
+        elif previous is None:
+            self.orphan_outs.append(punch)
+        elif punch.at < previous.at:
+            self.error((punch.line,), "check-out is earlier than check-in")
+            return
+        else:
+            del self.pending[punch.employee_id]
+            self._queue(previous, punch)
+
+        if len(self.rows) >= self.chunk_size or len(self.orphan_outs) >= self.chunk_size:
+            await self.flush()
+
+    def _queue(self, check_in: _Punch, check_out: Optional[_Punch]) -> None:
+        lines = (check_in.line,) if check_out is None else (check_in.line, check_out.line)
+        self.rows.append(
+            (
+                lines,
+                {
+                    "employee_id": check_in.employee_id,
+                    "attendance_date": check_in.at.date(),
+                    "check_in": check_in.at,
+                    "check_out": check_out.at if check_out else None,
+                    "work_minutes": (
+                        int((check_out.at - check_in.at).total_seconds() // 60) if check_out else None
+                    ),
+                },
+            )
+        )
+
+    async def finish(self) -> AttendanceBulkResult:
+        for punch in self.pending.values():
+            self._queue(punch, None)
+        self.pending.clear()
+        await self.flush()
+        return self.result
+
+    async def flush(self) -> None:
+        rows, self.rows = self.rows, []
+        outs, self.orphan_outs = self.orphan_outs, []
+        if rows:
+            await self._insert(rows)
+        if outs:
+            await self._close_open_records(outs)
+        await self.db.commit()
+
+    async def _insert(self, rows: List[Tuple[Tuple[int, ...], dict]]) -> None:
+        # 제약 위반 하나로 청크 전체가 실패하지 않도록 없는 직원 / 이미 등록된 기록은 미리 걸러낸다
+        # (청크당 SELECT 2번)
+        ids = {values["employee_id"] for _, values in rows}
+        found = set(
+            (await self.db.execute(select(EmployeeModel.id).where(EmployeeModel.id.in_(ids)))).scalars()
+        )
+        keys = [(values["employee_id"], values["check_in"]) for _, values in rows]
+        ingested = set(
+            (
+                await self.db.execute(
+                    select(AttendanceRecord.employee_id, AttendanceRecord.check_in).where(
+                        tuple_(AttendanceRecord.employee_id, AttendanceRecord.check_in).in_(keys)
+                    )
+                )
+            ).tuples()
+        )
+        valid = []
+        for lines, values in rows:
+            if values["employee_id"] not in found:
+                self.error(lines, "Employee not found")
+            elif (values["employee_id"], values["check_in"]) in ingested:
+                await self._merge(values)
+            else:
+                valid.append((lines, values))
+        if not valid:
+            return
+
+        try:
+            # executemany → SQLAlchemy가 multi-row INSERT ... VALUES (...), (...)로 묶어 보낸다.
+            # SAVEPOINT 안에서 실행해 실패해도 위 _merge의 UPDATE는 되돌리지 않는다 (커밋은 flush에서)
+            async with self.db.begin_nested():
+                await self.db.execute(insert(AttendanceRecord), [values for _, values in valid])
+            self._count_inserted(valid)
+            return
+        except IntegrityError:
+            pass
+
+        # 이미 열려 있는 기록과 겹치는 행 등: 이 청크만 행 단위 SAVEPOINT로 다시 넣어 줄별 에러를 남김
+        inserted = []
+        for lines, values in valid:
+            try:
+                async with self.db.begin_nested():
+                    await self.db.execute(insert(AttendanceRecord).values(**values))
+                inserted.append((lines, values))
+            except IntegrityError as exc:
+                code = mysql_error_code(exc)
+                if code == MYSQL_DUPLICATE_ENTRY and _CHECK_IN_KEY in str(exc.orig):
+                    await self._merge(values)  # 위 SELECT 뒤에 다른 요청이 먼저 넣음
+                elif code == MYSQL_DUPLICATE_ENTRY:
+                    self.error(lines, "Already checked in today")
+                elif code == MYSQL_NO_REFERENCED_ROW:
+                    self.error(lines, "Employee not found")
+                else:
+                    self.error(lines, "constraint violation")
+        self._count_inserted(inserted)
+
+    def _count_inserted(self, rows: List[Tuple[Tuple[int, ...], dict]]) -> None:
+        self.result.records_inserted += len(rows)
+        self.result.open_records += sum(1 for _, values in rows if values["check_out"] is None)
+
+    async def _merge(self, values: dict) -> None:
+        """이미 있는 (employee_id, check_in) 기록: DB 쪽이 미퇴근이고 이번 행에 퇴근이 있으면 닫고, 아니면 건너뜀."""
+        if values["check_out"] is not None:
+            result = await self.db.execute(
+                update(AttendanceRecord)
+                .where(
+                    and_(
+                        AttendanceRecord.employee_id == values["employee_id"],
+                        AttendanceRecord.check_in == values["check_in"],
+                        AttendanceRecord.check_out.is_(None),
+                    )
+                )
+                .values(check_out=values["check_out"], work_minutes=values["work_minutes"])
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                self.result.records_closed += 1
+                return
+        self.result.duplicates_skipped += 1
+
+    async def _close_open_records(self, outs: List[_Punch]) -> None:
+        # 행마다 결과(rowcount)가 필요해 한 건씩 UPDATE. 업로드 밖에서 출근한 경우만이라 드물다
+        for punch in outs:
+            result = await self.db.execute(
+                update(AttendanceRecord)
+                .where(
+                    and_(
+                        AttendanceRecord.employee_id == punch.employee_id,
+                        AttendanceRecord.attendance_date == punch.at.date(),
+                        AttendanceRecord.check_out.is_(None),
+                        AttendanceRecord.check_in <= punch.at,
+                    )
+                )
+                .values(
+                    check_out=punch.at,
+                    work_minutes=func.timestampdiff(text("MINUTE"), AttendanceRecord.check_in, punch.at),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                self.result.records_closed += 1
+            elif await self._already_closed(punch):
+                self.result.duplicates_skipped += 1
+            else:
+                self.error((punch.line,), "No active attendance record for that day")
+
+    async def _already_closed(self, punch: _Punch) -> bool:
+        # 같은 export를 다시 올려 이미 이 out으로 닫힌 기록
+        stmt = select(
+            exists().where(
+                and_(
+                    AttendanceRecord.employee_id == punch.employee_id,
+                    AttendanceRecord.attendance_date == punch.at.date(),
+                    AttendanceRecord.check_out == punch.at,
+                )
+            )
+        )
+        return bool((await self.db.execute(stmt)).scalar())
+
+
+@router.post(
+    "/bulk",
+    response_model=AttendanceBulkResult,
+)
+async def bulk_ingest(
+    request: Request,
+    fmt: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    tz: str = Query("UTC", max_length=64, description="오프셋 없는 timestamp의 시간대 (IANA 이름)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    출입 게이트(badge reader) export 일괄 등록. 본문은 NDJSON 또는 CSV (Content-Type 또는 ?format=).
+
+    - NDJSON: 줄마다 {"employee_id": 1, "timestamp": "2026-10-19T09:01:00", "type": "in"}
+    - CSV: 헤더 employee_id,timestamp,type 다음 줄부터 값
+
+    timestamp에 오프셋이 없으면 ?tz= 시간대(기본 UTC)의 시각으로 보고, 저장은 check-in API와 같이 UTC로 한다.
+
+    본문은 받는 대로 줄 단위로 처리하고 (전체를 메모리에 올리지 않음),
+    ATTENDANCE_BULK_CHUNK_SIZE건마다 multi-row INSERT 후 커밋한다.
+    잘못된 줄 (ATTENDANCE_BULK_MAX_LINE_BYTES보다 긴 줄 포함)은 건너뛰고 errors에 줄 번호와 함께 남긴다.
+    CSV 헤더가 잘못되면 헤더 줄 에러만 남기고 나머지는 처리하지 않는다 (커밋 전이라 저장된 것 없음).
+    이미 등록된 기록은 duplicates_skipped로 세므로 같은 export를 다시 올려도 된다.
+    """
+    try:
+        zone = ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown time zone: {tz}",
+        )
+    if fmt is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type in _NDJSON_TYPES:
+            fmt = "ndjson"
+        elif content_type in _CSV_TYPES:
+            fmt = "csv"
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Send application/x-ndjson or text/csv (or ?format=ndjson|csv)",
+            )
+    parse = _ndjson_parser(zone) if fmt == "ndjson" else _csv_parser(zone)
+
+    ingest = _BulkIngest(db, settings.ATTENDANCE_BULK_CHUNK_SIZE, settings.ATTENDANCE_BULK_MAX_ERRORS)
+    max_line_bytes = settings.ATTENDANCE_BULK_MAX_LINE_BYTES
+    async for number, raw in _lines(request.stream(), max_line_bytes):
+        ingest.result.lines = number
+        if raw is None:
+            ingest.error((number,), f"line exceeds {max_line_bytes} bytes")
+            continue
+        try:
+            text_line = raw.decode("utf-8").strip().lstrip("\ufeff")  # 엑셀 CSV의 BOM
+        except UnicodeDecodeError:
+            ingest.error((number,), "not valid UTF-8")
+            continue
+        if not text_line:
+            continue
+        try:
+            punch = parse(number, text_line)
+        except _HeaderError as exc:
+            ingest.error((number,), str(exc))
+            break
+        except ValueError as exc:
+            ingest.error((number,), str(exc))
+            continue
+        if punch is not None:
+            await ingest.add(punch)
+
+    return await ingest.finish()
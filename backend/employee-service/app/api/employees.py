@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +17,19 @@ router = APIRouter(
     tags=["employees"],
 )
 
+# 목록 / 검색 한 번에 돌려주는 최대 건수
+LIST_LIMIT_DEFAULT = 100
+LIST_LIMIT_MAX = 1000
+SEARCH_LIMIT_DEFAULT = 20
+SEARCH_LIMIT_MAX = 100
+
+# 다음 페이지 요청에 afterId로 넘길 값 (마지막 페이지면 헤더 없음)
+NEXT_AFTER_ID_HEADER = "X-Next-After-Id"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 @router.post(
     "",
@@ -44,22 +57,63 @@ async def create_employee(
     response_model=List[EmployeeSchema],
 )
 async def list_employees(
+    response: Response,
     department: str | None = None,
     position: str | None = None,
+    after_id: int | None = Query(None, alias="afterId", ge=0),
+    limit: int = Query(LIST_LIMIT_DEFAULT, ge=1, le=LIST_LIMIT_MAX),
     db: AsyncSession = Depends(get_db),
 ):
+    """
+    id 순 keyset 페이지네이션. 응답 헤더 X-Next-After-Id를 다음 요청의 afterId로 넘기면 이어서 조회한다.
+    OFFSET과 달리 뒤 페이지로 갈수록 느려지지 않는다 (department / position 인덱스의 id 범위만 읽음).
+    limit을 주지 않으면 100건까지만 돌려준다. 결과가 limit만큼 꽉 찼으면(뒤에 더 있을 수 있으면)
+    항상 X-Next-After-Id를 붙이므로, 헤더가 없을 때까지 이어서 조회하면 전체 목록이 된다.
+    """
     stmt = select(EmployeeModel)
 
     if department:
         stmt = stmt.where(EmployeeModel.department == department)
     if position:
         stmt = stmt.where(EmployeeModel.position == position)
+    if after_id is not None:
+        stmt = stmt.where(EmployeeModel.id > after_id)
 
-    result = await db.execute(stmt)
+    result = await db.execute(stmt.order_by(EmployeeModel.id).limit(limit))
     employees = result.scalars().all()
+    if len(employees) == limit:
+        response.headers[NEXT_AFTER_ID_HEADER] = str(employees[-1].id)
     return employees
 
 
+@router.get(
+    "/search",
+    response_model=List[EmployeeSchema],
+)
+async def search_employees(
+    q: str = Query(..., min_length=1, max_length=100, description="이름 앞부분"),
+    department: str | None = None,
+    limit: int = Query(SEARCH_LIMIT_DEFAULT, ge=1, le=SEARCH_LIMIT_MAX),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    결재자 선택 화면용 이름 앞부분 검색 (name LIKE 'q%', 이름 → id 순).
+    ix_employees_name_id 인덱스 범위만 읽으므로 직원 수와 관계없이 limit건만 읽는다.
+    (/{employee_id}보다 먼저 선언해야 "search"가 employee_id로 해석되지 않는다)
+    """
+    stmt = (
+        select(EmployeeModel)
+        .where(EmployeeModel.name.like(f"{_escape_like(q)}%", escape="\\"))
+        .order_by(EmployeeModel.name, EmployeeModel.id)
+        .limit(limit)
+    )
+    if department:
+        stmt = stmt.where(EmployeeModel.department == department)
+
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+
 @router.get(
     "/{employee_id}",
     response_model=EmployeeSchema,
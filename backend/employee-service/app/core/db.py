@@ -1,31 +1,153 @@
-import os
+import logging
+import time
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-# 환경변수에서 DB 설정 읽기 (없으면 기본값 사용)
-MYSQL_USER = os.getenv("MYSQL_USER", "erpuser")
-MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "erppassword")
-MYSQL_HOST = os.getenv("MYSQL_HOST", "mysql")
-MYSQL_PORT = os.getenv("MYSQL_PORT", "3306")
-MYSQL_DB = os.getenv("MYSQL_DB", "erp")
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """커넥션 풀 누적 지표 (GET /stats). pool.recreate() 후에도 유지되도록 풀 밖에 둔다."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.waits = 0            # 풀이 가득 차서 반납을 기다린 checkout
+        self.wait_seconds = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0         # DB_POOL_TIMEOUT_SECONDS 안에 연결을 못 받은 횟수
+        self.connects = 0         # 새로 맺은 DB 연결 (overflow / recycle / pre_ping 실패 후 재연결 포함)
+        self.invalidated = 0
+        self.overflow_max = 0
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """연결 대기 횟수/시간을 세는 QueuePool. 대기가 없는 checkout에는 비교 1번만 더한다."""
+
+    def _do_get(self):
+        if not (self._pool.empty() and 0 <= self._max_overflow <= self._overflow):
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            pool_metrics.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            pool_metrics.waits += 1
+            pool_metrics.wait_seconds += waited
+            pool_metrics.wait_seconds_max = max(pool_metrics.wait_seconds_max, waited)
 
-DATABASE_URL = (
-    f"mysql+asyncmy://{MYSQL_USER}:{MYSQL_PASSWORD}"
-    f"@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
-)
 
-# SQLAlchemy Async Engine
+# sqlalchemy.pool 로거처럼 dispose/recreate 같은 INFO 로그는 출력하지 않음
+logging.getLogger(f"{__name__}.{InstrumentedPool.__name__}").setLevel(logging.WARNING)
+
+# SQLAlchemy Async Engine (서비스 전체에서 이 엔진/풀 하나만 사용)
 engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,          # 개발용: 실행되는 SQL 로그 찍기 (트러블슈팅에 도움)
-    future=True,
+    settings.database_url,
+    poolclass=InstrumentedPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    pool_metrics.checkouts += 1
+    pool_metrics.overflow_max = max(pool_metrics.overflow_max, engine.pool.overflow())
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    pool_metrics.connects += 1
+
+
+@event.listens_for(engine.sync_engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+    pool_metrics.invalidated += 1
+
+
+def pool_stats() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "maxOverflow": settings.DB_MAX_OVERFLOW,
+        "checkedOut": pool.checkedout(),
+        "checkedIn": pool.checkedin(),
+        # 음수면 아직 pool_size만큼 연결을 맺지 않은 상태
+        "overflow": pool.overflow(),
+        "overflowMax": pool_metrics.overflow_max,
+        "checkouts": pool_metrics.checkouts,
+        "waits": pool_metrics.waits,
+        "waitSecondsTotal": round(pool_metrics.wait_seconds, 3),
+        "waitSecondsMax": round(pool_metrics.wait_seconds_max, 3),
+        "timeouts": pool_metrics.timeouts,
+        "connects": pool_metrics.connects,
+        "invalidated": pool_metrics.invalidated,
+    }
+
+
+class _StatementLog:
+    """
+    echo=True 대신 쓰는 SQL 로그. 문장 N건 중 1건(카운터 기반, DB_STATEMENT_LOG_RATE)만 INFO로,
+    DB_SLOW_STATEMENT_MS 이상 걸린 문장은 항상 WARNING으로 남긴다.
+    로그는 app.core.log의 QueueHandler를 거치므로 stdout 쓰기가 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, rate: float, slow_ms: float) -> None:
+        self.rate = min(max(rate, 0.0), 1.0)
+        self.every = int(1 / self.rate) if self.rate > 0 else 0
+        self.slow_seconds = slow_ms / 1000 if slow_ms > 0 else 0.0
+        self.count = 0
+
+    def before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        if self.slow_seconds and elapsed >= self.slow_seconds:
+            logger.warning(
+                "slow SQL statement",
+                extra={"statement": statement[:2000], "durationMs": round(elapsed * 1000, 1)},
+            )
+            return
+        if not self.every:
+            return
+        self.count += 1
+        if (self.count - 1) % self.every:
+            return
+        logger.info(
+            "SQL statement",
+            extra={
+                "statement": statement[:2000],
+                "durationMs": round(elapsed * 1000, 1),
+                "executemany": executemany,
+                "sample_rate": self.rate,
+            },
+        )
+
+
+if settings.DB_STATEMENT_LOG_RATE > 0 or settings.DB_SLOW_STATEMENT_MS > 0:
+    _statement_log = _StatementLog(settings.DB_STATEMENT_LOG_RATE, settings.DB_SLOW_STATEMENT_MS)
+    event.listen(engine.sync_engine, "before_cursor_execute", _statement_log.before)
+    event.listen(engine.sync_engine, "after_cursor_execute", _statement_log.after)
+
 # 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -37,20 +159,32 @@ AsyncSessionLocal = async_sessionmaker(
 # Base 클래스 (모든 모델의 부모)
 Base = declarative_base()
 
+# IntegrityError로 오는 MySQL 에러 코드 (제약 위반을 400 응답으로 바꿀 때 사용)
+MYSQL_DUPLICATE_ENTRY = 1062
+MYSQL_NO_REFERENCED_ROW = 1452
+
+
+def mysql_error_code(exc: Exception) -> int | None:
+    """DBAPIError.orig(asyncmy 예외)의 args[0] 에러 코드. MySQL이 아니면 None."""
+    args = getattr(getattr(exc, "orig", None), "args", None)
+    return args[0] if args and isinstance(args[0], int) else None
+
 
 # FastAPI 의존성 주입용 세션
 async def get_db() -> AsyncSession:
+    """
+    DB 세션을 생성하여 yield 하고, 사용 후 닫아줍니다.
+    AsyncSessionLocal 자체가 가변 키워드 인자를 받는 callable이라
+    FastAPI가 이를 검사해 잘못된 query parameter(local_kw)를
+    OpenAPI에 추가하는 문제가 있어, 여기서 직접 세션을 생성합니다.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
             await session.close()
 
-async def init_db() -> None:
-    """
-    애플리케이션 시작 시 한 번 호출해서
-    employees 테이블 등 SQLAlchemy 모델 기반 테이블을 생성.
-    이미 있으면 아무 일도 안 함 (CREATE TABLE IF NOT EXISTS 느낌).
-    """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+
+async def close_db() -> None:
+    """종료 시 풀의 연결을 모두 닫는다."""
+    await engine.dispose()
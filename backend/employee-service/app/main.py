@@ -2,8 +2,12 @@ from fastapi import FastAPI
 
 from app.api.employees import router as employees_router
 from app.api.attendance import router as attendance_router
+from app.api.attendance_bulk import router as attendance_bulk_router
 from app.api.leaves import router as leaves_router
-from app.core.db import init_db
+from app.core.db import close_db, pool_stats
+from app.core.log import setup_logging, shutdown_logging
+
+setup_logging("employee-service")
 
 app = FastAPI(
     title="Employee Service",
@@ -11,10 +15,13 @@ app = FastAPI(
     description="Employee CRUD service (REST + MySQL + SQLAlchemy)",
 )
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    # MySQL에 employees 테이블 등 생성
-    await init_db()
+# 테이블 / 인덱스는 배포 때 alembic upgrade head로 만든다 (migrations/, 시작 시 create_all 하지 않음)
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await close_db()
+    shutdown_logging()
 
 @app.get("/health")
 async def health_check():
@@ -24,6 +31,12 @@ async def health_check():
     }
 
 
+@app.get("/stats")
+async def stats():
+    """DB 커넥션 풀 상태 (레플리카별). waits / timeouts가 늘면 DB_POOL_SIZE / DB_MAX_OVERFLOW를 조정."""
+    return {"dbPool": pool_stats()}
+
+
 @app.get("/")
 async def root():
     return {
@@ -34,4 +47,5 @@ async def root():
 app.include_router(employees_router)
 app.include_router(employees_router)
 app.include_router(attendance_router)
+app.include_router(attendance_bulk_router)
 app.include_router(leaves_router)
\ No newline at end of file
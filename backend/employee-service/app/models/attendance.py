@@ -1,6 +1,6 @@
 from datetime import datetime, date
 
-from sqlalchemy import Column, BigInteger, Date, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, BigInteger, Computed, Date, DateTime, Index, Integer, ForeignKey
 from sqlalchemy.orm import relationship
 
 from app.core.db import Base
@@ -8,6 +8,14 @@ from app.core.db import Base
 
 class AttendanceRecord(Base):
     __tablename__ = "attendance_records"
+    __table_args__ = (
+        # check-in / check-out / GET /attendance/me : 직원 + 날짜(범위) 조회 (migrations 0002)
+        Index("ix_attendance_records_employee_id_date", "employee_id", "attendance_date"),
+        # 직원 + 날짜당 미퇴근 기록은 1건 (open_date는 퇴근하면 NULL이 되어 유니크 검사에서 빠짐, migrations 0003)
+        Index("uq_attendance_records_open_session", "employee_id", "open_date", unique=True),
+        # 같은 출근 시각은 같은 출입 기록: 일괄 등록을 다시 올려도 중복으로 들어가지 않음 (migrations 0005)
+        Index("uq_attendance_records_employee_id_check_in", "employee_id", "check_in", unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     employee_id = Column(BigInteger, ForeignKey("employees.id"), nullable=False)
@@ -16,6 +24,11 @@ class AttendanceRecord(Base):
     check_out = Column(DateTime, nullable=True)
     work_minutes = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # check_out이 없는 동안만 attendance_date, DB가 계산 (INSERT / UPDATE에 넣지 않음)
+    open_date = Column(
+        Date,
+        Computed("CASE WHEN check_out IS NULL THEN attendance_date END", persisted=True),
+    )
 
     # 선택: Employee 모델에 relationship 정의해둔 경우 사용 가능
     # employee = relationship("Employee", back_populates="attendance_records")
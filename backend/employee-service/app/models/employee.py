@@ -1,12 +1,21 @@
-from sqlalchemy import BigInteger, Column, DateTime, String, func
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, func
 
 from app.core.db import Base
 
 
 class Employee(Base):
     __tablename__ = "employees"
+    __table_args__ = (
+        # GET /employees?department=&position=&afterId= : 필터 + id 순 keyset 페이지를 인덱스 범위 스캔으로
+        Index("ix_employees_department_position_id", "department", "position", "id"),
+        # department만 줄 때 위 인덱스로는 id 순 정렬을 못 해 filesort가 생긴다
+        Index("ix_employees_department_id", "department", "id"),
+        Index("ix_employees_position_id", "position", "id"),
+        # GET /employees/search?q= : name LIKE 'q%' 범위 스캔
+        Index("ix_employees_name_id", "name", "id"),
+    )
 
-    id = Column(BigInteger, primary_key=True, index=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(100), nullable=False)
     department = Column(String(100), nullable=False)
     position = Column(String(100), nullable=False)
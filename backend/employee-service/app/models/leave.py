@@ -1,12 +1,16 @@
 from datetime import datetime, date
 
-from sqlalchemy import Column, BigInteger, Date, DateTime, Integer, String, ForeignKey
+from sqlalchemy import Column, BigInteger, Date, DateTime, Index, Integer, String, ForeignKey
 
 from app.core.db import Base
 
 
 class LeaveRecord(Base):
     __tablename__ = "leave_records"
+    __table_args__ = (
+        # GET /leaves/me : 직원 + start_date 범위 / 정렬 (migrations 0002)
+        Index("ix_leave_records_employee_id_start_date", "employee_id", "start_date"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     employee_id = Column(BigInteger, ForeignKey("employees.id"), nullable=False)
@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 
 
@@ -20,3 +20,20 @@ class AttendanceRecordRead(BaseModel):
     check_in: datetime
     check_out: Optional[datetime] = None
     work_minutes: Optional[int] = None
+
+
+class AttendanceBulkLineError(BaseModel):
+    line: int
+    error: str
+
+
+class AttendanceBulkResult(BaseModel):
+    lines: int                # 읽은 줄 수 (CSV 헤더 / 빈 줄 포함)
+    punches: int              # 파싱에 성공한 출입 기록 수
+    records_inserted: int     # 새로 만든 attendance_records (퇴근까지 짝지은 것 + open_records)
+    open_records: int         # 그 중 퇴근 기록 없이 넣은 것 (미퇴근)
+    records_closed: int       # 업로드 전부터 열려 있던 기록을 out 기록으로 닫은 수
+    duplicates_skipped: int   # 이미 등록된 기록이라 건너뛴 수 (같은 export를 다시 올린 경우)
+    errors_total: int
+    errors_truncated: bool
+    errors: List[AttendanceBulkLineError]
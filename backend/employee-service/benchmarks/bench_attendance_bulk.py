@@ -0,0 +1,186 @@
+"""
+근태 일괄 등록 처리량 벤치마크: POST /attendance/bulk 와 출입 기록 1건씩 처리하는 방식을 비교한다.
+
+직원 --employees명(기본 2,000명)이 --days일(기본 10일) 동안 하루 in / out 1번씩 찍은 export를 만들어
+(직원 * 일 * 2줄, 기본 40,000줄)
+
+- bulk     : bulk_ingest에 NDJSON / CSV 본문을 64KB씩 흘려 보냄 (HTTP 계층 제외).
+             NDJSON은 같은 본문을 한 번 더 올려 재등록(전부 duplicates_skipped) 처리량도 잰다
+- per-punch: check-in / check-out API가 DB에 하는 일 (in마다 INSERT + COMMIT, out마다 UPDATE + COMMIT)을
+             --per-punch-lines줄만큼 순서대로 실행 (실제로는 여기에 요청당 HTTP 왕복이 더해진다)
+
+의 초당 처리 줄 수를 출력한다. 직원이 모자라면 채워 넣고, 만든 근태 기록은 끝나고 지운다.
+DB는 서비스와 같은 설정(MYSQL_* 또는 SQLALCHEMY_DATABASE_URL)을 쓰며 alembic upgrade head가 되어 있어야 한다.
+운영 DB에 실행하지 말 것.
+
+실행 (employee-service 디렉터리에서):
+    MYSQL_HOST=127.0.0.1 python -m benchmarks.bench_attendance_bulk --employees 2000 --days 10
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Iterator, List
+
+from sqlalchemy import and_, delete, func, insert, select, text, update
+from starlette.requests import Request
+
+from app.api.attendance_bulk import bulk_ingest
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal, close_db, engine
+from app.models.attendance import AttendanceRecord
+from app.models.employee import Employee as EmployeeModel
+
+_BODY_CHUNK = 64 * 1024
+_SEED_CHUNK = 5000
+
+
+async def _employee_ids(count: int) -> List[int]:
+    async with AsyncSessionLocal() as db:
+        existing, max_id = (
+            await db.execute(select(func.count(), func.coalesce(func.max(EmployeeModel.id), 0)))
+        ).one()
+        for start in range(existing, count, _SEED_CHUNK):
+            rows = [
+                {
+                    "id": max_id + start - existing + n + 1,  # 대량 INSERT라 id를 직접 채움
+                    "name": f"벤치{start + n:06d}",
+                    "department": "벤치",
+                    "position": "사원",
+                }
+                for n in range(min(_SEED_CHUNK, count - start))
+            ]
+            await db.execute(insert(EmployeeModel), rows)
+            await db.commit()
+        return list(
+            (await db.execute(select(EmployeeModel.id).order_by(EmployeeModel.id).limit(count))).scalars()
+        )
+
+
+def _punches(ids: List[int], first_day: date, days: int) -> Iterator[tuple]:
+    rng = random.Random(5)
+    for day in range(days):
+        start = datetime.combine(first_day + timedelta(days=day), datetime.min.time())
+        for employee_id in ids:
+            check_in = start + timedelta(hours=8, seconds=rng.randrange(7200))
+            yield employee_id, check_in, "in"
+            yield employee_id, check_in + timedelta(seconds=rng.randrange(25200, 36000)), "out"
+
+
+def _body(fmt: str, punches) -> bytes:
+    if fmt == "ndjson":
+        lines = (
+            json.dumps({"employee_id": e, "timestamp": at.isoformat(), "type": kind}) for e, at, kind in punches
+        )
+    else:
+        lines = ["employee_id,timestamp,type", *(f"{e},{at.isoformat()},{kind}" for e, at, kind in punches)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _request(fmt: str, body: bytes) -> Request:
+    chunks = [body[i : i + _BODY_CHUNK] for i in range(0, len(body), _BODY_CHUNK)]
+    content_type = b"application/x-ndjson" if fmt == "ndjson" else b"text/csv"
+
+    async def receive() -> dict:
+        chunk = chunks.pop(0) if chunks else b""
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/attendance/bulk",
+        "query_string": b"",
+        "headers": [(b"content-type", content_type)],
+    }
+    return Request(scope, receive)
+
+
+async def _bulk(fmt: str, punches: list, label: str = "") -> None:
+    body = _body(fmt, punches)
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        result = await bulk_ingest(request=_request(fmt, body), fmt=None, tz="UTC", db=db)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{f'bulk/{fmt}{label}':<12} lines={len(punches):>8,} body={len(body) / 1e6:>6.1f}MB "
+        f"{elapsed:>7.2f}s {len(punches) / elapsed:>10,.0f} lines/s "
+        f"(inserted={result.records_inserted:,} skipped={result.duplicates_skipped:,} "
+        f"errors={result.errors_total:,})"
+    )
+
+
+async def _per_punch(punches: list) -> None:
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        for employee_id, at, kind in punches:
+            if kind == "in":
+                await db.execute(
+                    insert(AttendanceRecord).values(employee_id=employee_id, attendance_date=at.date(), check_in=at)
+                )
+            else:
+                await db.execute(
+                    update(AttendanceRecord)
+                    .where(
+                        and_(
+                            AttendanceRecord.employee_id == employee_id,
+                            AttendanceRecord.attendance_date == at.date(),
+                            AttendanceRecord.check_out.is_(None),
+                        )
+                    )
+                    .values(
+                        check_out=at,
+                        work_minutes=func.timestampdiff(text("MINUTE"), AttendanceRecord.check_in, at),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            await db.commit()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'per-punch':<12} lines={len(punches):>8,} {'':>14}"
+        f"{elapsed:>7.2f}s {len(punches) / elapsed:>10,.0f} lines/s"
+    )
+
+
+async def _bench(args) -> None:
+    ids = await _employee_ids(args.employees)
+    # 기존 데이터와 겹치지 않도록 먼 과거 날짜에 만들고 끝나면 지운다
+    first_day = date(2000, 1, 1)
+    last_day = first_day + timedelta(days=args.days * 3)
+    print(
+        f"employees={len(ids):,} days={args.days} chunk={args.chunk_size or 'setting'} ({engine.dialect.name})"
+    )
+    if args.chunk_size:
+        settings.ATTENDANCE_BULK_CHUNK_SIZE = args.chunk_size
+
+    try:
+        ndjson = list(_punches(ids, first_day, args.days))
+        await _bulk("ndjson", ndjson)
+        await _bulk("ndjson", ndjson, "(re)")
+        await _bulk("csv", list(_punches(ids, first_day + timedelta(days=args.days), args.days)))
+        per_punch = list(_punches(ids, first_day + timedelta(days=args.days * 2), args.days))
+        await _per_punch(per_punch[: args.per_punch_lines])
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                delete(AttendanceRecord).where(
+                    AttendanceRecord.attendance_date.between(first_day, last_day),
+                    AttendanceRecord.employee_id.in_(ids),
+                )
+            )
+            await db.commit()
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--employees", type=int, default=2_000)
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--per-punch-lines", type=int, default=4_000, help="1건씩 처리 방식으로 돌릴 줄 수")
+    parser.add_argument("--chunk-size", type=int, default=0, help="ATTENDANCE_BULK_CHUNK_SIZE 대신 사용")
+    asyncio.run(_bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+근태 / 연차 조회 인덱스 벤치마크: 마이그레이션 0002 적용 전후의 쿼리 플랜과 지연을 비교한다.
+
+직원 --employees명(기본 2,000명)에 --days일치(기본 365일) 근태 기록과 직원당 --leaves건의 연차 기록을 넣고
+(테이블이 비어 있을 때만, 시드 고정), 아래 쿼리를 측정한다.
+
+- open      : check_in / check_out 의 오늘 미퇴근 기록 조회 (employee_id, attendance_date, check_out IS NULL)
+- attendance: GET /attendance/me?employeeId=&from=&to= (get_my_attendance, 30일 범위)
+- leaves    : GET /leaves/me?employeeId=&from=&to= (get_my_leaves, 90일 범위)
+
+먼저 alembic downgrade 0001(복합 인덱스 없음, FK용 employee_id 인덱스만)에서 EXPLAIN과 p50/p99를 찍고,
+alembic upgrade head 후에 다시 찍는다. 끝나면 DB는 head 상태다.
+DB는 서비스와 같은 설정(MYSQL_* 또는 SQLALCHEMY_DATABASE_URL)을 쓴다. 운영 DB에 실행하지 말 것.
+
+실행 (employee-service 디렉터리에서):
+    MYSQL_HOST=127.0.0.1 python -m benchmarks.bench_attendance_indexes --employees 2000 --days 365
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, List
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import and_, func, insert, select
+
+from app.api.attendance import get_my_attendance
+from app.api.leaves import get_my_leaves
+from app.core.db import AsyncSessionLocal, close_db, engine
+from app.models.attendance import AttendanceRecord
+from app.models.employee import Employee as EmployeeModel
+from app.models.leave import LeaveRecord
+
+_SEED_CHUNK = 5000
+_LEAVE_TYPES = ["annual", "annual", "annual", "sick", "half"]
+
+
+async def _migrate(revision: str) -> None:
+    cfg = Config("alembic.ini")
+    cfg.attributes["configure_logger"] = False
+    step = command.upgrade if revision == "head" else command.downgrade
+    # migrations/env.py가 asyncio.run을 쓰므로 이벤트 루프 밖(스레드)에서 실행
+    await asyncio.to_thread(step, cfg, revision)
+
+
+async def _insert_chunked(db, model, rows) -> None:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == _SEED_CHUNK:
+            await db.execute(insert(model), chunk)
+            await db.commit()
+            chunk = []
+    if chunk:
+        await db.execute(insert(model), chunk)
+        await db.commit()
+
+
+async def _seed(args, first_day: date) -> List[int]:
+    rng = random.Random(7)
+    async with AsyncSessionLocal() as db:
+        existing, max_id = (
+            await db.execute(select(func.count(), func.coalesce(func.max(EmployeeModel.id), 0)))
+        ).one()
+        if existing < args.employees:
+            await _insert_chunked(
+                db,
+                EmployeeModel,
+                (
+                    {
+                        "id": max_id + n + 1,  # 대량 INSERT라 id를 직접 채움
+                        "name": f"벤치{n:06d}",
+                        "department": f"부서{n % 20:02d}",
+                        "position": "사원",
+                    }
+                    for n in range(args.employees - existing)
+                ),
+            )
+        ids = list(
+            (await db.execute(select(EmployeeModel.id).order_by(EmployeeModel.id).limit(args.employees)))
+            .scalars()
+        )
+
+        if not (await db.execute(select(func.count()).select_from(AttendanceRecord))).scalar_one():
+
+            def attendance_rows():
+                for day in range(args.days):
+                    attendance_date = first_day + timedelta(days=day)
+                    for employee_id in ids:
+                        check_in = datetime.combine(attendance_date, datetime.min.time()) + timedelta(
+                            hours=8, minutes=rng.randrange(120)
+                        )
+                        minutes = rng.randrange(420, 600)
+                        yield {
+                            "employee_id": employee_id,
+                            "attendance_date": attendance_date,
+                            "check_in": check_in,
+                            "check_out": check_in + timedelta(minutes=minutes),
+                            "work_minutes": minutes,
+                        }
+
+            await _insert_chunked(db, AttendanceRecord, attendance_rows())
+
+        if not (await db.execute(select(func.count()).select_from(LeaveRecord))).scalar_one():
+
+            def leave_rows():
+                for employee_id in ids:
+                    for _ in range(args.leaves):
+                        start = first_day + timedelta(days=rng.randrange(args.days))
+                        days = rng.choice([1, 1, 1, 2, 3, 5])
+                        yield {
+                            "employee_id": employee_id,
+                            "start_date": start,
+                            "end_date": start + timedelta(days=days - 1),
+                            "days": days,
+                            "leave_type": rng.choice(_LEAVE_TYPES),
+                            "status": "approved",
+                        }
+
+            await _insert_chunked(db, LeaveRecord, leave_rows())
+    return ids
+
+
+def _open_record_stmt(employee_id: int, day: date):
+    # app.api.attendance.check_in / check_out 과 같은 조건
+    return select(AttendanceRecord).where(
+        and_(
+            AttendanceRecord.employee_id == employee_id,
+            AttendanceRecord.attendance_date == day,
+            AttendanceRecord.check_out.is_(None),
+        )
+    )
+
+
+def _attendance_stmt(employee_id: int, start: date, end: date):
+    return (
+        select(AttendanceRecord)
+        .where(
+            and_(
+                AttendanceRecord.employee_id == employee_id,
+                AttendanceRecord.attendance_date >= start,
+                AttendanceRecord.attendance_date <= end,
+            )
+        )
+        .order_by(AttendanceRecord.attendance_date)
+    )
+
+
+def _leaves_stmt(employee_id: int, start: date, end: date):
+    return (
+        select(LeaveRecord)
+        .where(LeaveRecord.employee_id == employee_id)
+        .where(LeaveRecord.start_date >= start)
+        .where(LeaveRecord.end_date <= end)
+        .order_by(LeaveRecord.start_date)
+    )
+
+
+async def _explain(label: str, stmt) -> None:
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN" if engine.dialect.name == "sqlite" else "EXPLAIN"
+    async with engine.connect() as conn:
+        rows = (await conn.exec_driver_sql(f"{prefix} {sql}")).mappings().all()
+    print(f"  {label}:")
+    for row in rows:
+        if engine.dialect.name == "mysql":
+            keep = ("table", "type", "key", "key_len", "rows", "filtered", "Extra")
+            print("    " + " ".join(f"{k}={row[k]}" for k in keep if k in row))
+        else:
+            print("    " + " ".join(f"{k}={v}" for k, v in row.items()))
+
+
+async def _measure(runs: int, query: Callable[[random.Random], Awaitable[None]]) -> List[float]:
+    rng = random.Random(11)
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await query(rng)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _run(label: str, args, ids: List[int], first_day: date) -> None:
+    last_day = first_day + timedelta(days=args.days - 1)
+
+    def pick(rng: random.Random, span: int):
+        start = first_day + timedelta(days=rng.randrange(max(args.days - span, 1)))
+        return rng.choice(ids), start, start + timedelta(days=span)
+
+    async def open_record(rng: random.Random) -> None:
+        async with AsyncSessionLocal() as db:
+            (await db.execute(_open_record_stmt(rng.choice(ids), last_day))).scalar_one_or_none()
+
+    async def attendance(rng: random.Random) -> None:
+        employee_id, start, end = pick(rng, 30)
+        async with AsyncSessionLocal() as db:
+            await get_my_attendance(employee_id=employee_id, from_date=start, to_date=end, db=db)
+
+    async def leaves(rng: random.Random) -> None:
+        employee_id, start, end = pick(rng, 90)
+        async with AsyncSessionLocal() as db:
+            await get_my_leaves(employee_id=employee_id, from_date=start, to_date=end, db=db)
+
+    print(f"\n[{label}]")
+    sample = ids[len(ids) // 2]
+    await _explain("open", _open_record_stmt(sample, last_day))
+    await _explain("attendance", _attendance_stmt(sample, last_day - timedelta(days=30), last_day))
+    await _explain("leaves", _leaves_stmt(sample, last_day - timedelta(days=90), last_day))
+
+    results = {
+        "open": await _measure(args.runs, open_record),
+        "attendance": await _measure(args.runs, attendance),
+        "leaves": await _measure(args.runs, leaves),
+    }
+    print(f"  {'query':<11} {'runs':>6} {'p50(ms)':>9} {'p99(ms)':>9}")
+    for name, latencies in results.items():
+        q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        print(f"  {name:<11} {len(latencies):>6} {q[49] * 1e3:>9.2f} {q[98] * 1e3:>9.2f}")
+
+
+async def _bench(args) -> None:
+    await _migrate("head")
+    first_day = date.today() - timedelta(days=args.days)
+    ids = await _seed(args, first_day)
+    async with AsyncSessionLocal() as db:
+        attendance_rows = (await db.execute(select(func.count()).select_from(AttendanceRecord))).scalar_one()
+        leave_rows = (await db.execute(select(func.count()).select_from(LeaveRecord))).scalar_one()
+    print(
+        f"employees={len(ids):,} attendance_records={attendance_rows:,} leave_records={leave_rows:,} "
+        f"runs={args.runs} ({engine.dialect.name})"
+    )
+
+    try:
+        await _migrate("0001")
+        await engine.dispose()  # 인덱스가 바뀐 뒤 풀에 남은 연결 / 캐시된 플랜을 버림
+        await _run("before: 0001 (employee_id FK index only)", args, ids, first_day)
+    finally:
+        await _migrate("head")
+        await engine.dispose()
+    await _run("after: head (composite indexes)", args, ids, first_day)
+    await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--employees", type=int, default=2_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--leaves", type=int, default=12, help="직원당 연차 기록 수")
+    parser.add_argument("--runs", type=int, default=500, help="쿼리별 반복 횟수")
+    asyncio.run(_bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+직원 목록 / 검색 지연 벤치마크: 직원 --employees명(기본 100,000명)을 넣어 두고 쿼리별 지연을 비교한다.
+
+- unbounded : 변경 전 GET /employees?department= (페이지 없이 부서 전체 조회)
+- offset    : ORDER BY id LIMIT --page-size OFFSET n (무작위 깊이의 페이지)
+- keyset    : GET /employees?department=&afterId= (list_employees, id 범위 + LIMIT)
+- search    : GET /employees/search?q= (search_employees, 이름 앞 1~2글자)
+
+인덱스(ix_employees_*)가 있을 때와 지운 뒤(풀 스캔)를 차례로 측정하고, 끝나면 인덱스를 다시 만든다.
+DB는 서비스와 같은 설정(MYSQL_* 또는 SQLALCHEMY_DATABASE_URL)을 쓰며, 직원 수가 모자라면 채워 넣는다.
+스키마는 미리 alembic upgrade head로 만들어 둘 것.
+운영 DB에 실행하지 말 것.
+
+실행 (employee-service 디렉터리에서):
+    MYSQL_HOST=127.0.0.1 python -m benchmarks.bench_employee_listing --employees 100000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from fastapi import Response
+from sqlalchemy import func, insert, select
+
+from app.api.employees import list_employees, search_employees
+from app.core.db import AsyncSessionLocal, close_db, engine
+from app.models.employee import Employee as EmployeeModel
+
+_DEPARTMENTS = [f"부서{n:02d}" for n in range(20)]
+_POSITIONS = ["사원", "주임", "대리", "과장", "차장", "부장", "이사", "상무"]
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_SYLLABLES = "가나다라마바사아자차카타파하민서준도윤지현우진수영호성"
+_SEED_CHUNK = 5000
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(_SURNAMES) + "".join(rng.choice(_SYLLABLES) for _ in range(2))
+
+
+async def _seed(count: int) -> int:
+    async with AsyncSessionLocal() as db:
+        existing, max_id = (
+            await db.execute(select(func.count(), func.coalesce(func.max(EmployeeModel.id), 0)))
+        ).one()
+        rng = random.Random(existing)
+        for start in range(existing, count, _SEED_CHUNK):
+            rows = [
+                {
+                    "id": max_id + start - existing + n + 1,  # 대량 INSERT라 id를 직접 채움
+                    "name": _name(rng),
+                    "department": rng.choice(_DEPARTMENTS),
+                    "position": rng.choice(_POSITIONS),
+                }
+                for n in range(min(_SEED_CHUNK, count - start))
+            ]
+            await db.execute(insert(EmployeeModel), rows)
+            await db.commit()
+        return max(existing, count)
+
+
+async def _measure(runs: int, query: Callable[[random.Random], Awaitable[None]]) -> List[float]:
+    rng = random.Random(11)
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await query(rng)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _queries(args, max_id: int) -> dict:
+    async def unbounded(rng: random.Random) -> None:
+        async with AsyncSessionLocal() as db:
+            stmt = select(EmployeeModel).where(EmployeeModel.department == rng.choice(_DEPARTMENTS))
+            (await db.execute(stmt)).scalars().all()
+
+    async def offset(rng: random.Random) -> None:
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(EmployeeModel)
+                .where(EmployeeModel.department == rng.choice(_DEPARTMENTS))
+                .order_by(EmployeeModel.id)
+                .offset(rng.randrange(args.employees // len(_DEPARTMENTS)))
+                .limit(args.page_size)
+            )
+            (await db.execute(stmt)).scalars().all()
+
+    async def keyset(rng: random.Random) -> None:
+        async with AsyncSessionLocal() as db:
+            await list_employees(
+                response=Response(),
+                department=rng.choice(_DEPARTMENTS),
+                position=None,
+                after_id=rng.randrange(max_id),
+                limit=args.page_size,
+                db=db,
+            )
+
+    async def search(rng: random.Random) -> None:
+        prefix = rng.choice(_SURNAMES) + (rng.choice(_SYLLABLES) if rng.random() < 0.5 else "")
+        async with AsyncSessionLocal() as db:
+            await search_employees(q=prefix, department=None, limit=20, db=db)
+
+    return {
+        "unbounded": await _measure(max(args.runs // 10, 5), unbounded),
+        "offset": await _measure(args.runs, offset),
+        "keyset": await _measure(args.runs, keyset),
+        "search": await _measure(args.runs, search),
+    }
+
+
+def _print(label: str, results: dict) -> None:
+    print(f"\n[{label}]")
+    print(f"{'query':<10} {'runs':>6} {'p50(ms)':>9} {'p99(ms)':>9}")
+    for name, latencies in results.items():
+        q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        print(f"{name:<10} {len(latencies):>6} {q[49] * 1e3:>9.2f} {q[98] * 1e3:>9.2f}")
+
+
+async def _bench(args) -> None:
+    total = await _seed(args.employees)
+    async with AsyncSessionLocal() as db:
+        max_id = (await db.execute(select(func.max(EmployeeModel.id)))).scalar_one()
+    print(f"employees={total:,} page={args.page_size} runs={args.runs} ({engine.dialect.name})")
+
+    _print("with indexes", await _queries(args, max_id))
+    if args.skip_unindexed:
+        await close_db()
+        return
+
+    indexes = list(EmployeeModel.__table__.indexes)
+    async with engine.begin() as conn:
+        for index in indexes:
+            await conn.run_sync(index.drop)
+    try:
+        _print("without indexes", await _queries(args, max_id))
+    finally:
+        async with engine.begin() as conn:
+            for index in indexes:
+                await conn.run_sync(index.create)
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=200, help="쿼리별 반복 횟수 (unbounded는 1/10)")
+    parser.add_argument("--skip-unindexed", action="store_true", help="인덱스를 지우고 다시 측정하지 않음")
+    asyncio.run(_bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""baseline: employees / attendance_records / leave_records
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+
+scripts/init_mysql.sql 또는 예전 init_db(create_all)로 이미 만들어진 DB에도 그대로 upgrade 할 수 있도록
+없는 테이블 / 인덱스만 만든다.
+예전 모델의 Column(index=True)로 생긴 ix_employees_id는 PK와 같은 인덱스라 (모델에서도 뺐음) 있으면 지운다.
+init_mysql.sql로 만든 employees.created_at은 NULL 허용이라 모델과 같이 NOT NULL로 맞춘다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+_EMPLOYEE_INDEXES = {
+    "ix_employees_department_position_id": ["department", "position", "id"],
+    "ix_employees_position_id": ["position", "id"],
+    "ix_employees_name_id": ["name", "id"],
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    if "employees" not in tables:
+        op.create_table(
+            "employees",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("department", sa.String(100), nullable=False),
+            sa.Column("position", sa.String(100), nullable=False),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        )
+        existing = set()
+    else:
+        existing = {ix["name"] for ix in inspector.get_indexes("employees")}
+        created_at = next(c for c in inspector.get_columns("employees") if c["name"] == "created_at")
+        if created_at["nullable"]:
+            op.execute("UPDATE employees SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+            op.alter_column(
+                "employees",
+                "created_at",
+                existing_type=sa.DateTime(),
+                existing_server_default=sa.func.now(),
+                nullable=False,
+            )
+    for name, columns in _EMPLOYEE_INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "employees", columns)
+    if "ix_employees_id" in existing:
+        op.drop_index("ix_employees_id", table_name="employees")
+
+    if "attendance_records" not in tables:
+        op.create_table(
+            "attendance_records",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column("employee_id", sa.BigInteger(), nullable=False),
+            sa.Column("attendance_date", sa.Date(), nullable=False),
+            sa.Column("check_in", sa.DateTime(), nullable=False),
+            sa.Column("check_out", sa.DateTime(), nullable=True),
+            sa.Column("work_minutes", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+            sa.ForeignKeyConstraint(["employee_id"], ["employees.id"], name="fk_attendance_employee"),
+        )
+
+    if "leave_records" not in tables:
+        op.create_table(
+            "leave_records",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column("employee_id", sa.BigInteger(), nullable=False),
+            sa.Column("start_date", sa.Date(), nullable=False),
+            sa.Column("end_date", sa.Date(), nullable=False),
+            sa.Column("days", sa.Integer(), nullable=False),
+            sa.Column("leave_type", sa.String(20), nullable=False),
+            sa.Column("status", sa.String(20), nullable=False),
+            sa.Column("reason", sa.String(255), nullable=True),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+            sa.ForeignKeyConstraint(["employee_id"], ["employees.id"], name="fk_leave_employee"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("leave_records")
+    op.drop_table("attendance_records")
+    op.drop_table("employees")
@@ -0,0 +1,45 @@
+"""attendance_records (employee_id, attendance_date), leave_records (employee_id, start_date) 인덱스
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+check_in / check_out / GET /attendance/me 는 (employee_id, attendance_date)로,
+GET /leaves/me 는 employee_id + start_date 범위 / 정렬로 찾는다.
+지금까지는 FK용 employee_id 단일 인덱스뿐이라 직원의 전체 기록을 읽고 날짜를 걸러냈다.
+
+MySQL은 employee_id로 시작하는 인덱스가 생기면 FK용으로 자동 생성했던 인덱스를 지운다.
+그래서 downgrade는 FK용 인덱스를 먼저 다시 만든 뒤에 복합 인덱스를 지운다 (아니면 1553 에러).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("ix_attendance_records_employee_id_date", "attendance_records", ["employee_id", "attendance_date"]),
+    ("ix_leave_records_employee_id_start_date", "leave_records", ["employee_id", "start_date"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in _INDEXES:
+        existing = {ix["name"] for ix in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+        # 이전 downgrade가 남긴 FK용 단일 인덱스는 복합 인덱스가 대신하므로 지운다
+        if f"ix_{table}_employee_id" in existing:
+            op.drop_index(f"ix_{table}_employee_id", table_name=table)
+
+
+def downgrade() -> None:
+    is_mysql = op.get_bind().dialect.name == "mysql"
+    for name, table, _ in _INDEXES:
+        if is_mysql:
+            op.create_index(f"ix_{table}_employee_id", table, ["employee_id"])
+        op.drop_index(name, table_name=table)
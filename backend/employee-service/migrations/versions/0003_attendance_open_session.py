@@ -0,0 +1,57 @@
+"""attendance_records 미퇴근 기록 유니크 제약 (open_date 생성 컬럼)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+open_date = check_out이 NULL이면 attendance_date, 아니면 NULL (STORED 생성 컬럼).
+UNIQUE (employee_id, open_date)로 직원 + 날짜당 미퇴근 기록을 1건으로 막는다 (NULL끼리는 겹치지 않음).
+check_in은 이 제약과 FK에 기대어 INSERT 한 번으로 처리한다.
+
+예전 코드의 SELECT 후 INSERT 경쟁으로 생긴 중복 미퇴근 기록은 인덱스를 만들 수 없게 하므로
+같은 직원 / 날짜에서 가장 먼저 만들어진 기록만 남기고 지운다 (퇴근 시간도 없는 중복 출근 기록).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM attendance_records
+        WHERE check_out IS NULL
+          AND id NOT IN (
+            SELECT keep_id FROM (
+              SELECT MIN(id) AS keep_id
+              FROM attendance_records
+              WHERE check_out IS NULL
+              GROUP BY employee_id, attendance_date
+            ) AS first_open
+          )
+        """
+    )
+    op.add_column(
+        "attendance_records",
+        sa.Column(
+            "open_date",
+            sa.Date(),
+            sa.Computed("CASE WHEN check_out IS NULL THEN attendance_date END", persisted=True),
+        ),
+    )
+    op.create_index(
+        "uq_attendance_records_open_session",
+        "attendance_records",
+        ["employee_id", "open_date"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_attendance_records_open_session", table_name="attendance_records")
+    op.drop_column("attendance_records", "open_date")
@@ -0,0 +1,28 @@
+"""employees (department, id) 인덱스
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+GET /employees?department= (position 없이) 는 (department, position, id) 인덱스로 찾으면
+id 순서가 position별로 끊겨 filesort가 생기고, 페이지마다 부서 전체를 읽는다.
+(department, id)로 부서 안의 id 범위만 읽는다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    existing = {ix["name"] for ix in sa.inspect(op.get_bind()).get_indexes("employees")}
+    if "ix_employees_department_id" not in existing:
+        op.create_index("ix_employees_department_id", "employees", ["department", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_employees_department_id", table_name="employees")
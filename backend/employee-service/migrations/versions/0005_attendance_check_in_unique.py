@@ -0,0 +1,46 @@
+"""attendance_records (employee_id, check_in) 유니크 제약
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+POST /attendance/bulk 로 같은 export를 다시 올리면 퇴근까지 짝지은 기록이 그대로 한 번 더 들어갔다
+(미퇴근 기록만 open_date 제약에 걸림). 같은 직원의 같은 출근 시각은 같은 출입 기록이므로
+(employee_id, check_in)을 자연 키로 유니크하게 막고, 일괄 등록은 이 충돌을 "이미 등록됨"으로 건너뛴다.
+
+이미 중복으로 들어간 기록은 인덱스를 만들 수 없게 하므로 직원 / 출근 시각마다 1건만 남긴다
+(퇴근 기록이 있는 것 우선, 그 다음 먼저 만들어진 것).
+"""
+from alembic import op
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE dup FROM attendance_records AS dup
+        JOIN attendance_records AS keep
+          ON keep.employee_id = dup.employee_id
+         AND keep.check_in = dup.check_in
+         AND keep.id <> dup.id
+         AND (
+           (keep.check_out IS NOT NULL AND dup.check_out IS NULL)
+           OR ((keep.check_out IS NULL) = (dup.check_out IS NULL) AND keep.id < dup.id)
+         )
+        """
+    )
+    op.create_index(
+        "uq_attendance_records_employee_id_check_in",
+        "attendance_records",
+        ["employee_id", "check_in"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_attendance_records_employee_id_check_in", table_name="attendance_records")
@@ -0,0 +1,43 @@
+import re
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+
+from app.core.config import SSE_RETRY_MILLISECONDS
+from app.core.connection_manager import TOPIC_PATTERN
+from app.core.event_id import parse_event_id
+from app.core.sse import EventStreamResponse
+
+_TOPIC_RE = re.compile(TOPIC_PATTERN)
+
+router = APIRouter(
+    prefix="/events",
+    tags=["events"],
+)
+
+
+@router.get("/{employee_id}", response_class=EventStreamResponse)
+async def event_stream(
+    employee_id: int,
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    last_event_id: Optional[int] = Query(None, alias="lastEventId", ge=0),
+    topics: Optional[str] = Query(None, description="쉼표로 구분한 topic (request:{id}, department:{name})"),
+):
+    """
+    WebSocket을 쓸 수 없는 클라이언트(프록시 환경, 단방향 구독만 필요한 화면)를 위한 Server-Sent Events 스트림.
+    예: new EventSource("http://localhost:8004/events/2?topics=request:7")
+    /ws와 같은 세션 관리(연결 수 제한, 송신 큐, 알림 버퍼)를 쓰고, 알림마다 id 필드로 eventId를 보낸다.
+    브라우저가 재접속할 때 Last-Event-ID 헤더로 돌려주면 그 이후 알림을 replay 이벤트 1개로 먼저 보낸다.
+    (처음 접속할 때 놓친 알림을 받으려면 lastEventId 쿼리, 0이면 버퍼에 있는 알림 전체)
+    topic은 접속할 때만 지정할 수 있다 (바꾸려면 다시 접속).
+    """
+    if last_event_id_header is not None:
+        last_event_id = parse_event_id(last_event_id_header)
+    topic_list = [t for t in (topics or "").split(",") if t]
+    invalid = [t for t in topic_list if not _TOPIC_RE.match(t)]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid topics: {', '.join(invalid[:10])}",
+        )
+    return EventStreamResponse(employee_id, last_event_id, topic_list, SSE_RETRY_MILLISECONDS)
@@ -1,7 +1,11 @@
-from pydantic import BaseModel
-from fastapi import APIRouter
+from typing import Annotated, List
 
-from app.core.connection_manager import manager
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from fastapi import APIRouter, Request
+
+from app.core.config import NOTIFICATION_BROKER_ENABLED, NOTIFY_BATCH_REPORT_TIMEOUT_SECONDS
+from app.core.connection_manager import TOPIC_PATTERN, manager
+from app.core.rabbitmq import deliver_batch_locally, publish_batch, publish_notification
 
 router = APIRouter(
     prefix="",
@@ -10,6 +14,9 @@ router = APIRouter(
 
 
 class NotificationPayload(BaseModel):
+    # SLA 알림(overdueSeconds 등)처럼 type별 추가 필드는 그대로 전달
+    model_config = ConfigDict(extra="allow")
+
     employeeId: int
     type: str
     requestId: int | None = None
@@ -20,11 +27,91 @@ class NotificationPayload(BaseModel):
     title: str | None = None
 
 
+class NotificationContent(BaseModel):
+    """/notify/batch 항목의 알림 본문. 대상 직원 모두에게 같은 내용이 전달된다."""
+    model_config = ConfigDict(extra="allow")
+
+    type: str
+
+
+class NotificationBatchItem(BaseModel):
+    # 대상 직원, 그리고/또는 topic(request:{id}, department:{name}) 구독 세션
+    employeeIds: List[int] = Field(default_factory=list, max_length=5000)
+    topics: List[Annotated[str, Field(pattern=TOPIC_PATTERN)]] = Field(default_factory=list, max_length=100)
+    payload: NotificationContent
+
+    @model_validator(mode="after")
+    def _has_target(self) -> "NotificationBatchItem":
+        if not self.employeeIds and not self.topics:
+            raise ValueError("employeeIds or topics is required")
+        return self
+
+
+class NotificationBatch(BaseModel):
+    items: List[NotificationBatchItem] = Field(min_length=1, max_length=500)
+
+
+class NotificationDelivery(BaseModel):
+    employeeId: int
+    delivered: bool
+    sessions: int
+
+
+class NotificationBatchOut(BaseModel):
+    eventIds: List[str]  # items 순서
+    results: List[NotificationDelivery]  # 대상 직원별 (처음 등장한 순서)
+
+
 @router.post("/notify", status_code=202)
-async def notify(payload: NotificationPayload):
+async def notify(payload: NotificationPayload, request: Request):
+    """
+    다른 서비스(Approval Processing SLA 알림 등)가 호출하는 REST 엔드포인트.
+    브로커 모드: notification exchange로 publish → 모든 레플리카가 자기 세션에 전달.
+    로컬 모드: 이 레플리카의 employeeId 세션 송신 큐에 바로 추가 (sessions = 큐에 넣은 세션 수).
+    """
+    message = payload.model_dump()
+    if NOTIFICATION_BROKER_ENABLED:
+        event_id = await publish_notification(request.app, message)
+        return {"delivered": True, "eventId": event_id}
+
+    sessions = manager.send_to_employee(payload.employeeId, message)
+    return {"delivered": True, "eventId": message["eventId"], "sessions": sessions}
+
+
+@router.post("/notify/batch", response_model=NotificationBatchOut)
+async def notify_batch(body: NotificationBatch, request: Request):
     """
-    다른 서비스(Approval Request 등)가 호출하는 REST 엔드포인트.
-    해당 employeeId의 모든 WebSocket 세션에 메시지 push.
+    여러 직원에게 보내는 알림을 한 번에 전달 (예: 결재 결과 → 요청자 + 결재자, 부서 전체 공지).
+    항목마다 본문은 1회만 직렬화해서 대상 직원의 모든 세션과 topics 구독 세션의 송신 큐에 넣는다.
+    topic 구독자에게 보낸 알림은 재접속 replay 대상이 아니다 (results에도 포함되지 않음).
+    브로커 모드에서는 메시지 1개로 publish하고 각 레플리카가 회신한 전달 결과를 합쳐서 보고한다
+    (NOTIFY_BATCH_REPORT_TIMEOUT_SECONDS 안에 회신이 없는 직원은 delivered=false, 버퍼에는 보관됨).
     """
-    await manager.send_to_employee(payload.employeeId, payload.model_dump())
-    return {"delivered": True}
+    entries = [
+        (item.employeeIds, item.topics, item.payload.model_dump()) for item in body.items
+    ]
+    if NOTIFICATION_BROKER_ENABLED:
+        sessions = await publish_batch(
+            request.app, entries, NOTIFY_BATCH_REPORT_TIMEOUT_SECONDS
+        )
+    else:
+        sessions = deliver_batch_locally(entries)
+
+    targets = dict.fromkeys(e for employee_ids, _, _ in entries for e in employee_ids)
+    return NotificationBatchOut(
+        eventIds=[payload["eventId"] for _, _, payload in entries],
+        results=[
+            NotificationDelivery(
+                employeeId=employee_id,
+                delivered=sessions.get(employee_id, 0) > 0,
+                sessions=sessions.get(employee_id, 0),
+            )
+            for employee_id in targets
+        ],
+    )
+
+
+@router.get("/stats")
+async def stats():
+    """WebSocket 연결 수, 송신 큐 깊이, 버린/합친 메시지 수, 제거된 세션 수."""
+    return manager.stats()
@@ -1,42 +1,721 @@
-from typing import Dict, Set
+import asyncio
+import json
+import logging
+import math
+import re
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 
-from fastapi import WebSocket
-from fastapi.websockets import WebSocketDisconnect
+import msgpack
+from fastapi import WebSocket, status
+
+from app.core.config import (
+    NOTIFICATION_BUFFER_MAX_EVENTS,
+    NOTIFICATION_BUFFER_PER_EMPLOYEE,
+    NOTIFICATION_REPLAY_WINDOW_SECONDS,
+    WS_CLOSE_TIMEOUT_SECONDS,
+    WS_HEARTBEAT_INTERVAL_SECONDS,
+    WS_IDLE_TIMEOUT_SECONDS,
+    WS_MAX_CONNECTIONS,
+    WS_MAX_CONNECTIONS_PER_EMPLOYEE,
+    WS_MAX_SUBSCRIPTIONS_PER_CONNECTION,
+    WS_OVERFLOW_POLICY,
+    WS_SEND_QUEUE_SIZE,
+    WS_SEND_TIMEOUT_SECONDS,
+)
+from app.core.event_buffer import Event, EventBuffer
+from app.core.event_id import event_id_floor, next_event_id, parse_event_id
+
+if TYPE_CHECKING:
+    from app.core.event_store import EventStore
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+# Sec-WebSocket-Protocol로 요청하면 알림을 msgpack 바이너리 프레임으로 보낸다 (기본은 JSON 텍스트)
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+# 세션별 전송 형식: JSON 텍스트 프레임 / msgpack 바이너리 프레임 / SSE 이벤트 (GET /events)
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+ENCODING_SSE = "sse"
+
+# 구독 가능한 topic: request:{requestId} (결재 문서 1건), department:{부서명}
+TOPIC_PATTERN = r"^(request|department):\S{1,64}$"
+_TOPIC_RE = re.compile(TOPIC_PATTERN)
+# 구독이 없는 연결은 빈 set을 따로 만들지 않고 공유
+_NO_TOPICS: AbstractSet[str] = frozenset()
+
+# 연결 종료 사유
+_SLOW = "slow"          # send 타임아웃
+_CLOSED = "closed"      # 이미 끊긴 소켓
+_OVERFLOW = "overflow"  # 송신 큐 초과 (disconnect 정책)
+_IDLE = "idle"          # idle timeout 동안 수신 없음 (응답 없는 클라이언트 / half-open 연결)
+_REPLACED = "replaced"  # 직원당 세션 수 초과로 가장 오래된 세션 정리
+
+# 종료 사유별 close code (_CLOSED는 close frame을 보내지 않음)
+_CLOSE_CODES = {
+    _SLOW: status.WS_1013_TRY_AGAIN_LATER,
+    _OVERFLOW: status.WS_1013_TRY_AGAIN_LATER,
+    _IDLE: status.WS_1001_GOING_AWAY,
+    _REPLACED: status.WS_1008_POLICY_VIOLATION,
+}
+
+
+def encode_message(message: dict) -> str:
+    """WebSocket.send_json과 같은 형식으로 1회만 직렬화."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+class Encoded:
+    """
+    메시지 1건의 직렬화 결과. 여러 세션의 송신 큐가 같은 객체를 공유한다.
+    JSON 텍스트는 만들 때 1회, msgpack / SSE 프레임은 해당 세션에 처음 보낼 때 1회만 만든다.
+    message가 없으면 (버퍼에 보관된 알림 등) JSON 텍스트를 다시 파싱해서 만든다.
+    event_id는 SSE id 필드 (브라우저가 재접속할 때 Last-Event-ID로 돌려준다).
+    """
+
+    __slots__ = ("text", "event_id", "_message", "_packed", "_sse")
+
+    def __init__(
+        self,
+        text: str,
+        message: Optional[dict] = None,
+        event_id: Optional[str] = None,
+        sse: Optional[str] = None,
+    ) -> None:
+        self.text = text
+        self.event_id = event_id
+        self._message = message
+        self._packed: Optional[bytes] = None
+        self._sse = sse
+
+    @classmethod
+    def of(cls, message: dict) -> "Encoded":
+        return cls(encode_message(message), message, message.get("eventId"))
+
+    @property
+    def packed(self) -> bytes:
+        if self._packed is None:
+            message = self._message if self._message is not None else json.loads(self.text)
+            self._packed = msgpack.packb(message)
+            self._message = None  # 더 이상 필요 없음
+        return self._packed
+
+    @property
+    def sse(self) -> str:
+        if self._sse is None:
+            # JSON은 줄바꿈을 escape하므로 data 한 줄로 충분
+            if self.event_id is not None:
+                self._sse = f"id: {self.event_id}\ndata: {self.text}\n\n"
+            else:
+                self._sse = f"data: {self.text}\n\n"
+        return self._sse
+
+
+def _for_recipient(data: Encoded, employee_id: int) -> Encoded:
+    """여러 직원에게 가는 알림에 받는 직원의 employeeId를 붙인 사본 (다시 직렬화하지 않고 JSON 앞에 끼워 넣음)."""
+    return Encoded(f'{{"employeeId":{employee_id},{data.text[1:]}', event_id=data.event_id)
+
+
+def ensure_event_id(message: dict) -> int:
+    """message의 eventId를 확인하고, 없거나 형식이 다르면 새로 발급해서 채운다."""
+    event_id = parse_event_id(message.get("eventId"))
+    if event_id is None:
+        event_id = next_event_id()
+    message["eventId"] = str(event_id)
+    return event_id
+
+
+# 서버 하트비트 (직렬화 1회, coalesce 정책이면 큐가 가득 찼을 때 대기 중인 ping은 1개만 유지)
+# SSE는 응답할 수 없으므로 주석 줄로 보낸다 (프록시 idle timeout 방지, EventSource는 무시)
+_PING = Encoded(encode_message({"type": "ping"}), sse=": ping\n\n")
+_PING_KEY = "ping"
+
+
+def encode_replay(events: List[Event]) -> str:
+    """재접속 시 놓친 알림을 한 번에 보내는 메시지 (이미 직렬화된 알림을 그대로 이어 붙임)."""
+    last = f'"{events[-1][0]}"' if events else "null"
+    body = ",".join(text for _, text in events)
+    return f'{{"type":"replay","lastEventId":{last},"events":[{body}]}}'
+
+
+class _Outbound:
+    """송신 큐 항목. coalesce 시 data만 최신 메시지로 바꾼다 (큐 안의 위치는 유지)."""
+
+    __slots__ = ("key", "data")
+
+    def __init__(self, key: Optional[Hashable], data: Encoded) -> None:
+        self.key = key
+        self.data = data
+
+
+class ClientConnection:
+    """
+    WebSocket 1개 + 송신 큐 + writer task.
+    enqueue는 큐에 넣기만 하고, 실제 전송은 writer task가 순서대로 한다.
+    수신(하트비트 응답)은 WebSocket 엔드포인트 task에서 read_loop로 처리한다.
+    """
+
+    # 프로세스당 수만 개가 만들어지므로 인스턴스 __dict__를 두지 않는다
+    __slots__ = (
+        "employee_id",
+        "websocket",
+        "encoding",
+        "max_queue",
+        "policy",
+        "send_timeout",
+        "_on_close",
+        "_queue",
+        "_pending",
+        "_ready",
+        "_writer",
+        "_read_timeout",
+        "closed",
+        "last_seen",
+        "topics",
+        "sent",
+        "dropped",
+        "coalesced",
+    )
+
+    def __init__(
+        self,
+        employee_id: int,
+        websocket: WebSocket,
+        on_close: Callable[["ClientConnection", str], None],
+        max_queue: int,
+        policy: str,
+        send_timeout: float,
+        encoding: str = ENCODING_JSON,
+    ) -> None:
+        self.employee_id = employee_id
+        self.websocket = websocket  # WebSocket 또는 SseChannel
+        self.encoding = encoding
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self._on_close = on_close
+        self._queue: Deque[_Outbound] = deque()
+        self._pending: Dict[Hashable, _Outbound] = {}  # coalesce key → 대기 중 항목
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._read_timeout: Optional[asyncio.Timeout] = None
+        self.closed = False
+        self.last_seen = asyncio.get_running_loop().time()  # 마지막 수신 시각 (loop.time)
+        self.topics: AbstractSet[str] = _NO_TOPICS  # 구독 중인 topic (첫 subscribe 때 set 생성)
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def stop(self) -> None:
+        self.closed = True
+        if self._writer and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        if self._read_timeout is not None and not self._read_timeout.expired():
+            # 수신 대기 중인 read_loop를 바로 깨워서 엔드포인트도 끝나게 한다
+            self._read_timeout.reschedule(0)
+
+    async def read_loop(
+        self,
+        heartbeat_interval: float,
+        idle_timeout: float,
+        on_message: Callable[["ClientConnection", Union[str, bytes]], None],
+    ) -> Optional[str]:
+        """
+        연결이 끝날 때까지 수신. 마지막 수신 시각을 갱신하고 받은 메시지는 on_message로 넘긴다.
+        heartbeat_interval 동안 수신이 없으면 ping을 보내고, idle_timeout이 지나면 _IDLE 반환.
+        (연결마다 task를 더 만들지 않고 receive에 timeout만 건다)
+        """
+        loop = asyncio.get_running_loop()
+        while not self.closed:
+            now = loop.time()
+            idle = now - self.last_seen
+            if idle >= idle_timeout:
+                return _IDLE
+            if idle >= heartbeat_interval:
+                self.enqueue(_PING, _PING_KEY)
+            # 다음 ping 시각(마지막 수신 + interval의 배수) 또는 idle 만료 중 빠른 쪽까지 대기
+            wait = min(
+                heartbeat_interval - idle % heartbeat_interval,
+                idle_timeout - idle,
+            )
+            try:
+                async with asyncio.timeout(wait) as self._read_timeout:
+                    message = await self.websocket.receive()
+            except TimeoutError:
+                continue
+            finally:
+                self._read_timeout = None
+            if message["type"] == "websocket.disconnect":
+                return None
+            self.last_seen = loop.time()
+            data = message.get("text") or message.get("bytes")
+            if data:
+                on_message(self, data)
+        return None
+
+    def enqueue(self, data: Encoded, key: Optional[Hashable] = None) -> bool:
+        """
+        메시지를 송신 큐에 추가. 연결을 끊어야 하면(disconnect 정책) False.
+        """
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if self.policy == "disconnect":
+                return False
+            # coalesce: 큐가 가득 찼을 때만 아직 보내지 않은 같은 key 메시지를 최신 것으로 교체
+            entry = self._pending.get(key) if self.policy == "coalesce" and key is not None else None
+            if entry is not None:
+                entry.data = data
+                self.coalesced += 1
+                return True
+            self._drop_oldest()
+
+        entry = _Outbound(key, data)
+        self._queue.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        self._ready.set()
+        return True
+
+    def _drop_oldest(self) -> None:
+        entry = self._queue.popleft()
+        if entry.key is not None and self._pending.get(entry.key) is entry:
+            del self._pending[entry.key]
+        self.dropped += 1
+
+    async def _write_loop(self) -> None:
+        reason = _CLOSED
+        try:
+            while True:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                entry = self._queue.popleft()
+                if entry.key is not None and self._pending.get(entry.key) is entry:
+                    del self._pending[entry.key]
+                async with asyncio.timeout(self.send_timeout):
+                    if self.encoding == ENCODING_JSON:
+                        await self.websocket.send_text(entry.data.text)
+                    elif self.encoding == ENCODING_MSGPACK:
+                        await self.websocket.send_bytes(entry.data.packed)
+                    else:
+                        await self.websocket.send_text(entry.data.sse)
+                self.sent += 1
+        except asyncio.CancelledError:
+            return
+        except TimeoutError:
+            reason = _SLOW
+        except Exception:
+            reason = _CLOSED
+        self._on_close(self, reason)
 
 
 class ConnectionManager:
     """
     employeeId별 WebSocket 연결 관리.
+    /notify는 세션별 송신 큐에 넣기만 하고 바로 반환하므로, 클라이언트가 느려도 응답 지연이 늘지 않는다.
+    send_timeout 안에 못 쓰는 소켓이나 (disconnect 정책에서) 큐가 넘친 소켓은 연결을 끊는다.
+    하트비트에 응답하지 않는 연결은 idle_timeout 후 정리하고, 프로세스/직원당 연결 수를 제한한다.
     """
-    def __init__(self) -> None:
-        self.active_connections: Dict[int, Set[WebSocket]] = {}
+    def __init__(
+        self,
+        send_timeout: float = WS_SEND_TIMEOUT_SECONDS,
+        close_timeout: float = WS_CLOSE_TIMEOUT_SECONDS,
+        max_queue: int = WS_SEND_QUEUE_SIZE,
+        policy: str = WS_OVERFLOW_POLICY,
+        heartbeat_interval: float = WS_HEARTBEAT_INTERVAL_SECONDS,
+        idle_timeout: float = WS_IDLE_TIMEOUT_SECONDS,
+        max_connections: int = WS_MAX_CONNECTIONS,
+        max_per_employee: int = WS_MAX_CONNECTIONS_PER_EMPLOYEE,
+        max_subscriptions: int = WS_MAX_SUBSCRIPTIONS_PER_CONNECTION,
+    ) -> None:
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown WS_OVERFLOW_POLICY: {policy!r}")
+        if idle_timeout <= heartbeat_interval:
+            raise ValueError("WS_IDLE_TIMEOUT_SECONDS must be greater than WS_HEARTBEAT_INTERVAL_SECONDS")
+        self.active_connections: Dict[int, Dict[WebSocket, ClientConnection]] = {}
+        self.send_timeout = send_timeout
+        self.close_timeout = close_timeout
+        self.max_queue = max_queue
+        self.policy = policy
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.max_connections = max_connections
+        self.max_per_employee = max_per_employee
+        self.max_subscriptions = max_subscriptions
+        # topic → 구독 중인 연결 (역색인). publish 비용은 구독자 수에만 비례한다.
+        self.topics: Dict[str, Set[ClientConnection]] = {}
+        self.topic_deliveries = 0
+        self.connection_count = 0
+        self.rejected = 0
+        self.evicted_slow = 0
+        self.evicted_closed = 0
+        self.evicted_overflow = 0
+        self.evicted_idle = 0
+        self.evicted_replaced = 0
+        # 끊긴 연결의 카운터 누적 (stats용)
+        self._closed_sent = 0
+        self._closed_dropped = 0
+        self._closed_coalesced = 0
+        # 진행 중인 close task (GC 방지)
+        self._closing: set = set()
+        # 오프라인 / 재접속 사이에 놓친 알림 재전송용
+        self.buffer = EventBuffer(NOTIFICATION_BUFFER_PER_EMPLOYEE, NOTIFICATION_BUFFER_MAX_EVENTS)
+        self.store: Optional["EventStore"] = None
+        self.replayed = 0
+
+    async def connect(
+        self,
+        employee_id: int,
+        websocket: WebSocket,
+        last_event_id: Optional[int] = None,
+        encoding: Optional[str] = None,
+    ) -> Optional[ClientConnection]:
+        """
+        세션 등록. last_event_id가 있으면 그 이후 알림을 replay 메시지 1개로 먼저 보낸다.
+        (등록과 replay 사이에 await가 없으므로 새 알림과 순서가 섞이거나 빠지지 않는다)
+        프로세스 연결 수가 max_connections에 도달했으면 close 1013으로 거부하고 None 반환.
+        encoding을 지정하지 않으면 (WebSocket) 클라이언트가 msgpack 서브프로토콜을 요청했는지로 정한다.
+        """
+        if encoding is None:
+            msgpack_requested = MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+            encoding = ENCODING_MSGPACK if msgpack_requested else ENCODING_JSON
+        await websocket.accept(
+            subprotocol=MSGPACK_SUBPROTOCOL if encoding == ENCODING_MSGPACK else None
+        )
+        if self.max_connections and self.connection_count >= self.max_connections:
+            self.rejected += 1
+            await self._close(websocket, status.WS_1013_TRY_AGAIN_LATER)
+            return None
+
+        stored: List[Event] = []
+        floor = 0
+        if last_event_id is not None:
+            floor = event_id_floor(last_event_id, int(NOTIFICATION_REPLAY_WINDOW_SECONDS * 1000))
+        if (
+            last_event_id is not None
+            and self.store is not None
+            and not self.buffer.covers(employee_id, last_event_id, floor)
+        ):
+            stored = await self.store.since(
+                employee_id,
+                last_event_id,
+                floor,
+                NOTIFICATION_REPLAY_WINDOW_SECONDS,
+                self.buffer.per_employee,
+            )
+
+        conn = ClientConnection(
+            employee_id,
+            websocket,
+            on_close=self._on_connection_closed,
+            max_queue=self.max_queue,
+            policy=self.policy,
+            send_timeout=self.send_timeout,
+            encoding=encoding,
+        )
+        existing = self.active_connections.get(employee_id)
+        if self.max_per_employee and existing and len(existing) >= self.max_per_employee:
+            # 가장 먼저 접속한 세션부터 (dict 삽입 순서)
+            for old in list(existing.values())[: len(existing) - self.max_per_employee + 1]:
+                self._on_connection_closed(old, _REPLACED)
+        self.active_connections.setdefault(employee_id, {})[websocket] = conn
+        self.connection_count += 1
+        if last_event_id is not None:
+            events = self._missed_events(employee_id, last_event_id, floor, stored)
+            conn.enqueue(
+                Encoded(encode_replay(events), event_id=str(events[-1][0]) if events else None)
+            )
+            self.replayed += len(events)
+        conn.start()
+        return conn
+
+    async def serve(self, conn: ClientConnection) -> None:
+        """
+        엔드포인트에서 연결이 끝날 때까지 실행 (수신 + 하트비트 + idle 정리).
+        SSE는 클라이언트가 ping에 응답할 수 없으므로 idle 정리 없이 전송 실패/타임아웃으로만 정리한다.
+        """
+        idle_timeout = math.inf if conn.encoding == ENCODING_SSE else self.idle_timeout
+        reason = await conn.read_loop(self.heartbeat_interval, idle_timeout, self._on_client_message)
+        if reason is not None:
+            self._on_connection_closed(conn, reason)
+        else:
+            self.disconnect(conn.employee_id, conn.websocket)
 
-    async def connect(self, employee_id: int, websocket: WebSocket) -> None:
-        await websocket.accept()
-        self.active_connections.setdefault(employee_id, set()).add(websocket)
+    def _missed_events(
+        self, employee_id: int, last_event_id: int, floor: int, stored: List[Event]
+    ) -> List[Event]:
+        """
+        MongoDB에서 읽은 알림 + 메모리 버퍼의 알림 (도착 순, eventId 중복 제거).
+        eventId는 프로세스 간 순서가 보장되지 않으므로 크기로 자르지 않는다.
+        시간 창 때문에 이미 받은 알림이 섞여 올 수 있어 클라이언트가 eventId로 중복 제거한다.
+        """
+        events = dict(stored)
+        for event_id, text in self.buffer.since(employee_id, last_event_id, floor):
+            events.setdefault(event_id, text)
+        ordered = list(events.items())
+        return ordered[-self.buffer.per_employee:] if self.buffer.per_employee > 0 else []
 
     def disconnect(self, employee_id: int, websocket: WebSocket) -> None:
         conns = self.active_connections.get(employee_id)
         if not conns:
             return
-        conns.discard(websocket)
+        conn = conns.pop(websocket, None)
         if not conns:
             self.active_connections.pop(employee_id, None)
+        if conn is not None:
+            self.connection_count -= 1
+            for topic in conn.topics:
+                self._drop_subscriber(topic, conn)
+            conn.stop()
+            self._closed_sent += conn.sent
+            self._closed_dropped += conn.dropped
+            self._closed_coalesced += conn.coalesced
 
-    async def send_to_employee(self, employee_id: int, message: dict) -> None:
-        conns = list(self.active_connections.get(employee_id, []))
-        to_remove: list[WebSocket] = []
+    async def _close(self, ws: WebSocket, code: int) -> None:
+        try:
+            async with asyncio.timeout(self.close_timeout):
+                await ws.close(code=code)
+        except Exception:
+            pass
 
-        for ws in conns:
-            try:
-                await ws.send_json(message)
-            except WebSocketDisconnect:
-                to_remove.append(ws)
-            except Exception:
-                to_remove.append(ws)
-
-        for ws in to_remove:
-            self.disconnect(employee_id, ws)
+    def _on_connection_closed(self, conn: ClientConnection, reason: str) -> None:
+        """
+        writer task 종료 / 큐 초과 / idle / 세션 수 초과 시 연결 제거.
+        아직 열려 있을 수 있는 연결에는 사유별 close frame도 보낸다.
+        """
+        if conn.closed:
+            return
+        self.disconnect(conn.employee_id, conn.websocket)
+        if reason == _CLOSED:
+            self.evicted_closed += 1
+            return
+
+        if reason == _SLOW:
+            self.evicted_slow += 1
+        elif reason == _IDLE:
+            self.evicted_idle += 1
+        elif reason == _REPLACED:
+            self.evicted_replaced += 1
+        else:
+            self.evicted_overflow += 1
+        logger.warning(
+            "Evicting WebSocket",
+            extra={"employeeId": conn.employee_id, "reason": reason},
+        )
+        # close도 막힐 수 있으므로 기다리지 않는다
+        task = asyncio.create_task(self._close(conn.websocket, _CLOSE_CODES[reason]))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def send_to_employee(self, employee_id: int, message: dict) -> int:
+        """
+        employeeId의 모든 세션 송신 큐에 message 추가 (전송은 세션별 writer task가 담당).
+        접속 중이 아니어도 버퍼에 남겨서 재접속 시 lastEventId로 다시 받을 수 있게 한다.
+        큐에 넣은 세션 수를 반환.
+        """
+        return self.send_to_employees([employee_id], message)[employee_id]
+
+    def send_to_employees(
+        self,
+        employee_ids: Iterable[int],
+        message: dict,
+        topics: Collection[str] = (),
+    ) -> Dict[int, int]:
+        """
+        같은 message를 여러 직원 + topic 구독자에게 전달. 직렬화는 1회, eventId도 1개를 공유한다.
+        message에 employeeId가 없으면 직원별로 받는 직원의 employeeId를 붙여 보낸다 (topic 구독자에게는 붙이지 않음).
+        대상 직원 본인의 세션은 topic을 구독하고 있어도 1번만 받는다.
+        employeeId별로 큐에 넣은 세션 수를 반환 (topic 구독자 수는 stats의 topicDeliveries).
+        """
+        event_id = ensure_event_id(message)
+        data = Encoded.of(message)
+        # 같은 결재 문서의 같은 종류 알림끼리만 coalesce (결과 / 리마인더 / 회수는 따로 유지)
+        key = (message.get("type"), message["requestId"]) if message.get("requestId") is not None else None
+        targets = dict.fromkeys(employee_ids)
+        per_recipient = "employeeId" not in message
+        sessions = {
+            employee_id: self._deliver(
+                employee_id,
+                event_id,
+                _for_recipient(data, employee_id) if per_recipient else data,
+                key,
+            )
+            for employee_id in targets
+        }
+        if topics:
+            self._publish(topics, data, key, targets)
+        return sessions
+
+    def _publish(self, topics: Collection[str], data: Encoded, key: Optional[Hashable], skip: Dict[int, None]) -> int:
+        """topic 구독 세션의 송신 큐에 추가 (여러 topic을 구독한 세션도 1번만). 큐에 넣은 세션 수 반환."""
+        seen: Set[ClientConnection] = set()
+        queued = 0
+        for topic in dict.fromkeys(topics):
+            subscribers = self.topics.get(topic)
+            if not subscribers:
+                continue
+            for conn in list(subscribers):
+                if conn.employee_id in skip or conn in seen:
+                    continue
+                seen.add(conn)
+                if conn.enqueue(data, key):
+                    queued += 1
+                else:
+                    self._on_connection_closed(conn, _OVERFLOW)
+        self.topic_deliveries += queued
+        return queued
+
+    # ---- topic 구독 ----
+
+    def _on_client_message(self, conn: ClientConnection, raw: Union[str, bytes]) -> None:
+        """
+        클라이언트 메시지 처리 (텍스트는 JSON, 바이너리는 msgpack).
+          {"type": "subscribe", "topics": ["request:4", "department:개발팀"]}
+          {"type": "unsubscribe", "topics": ["request:4"]}
+        처리 후 현재 구독 목록을 {"type": "subscriptions", "topics": [...], "rejected": [...]}로 보낸다.
+        pong 등 다른 메시지는 무시.
+        """
+        if conn.closed:
+            return
+        try:
+            if isinstance(raw, bytes):
+                data = msgpack.unpackb(raw)
+            elif 'subscribe"' in raw:
+                data = json.loads(raw)
+            else:
+                return  # pong 등은 파싱하지 않는다
+        except (ValueError, TypeError):
+            return
+        if not isinstance(data, dict) or data.get("type") not in ("subscribe", "unsubscribe"):
+            return
+        topics = data.get("topics")
+        if not isinstance(topics, list):
+            topics = []
+
+        if data["type"] == "subscribe":
+            rejected = self.subscribe(conn, topics)
+        else:
+            self.unsubscribe(conn, topics)
+            rejected = []
+        conn.enqueue(
+            Encoded.of({"type": "subscriptions", "topics": sorted(conn.topics), "rejected": rejected})
+        )
+
+    def subscribe(self, conn: ClientConnection, topics: List[object]) -> List[str]:
+        """
+        topic 구독 추가. 형식이 틀렸거나 연결당 구독 수(max_subscriptions)를 넘는 topic 목록을 반환.
+        요청 1건에서 max_subscriptions개 이후의 항목은 보지 않는다.
+        """
+        rejected: List[str] = []
+        for topic in topics[: self.max_subscriptions]:
+            if not isinstance(topic, str) or not _TOPIC_RE.match(topic):
+                rejected.append(str(topic)[:100])
+                continue
+            if topic in conn.topics:
+                continue
+            if len(conn.topics) >= self.max_subscriptions:
+                rejected.append(topic)
+                continue
+            if not conn.topics:
+                conn.topics = set()
+            conn.topics.add(topic)
+            self.topics.setdefault(topic, set()).add(conn)
+        return rejected
+
+    def unsubscribe(self, conn: ClientConnection, topics: List[object]) -> None:
+        for topic in topics:
+            if isinstance(topic, str) and topic in conn.topics:
+                conn.topics.discard(topic)
+                self._drop_subscriber(topic, conn)
+
+    def _drop_subscriber(self, topic: str, conn: ClientConnection) -> None:
+        subscribers = self.topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(conn)
+            if not subscribers:
+                del self.topics[topic]
+
+    def _deliver(self, employee_id: int, event_id: int, data: Encoded, key: Optional[Hashable]) -> int:
+        self.buffer.append(employee_id, event_id, data.text)
+        if self.store is not None:
+            self.store.save(employee_id, event_id, data.text)
+
+        conns = self.active_connections.get(employee_id)
+        if not conns:
+            return 0
+
+        queued = 0
+        for conn in list(conns.values()):
+            if conn.enqueue(data, key):
+                queued += 1
+            else:
+                self._on_connection_closed(conn, _OVERFLOW)
+        return queued
+
+    async def close_all(self) -> None:
+        for conns in list(self.active_connections.values()):
+            for conn in list(conns.values()):
+                self.disconnect(conn.employee_id, conn.websocket)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def stats(self) -> dict:
+        conns = [c for cs in self.active_connections.values() for c in cs.values()]
+        depths = [c.depth for c in conns]
+        return {
+            "employees": len(self.active_connections),
+            "connections": len(conns),
+            "msgpackConnections": sum(1 for c in conns if c.encoding == ENCODING_MSGPACK),
+            "sseConnections": sum(1 for c in conns if c.encoding == ENCODING_SSE),
+            "maxConnections": self.max_connections,
+            "rejected": self.rejected,
+            "overflowPolicy": self.policy,
+            "queueCapacity": self.max_queue,
+            "queueDepthTotal": sum(depths),
+            "queueDepthMax": max(depths, default=0),
+            # 큐가 절반 이상 찬 연결 수 (느려지기 시작한 클라이언트)
+            "connectionsOverHalf": sum(1 for d in depths if d * 2 >= self.max_queue),
+            "sent": self._closed_sent + sum(c.sent for c in conns),
+            "dropped": self._closed_dropped + sum(c.dropped for c in conns),
+            "coalesced": self._closed_coalesced + sum(c.coalesced for c in conns),
+            "evictedSlow": self.evicted_slow,
+            "evictedClosed": self.evicted_closed,
+            "evictedOverflow": self.evicted_overflow,
+            "evictedIdle": self.evicted_idle,
+            "evictedReplaced": self.evicted_replaced,
+            "topics": len(self.topics),
+            "subscriptions": sum(len(s) for s in self.topics.values()),
+            "topicDeliveries": self.topic_deliveries,
+            "replayedEvents": self.replayed,
+            "storeDropped": self.store.dropped if self.store is not None else 0,
+            **self.buffer.stats(),
+        }
 
 
 manager = ConnectionManager()
@@ -0,0 +1,93 @@
+from collections import OrderedDict, deque
+from typing import Deque, List, Tuple
+
+# (eventId, 직렬화된 JSON)
+Event = Tuple[int, str]
+
+
+class EventBuffer:
+    """
+    직원별 최근 알림 ring buffer.
+    - 직원 1명당 per_employee개까지 (넘으면 가장 오래된 알림 삭제)
+    - 전체 max_events개까지 (넘으면 가장 오래 알림이 없던 직원의 가장 오래된 알림부터 삭제)
+    직원 순서는 OrderedDict로 관리해서 추가/삭제 모두 O(1).
+    """
+
+    def __init__(self, per_employee: int, max_events: int) -> None:
+        self.per_employee = per_employee
+        self.max_events = max_events
+        self._buffers: "OrderedDict[int, Deque[Event]]" = OrderedDict()
+        self._size = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, employee_id: int, event_id: int, text: str) -> None:
+        if self.per_employee <= 0 or self.max_events <= 0:
+            return
+        buf = self._buffers.get(employee_id)
+        if buf is None:
+            buf = self._buffers[employee_id] = deque()
+        else:
+            self._buffers.move_to_end(employee_id)
+        buf.append((event_id, text))
+        self._size += 1
+
+        if len(buf) > self.per_employee:
+            buf.popleft()
+            self._size -= 1
+            self.evicted += 1
+
+        while self._size > self.max_events:
+            oldest_id, oldest = next(iter(self._buffers.items()))
+            oldest.popleft()
+            self._size -= 1
+            self.evicted += 1
+            if not oldest:
+                del self._buffers[oldest_id]
+
+    def since(self, employee_id: int, last_event_id: int, floor_event_id: int) -> List[Event]:
+        """
+        재접속 replay 대상 (도착 순).
+        - 이 레플리카에 last_event_id보다 나중에 도착한 알림 전부
+        - 그보다 먼저 도착했어도 eventId가 floor_event_id 이상인 알림
+          (다른 프로세스가 발급한 eventId는 순서가 어긋날 수 있으므로 시간 창만큼 다시 보냄, 클라이언트가 중복 제거)
+        last_event_id가 버퍼에 없으면 (0, 오래돼서 밀려남 등) floor_event_id 이상만.
+        """
+        buf = self._buffers.get(employee_id)
+        if not buf:
+            return []
+        position = self._position(buf, last_event_id)
+        if position < 0:
+            position = len(buf)
+        return [
+            event
+            for index, event in enumerate(buf)
+            if event[0] != last_event_id and (index > position or event[0] >= floor_event_id)
+        ]
+
+    def covers(self, employee_id: int, last_event_id: int, floor_event_id: int) -> bool:
+        """
+        since()에 필요한 알림을 메모리에 빠짐없이 갖고 있는지.
+        last_event_id가 버퍼에 남아 있거나, 버퍼의 가장 오래된 알림이 시간 창보다 오래됐으면 그 뒤는 모두 남아 있다.
+        """
+        buf = self._buffers.get(employee_id)
+        if not buf:
+            return False
+        return buf[0][0] < floor_event_id or self._position(buf, last_event_id) >= 0
+
+    @staticmethod
+    def _position(buf: Deque[Event], event_id: int) -> int:
+        # 최근 것부터 찾는다 (직원당 per_employee개 이하)
+        for index in range(len(buf) - 1, -1, -1):
+            if buf[index][0] == event_id:
+                return index
+        return -1
+
+    def stats(self) -> dict:
+        return {
+            "bufferedEvents": self._size,
+            "bufferedEmployees": len(self._buffers),
+            "bufferEvicted": self.evicted,
+        }
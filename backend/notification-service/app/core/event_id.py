@@ -0,0 +1,65 @@
+import os
+import socket
+import threading
+import time
+import zlib
+
+# 알림 eventId: 시간순으로 증가하는 63bit 정수 (snowflake 방식)
+#   [41bit: 2020-01-01 기준 ms][10bit: 프로세스 id][12bit: 같은 ms 안의 순번]
+# 여러 프로세스(approval-request-service, notification-service 레플리카)가 따로 발급하므로
+# 프로세스 사이에서는 "대략" 시간순일 뿐이다 (시계 차이 / 전달 지연). 순서에 기대지 말 것:
+# 재접속 replay는 eventId 크기가 아니라 도착 순서 + 시간 창으로 고르고 클라이언트가 eventId로 중복 제거한다.
+# JSON에서는 JS Number 범위를 넘으므로 문자열로 전달.
+_EPOCH_MS = 1577836800000
+_WORKER_BITS = 10
+_SEQUENCE_BITS = 12
+_SEQUENCE_MASK = (1 << _SEQUENCE_BITS) - 1
+
+_TIME_SHIFT = _WORKER_BITS + _SEQUENCE_BITS
+
+
+def _worker_id() -> int:
+    """
+    EVENT_ID_WORKER_ID(0~1023)를 프로세스마다 다르게 주면 eventId가 절대 겹치지 않는다.
+    없으면 hostname(= pod 이름) + pid에서 만든다 (무작위보다는 낫지만 겹칠 수 있음).
+    """
+    configured = os.getenv("EVENT_ID_WORKER_ID")
+    if configured:
+        return int(configured) & ((1 << _WORKER_BITS) - 1)
+    return zlib.crc32(f"{socket.gethostname()}:{os.getpid()}".encode()) & ((1 << _WORKER_BITS) - 1)
+
+
+_WORKER_ID = _worker_id()
+_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+
+
+def next_event_id() -> int:
+    """프로세스 안에서 단조 증가하는 eventId 발급."""
+    global _last_ms, _sequence
+    with _lock:
+        now = int(time.time() * 1000) - _EPOCH_MS
+        if now <= _last_ms:
+            # 같은 ms (또는 시계가 뒤로 간 경우): 순번 증가, 넘치면 다음 ms를 미리 사용
+            _sequence = (_sequence + 1) & _SEQUENCE_MASK
+            if _sequence == 0:
+                _last_ms += 1
+        else:
+            _last_ms = now
+            _sequence = 0
+        return (_last_ms << _TIME_SHIFT) | (_WORKER_ID << _SEQUENCE_BITS) | _sequence
+
+
+def parse_event_id(value) -> int | None:
+    """문자열/정수 eventId → int. 형식이 맞지 않으면 None."""
+    try:
+        event_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return event_id if event_id >= 0 else None
+
+
+def event_id_floor(event_id: int, window_ms: int) -> int:
+    """event_id가 발급된 시각보다 window_ms 앞선 시각에 발급될 수 있는 가장 작은 eventId."""
+    return max((event_id >> _TIME_SHIFT) - window_ms, 0) << _TIME_SHIFT
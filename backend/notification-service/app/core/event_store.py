@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from bson.int64 import Int64
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError, CollectionInvalid
+
+from app.core.config import (
+    NOTIFICATION_EVENTS_CAP_BYTES,
+    NOTIFICATION_EVENTS_COLLECTION,
+    NOTIFICATION_MONGODB_DB_NAME,
+    NOTIFICATION_MONGODB_URI,
+)
+from app.core.event_buffer import Event
+
+logger = logging.getLogger(__name__)
+
+# 저장 대기 알림 수 상한 (MongoDB가 느려도 메모리가 늘지 않도록, 넘치면 버린다)
+_PENDING_LIMIT = 10_000
+_BATCH_SIZE = 500
+
+
+class EventStore:
+    """
+    알림을 MongoDB capped collection에 저장 (오래된 것부터 자동 삭제).
+    문서: {_id: "employeeId:eventId", employeeId, eventId, storedAt, body: 직렬화된 JSON}
+    (여러 직원에게 보낸 알림은 eventId가 같으므로 _id는 직원별로 만든다)
+    fanout으로 모든 레플리카가 같은 알림을 저장하려 하므로 _id 중복은 무시한다.
+    storedAt은 저장한 레플리카의 시각으로, 재접속 replay를 eventId 크기가 아니라 도착 시각으로 고르는 데 쓴다.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection) -> None:
+        self._collection = collection
+        # None은 stop()이 넣는 종료 표시
+        self._pending: "asyncio.Queue[Optional[dict]]" = asyncio.Queue(maxsize=_PENDING_LIMIT)
+        self._writer: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self) -> None:
+        """대기 중인 알림을 모두 저장한 뒤 writer 종료 (저장 중인 batch를 취소하지 않는다)."""
+        if self._writer:
+            # 큐가 가득 차 있으면 writer가 비울 때까지 기다린다
+            await self._pending.put(None)
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+
+    def save(self, employee_id: int, event_id: int, text: str) -> None:
+        try:
+            self._pending.put_nowait(
+                {
+                    "_id": f"{employee_id}:{event_id}",
+                    "employeeId": employee_id,
+                    "eventId": Int64(event_id),
+                    "storedAt": datetime.utcnow(),
+                    "body": text,
+                }
+            )
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _drain(self, docs: List[dict]) -> bool:
+        """큐에 있는 알림을 _BATCH_SIZE까지 docs에 옮긴다. 종료 표시(None)를 만나면 True."""
+        while not self._pending.empty() and len(docs) < _BATCH_SIZE:
+            doc = self._pending.get_nowait()
+            if doc is None:
+                return True
+            docs.append(doc)
+        return False
+
+    async def _flush(self, docs: List[dict]) -> None:
+        if not docs:
+            return
+        try:
+            await self._collection.insert_many(docs, ordered=False)
+        except BulkWriteError as exc:
+            # 다른 레플리카가 먼저 저장한 알림 (duplicate key)은 정상
+            errors = [e for e in exc.details.get("writeErrors", []) if e.get("code") != 11000]
+            if errors:
+                logger.warning("Failed to store notifications", extra={"errors": len(errors)})
+        except Exception:
+            logger.warning("Failed to store notifications", exc_info=True)
+
+    async def _write_loop(self) -> None:
+        while True:
+            first = await self._pending.get()
+            docs: List[dict] = []
+            stopping = first is None
+            if not stopping:
+                docs.append(first)
+                stopping = self._drain(docs)
+            await self._flush(docs)
+            if stopping:
+                # 종료 표시 이후에 들어온 알림까지 batch 단위로 모두 저장
+                while not self._pending.empty():
+                    docs = []
+                    self._drain(docs)
+                    await self._flush(docs)
+                return
+
+    async def since(
+        self,
+        employee_id: int,
+        last_event_id: int,
+        floor_event_id: int,
+        window_seconds: float,
+        limit: int,
+    ) -> List[Event]:
+        """
+        재접속 replay 대상 중 최근 limit개 (저장 순).
+        - last_event_id가 저장된 시각(storedAt)에서 window_seconds를 뺀 시각 이후에 저장된 알림
+          (레플리카 사이 시계 차이만큼 여유를 둔다)
+        - 또는 eventId가 floor_event_id 이상인 알림 (last_event_id 문서가 없을 때, storedAt이 없는 예전 문서)
+        이미 받은 알림이 섞일 수 있으며 클라이언트가 eventId로 중복 제거한다.
+        """
+        conditions: List[dict] = [{"eventId": {"$gte": Int64(floor_event_id)}}]
+        last = await self._collection.find_one({"_id": f"{employee_id}:{last_event_id}"}, {"storedAt": 1})
+        if last is not None and last.get("storedAt") is not None:
+            since_at = last["storedAt"] - timedelta(seconds=window_seconds)
+            conditions.append({"storedAt": {"$gte": since_at}})
+        cursor = (
+            self._collection.find({"employeeId": employee_id, "$or": conditions})
+            .sort("storedAt", -1)
+            .limit(limit)
+        )
+        docs = await cursor.to_list(length=limit)
+        return [(_event_id(d), d["body"]) for d in reversed(docs) if _event_id(d) != last_event_id]
+
+    async def recent(self, limit: int) -> List[Tuple[int, int, str]]:
+        """재시작 시 메모리 버퍼를 채우기 위한 최근 알림 (employeeId, eventId, body), 오래된 것부터."""
+        cursor = self._collection.find().sort("$natural", -1).limit(limit)
+        docs = await cursor.to_list(length=limit)
+        return [(d["employeeId"], _event_id(d), d["body"]) for d in reversed(docs)]
+
+
+def _event_id(doc: dict) -> int:
+    # 예전 문서는 eventId 필드 없이 _id에 eventId(Int64)를 저장했다
+    return int(doc["eventId"] if "eventId" in doc else doc["_id"])
+
+
+async def open_event_store() -> Optional[EventStore]:
+    """NOTIFICATION_MONGODB_URI가 설정된 경우에만 capped collection 준비."""
+    if not NOTIFICATION_MONGODB_URI:
+        return None
+    db = AsyncIOMotorClient(NOTIFICATION_MONGODB_URI)[NOTIFICATION_MONGODB_DB_NAME]
+    try:
+        await db.create_collection(
+            NOTIFICATION_EVENTS_COLLECTION,
+            capped=True,
+            size=NOTIFICATION_EVENTS_CAP_BYTES,
+        )
+    except CollectionInvalid:
+        pass  # 이미 존재
+    collection = db[NOTIFICATION_EVENTS_COLLECTION]
+    await collection.create_index([("employeeId", 1), ("eventId", 1)])
+    await collection.create_index([("employeeId", 1), ("storedAt", 1)])
+    store = EventStore(collection)
+    store.start()
+    return store
@@ -0,0 +1,184 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+# ---- 로깅 설정 (환경 변수) ----
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# json: 한 줄에 JSON 1개 (로그 수집기용) / text: 사람이 읽는 형식 (로컬 개발용)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# 로거별 샘플링 비율 (WARNING 미만만 적용), 하위 로거에도 적용된다.
+# 예: "app.core.rabbitmq=0.01,app.grpc_server=0.1" → rabbitmq 로그는 100건 중 1건만 출력
+LOG_SAMPLING = os.getenv("LOG_SAMPLING", "")
+
+# LogRecord 기본 속성: 이 외의 속성은 logger.info(..., extra={...})로 넘어온 필드
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, object]:
+    return {
+        key: value
+        for key, value in record.__dict__.items()
+        if key not in _RESERVED_ATTRS and not key.startswith("_")
+    }
+
+
+class JsonFormatter(logging.Formatter):
+    """LogRecord → 한 줄 JSON. extra로 넘긴 필드는 최상위 키로 포함."""
+
+    def __init__(self, service: str) -> None:
+        super().__init__()
+        self.service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "service": self.service,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(_extra_fields(record))
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 한 줄 형식. extra로 넘긴 필드는 메시지 뒤에 key=value로 붙인다."""
+
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        text = super().formatMessage(record)
+        extras = _extra_fields(record)
+        if not extras:
+            return text
+        return text + " " + " ".join(f"{key}={value}" for key, value in extras.items())
+
+
+def _parse_sampling(raw: str) -> Dict[str, float]:
+    rates = {}
+    for pair in raw.split(","):
+        if "=" in pair:
+            name, rate = pair.split("=", 1)
+            rates[name.strip()] = min(max(float(rate), 0.0), 1.0)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """
+    로거별로 N건 중 1건만 통과시키는 필터 (WARNING 이상은 항상 통과).
+    난수 대신 카운터를 써서 비용이 작고 비율이 정확하다.
+    통과한 레코드에는 sample_rate가 붙는다 (실제 건수 = 출력 건수 / sample_rate).
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        super().__init__()
+        self._rates = rates
+        # logger 이름 → (비율, 몇 건마다 1건) / 카운터
+        self._resolved: Dict[str, Optional[Tuple[float, int]]] = {}
+        self._counters: Dict[str, int] = {}
+
+    def _resolve(self, name: str) -> Optional[Tuple[float, int]]:
+        if name not in self._resolved:
+            rate = None
+            # 가장 구체적인(긴) 상위 로거 이름의 설정을 사용
+            probe = name
+            while probe:
+                if probe in self._rates:
+                    rate = self._rates[probe]
+                    break
+                probe = probe.rpartition(".")[0]
+            if rate is None or rate >= 1.0:
+                self._resolved[name] = None
+            else:
+                self._resolved[name] = (rate, int(1 / rate) if rate > 0 else 0)
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        setting = self._resolve(record.name)
+        if setting is None:
+            return True
+        rate, every = setting
+        if every == 0:
+            return False
+        count = self._counters.get(record.name, 0)
+        self._counters[record.name] = count + 1
+        if count % every:
+            return False
+        record.sample_rate = rate
+        return True
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    같은 프로세스 안의 QueueListener로만 넘기므로 pickle을 위한 prepare(메시지 포맷)를 생략.
+    포맷팅/직렬화/stdout 쓰기는 모두 listener 쓰레드에서 일어난다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+# shutdown_logging 후 root에 직접 붙일 stdout 핸들러 (샘플링 필터도 옮겨 붙인다)
+_stream: Optional[logging.Handler] = None
+_sampling: Optional[SamplingFilter] = None
+
+
+def setup_logging(service: str) -> None:
+    """
+    root 로거 → QueueHandler → (별도 쓰레드) QueueListener → stdout.
+    이벤트 루프에서는 LogRecord를 큐에 넣는 것까지만 하고 바로 반환한다.
+    """
+    global _listener, _stream, _sampling
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter(service) if LOG_FORMAT == "json" else TextFormatter())
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = _InProcessQueueHandler(log_queue)
+    rates = _parse_sampling(LOG_SAMPLING)
+    if rates:
+        _sampling = SamplingFilter(rates)
+        handler.addFilter(_sampling)
+
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(LOG_LEVEL)
+
+    # uvicorn은 자체 stdout 핸들러를 붙이므로 root로 모아서 같은 형식/같은 쓰레드로 출력
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    _stream = stream
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """
+    큐에 남은 로그를 모두 출력하고 listener 쓰레드 종료.
+    이후 로그(uvicorn의 "Application shutdown complete" 등)는 root에서 stdout으로 직접 출력한다.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        if _sampling is not None:
+            _stream.addFilter(_sampling)
+        logging.getLogger().handlers[:] = [_stream]
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Dict, List, Optional, Set, Tuple
+
+import aio_pika
+from aio_pika import ExchangeType, IncomingMessage, Message
+from fastapi import FastAPI
+
+from app.core.config import RABBITMQ_URL
+from app.core.connection_manager import ensure_event_id, manager
+
+# approval-request-service와 같은 이름 / 타입이어야 선언 인자가 충돌하지 않는다
+NOTIFICATION_EXCHANGE = "notification"
+
+logger = logging.getLogger(__name__)
+
+# (대상 employeeId 목록, 대상 topic 목록, 알림 본문)
+Entry = Tuple[List[int], List[str], dict]
+
+# 레플리카 식별자 (전달 결과 회신 / 레플리카 목록 관리용)
+REPLICA_ID = uuid.uuid4().hex
+# 제어 메시지 종류 (AMQP type 속성). 알림 메시지에는 type이 없다
+_HELLO = "replica.hello"   # 시작 시 fanout: 다른 레플리카가 자기를 알리도록 요청
+_PEER = "replica.peer"     # hello에 대한 회신 (reply 큐로 직접)
+_BYE = "replica.bye"       # 종료 시 fanout
+
+
+class _Report:
+    """
+    batch 1건에 대해 레플리카들이 보내온 전달 결과 (employeeId → 세션 수 합계).
+    모든 대상 직원의 전달이 확인되거나, 알고 있는 레플리카가 모두 회신하면 완료.
+    """
+
+    def __init__(self, targets: Set[int], replicas: Set[str]) -> None:
+        self.remaining = set(targets)
+        self.waiting = set(replicas)
+        self.sessions: Dict[int, int] = {}
+        self.done = asyncio.Event()
+        if not self.remaining:  # topic만 대상이면 기다릴 회신이 없다
+            self.done.set()
+
+    def add(self, replica: Optional[str], sessions: Dict[int, int]) -> None:
+        for employee_id, count in sessions.items():
+            self.sessions[employee_id] = self.sessions.get(employee_id, 0) + count
+            self.remaining.discard(employee_id)
+        self.waiting.discard(replica)
+        if not self.remaining or not self.waiting:
+            self.done.set()
+
+
+_reports: Dict[str, _Report] = {}
+# fanout exchange에 바인딩된 것으로 알고 있는 레플리카 (자기 자신 포함)
+_replicas: Set[str] = {REPLICA_ID}
+# 전달 결과 회신용 (default exchange → reply_to 큐)
+_default_exchange: Optional[aio_pika.abc.AbstractExchange] = None
+
+
+def _parse_entries(data: dict) -> List[Entry]:
+    """
+    body 형식:
+      {"entries": [{"employeeIds": [1, 2], "topics": ["request:4"], "message": {...}}, ...]}
+      {"eventId": "...", "employeeId": 1, "type": ...}  (단건, 이전 형식)
+    employeeIds / topics는 생략 가능.
+    """
+    if "entries" in data:
+        return [
+            (
+                [int(e) for e in entry.get("employeeIds", ())],
+                [str(t) for t in entry.get("topics", ())],
+                dict(entry["message"]),
+            )
+            for entry in data["entries"]
+        ]
+    return [([int(data["employeeId"])], [], data)]
+
+
+async def _handle_notification(message: IncomingMessage) -> None:
+    """
+    알림 이벤트 → 이 레플리카에 연결된 대상 직원 세션 / topic 구독 세션의 송신 큐에 추가.
+    reply_to가 있으면 (/notify/batch) 이 레플리카에서 직원별로 전달한 세션 수를 회신한다.
+    """
+    if message.type == _HELLO:
+        await _on_hello(message)
+        return
+    if message.type == _BYE:
+        _replicas.discard(message.app_id)
+        return
+
+    try:
+        entries = _parse_entries(json.loads(message.body))
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Malformed notification message dropped", extra={"body": message.body[:200]})
+        return
+
+    delivered: Dict[int, int] = {}
+    for employee_ids, topics, payload in entries:
+        sent = manager.send_to_employees(employee_ids, payload, topics)
+        for employee_id, sessions in sent.items():
+            if sessions:
+                delivered[employee_id] = delivered.get(employee_id, 0) + sessions
+
+    # 전달한 세션이 없어도 회신한다 (보낸 쪽이 모든 레플리카의 회신을 받으면 바로 응답할 수 있도록)
+    if message.reply_to and _default_exchange is not None:
+        await _default_exchange.publish(
+            Message(
+                body=json.dumps({"replica": REPLICA_ID, "sessions": delivered}).encode("utf-8"),
+                correlation_id=message.correlation_id,
+            ),
+            routing_key=message.reply_to,
+        )
+
+
+async def _on_hello(message: IncomingMessage) -> None:
+    """새 레플리카의 hello: 목록에 추가하고, 자기 존재를 그 레플리카의 reply 큐로 알린다."""
+    if not message.app_id or message.app_id == REPLICA_ID:
+        return
+    _replicas.add(message.app_id)
+    if message.reply_to and _default_exchange is not None:
+        await _default_exchange.publish(
+            Message(body=b"", type=_PEER, app_id=REPLICA_ID),
+            routing_key=message.reply_to,
+        )
+
+
+async def _handle_report(message: IncomingMessage) -> None:
+    if message.type == _PEER:
+        if message.app_id:
+            _replicas.add(message.app_id)
+        return
+    try:
+        data = json.loads(message.body)
+        replica = data.get("replica")
+        sessions = {int(e): int(n) for e, n in data["sessions"].items()}
+    except (ValueError, KeyError, TypeError, AttributeError):
+        logger.warning("Malformed delivery report dropped")
+        return
+    if replica:
+        _replicas.add(replica)  # 타임아웃으로 빠졌던 레플리카가 늦게라도 회신하면 다시 포함
+    report = _reports.get(message.correlation_id or "")
+    if report is not None:  # None이면 이미 응답한 batch
+        report.add(replica, sessions)
+
+
+async def start_consumer(app: FastAPI) -> None:
+    """
+    notification fanout exchange에 이 레플리카 전용 exclusive 큐를 바인딩해서 소비.
+    모든 레플리카가 모든 알림을 받고, 자기에게 붙어 있는 세션에만 전달한다.
+    /notify/batch 전달 결과를 받는 reply 큐도 레플리카마다 하나씩 둔다.
+    """
+    global _default_exchange
+    connection = await aio_pika.connect_robust(RABBITMQ_URL)
+    channel = await connection.channel()
+    exchange = await channel.declare_exchange(
+        NOTIFICATION_EXCHANGE,
+        ExchangeType.FANOUT,
+        durable=True,
+    )
+    # 레플리카가 내려가면 큐도 삭제 (받을 세션이 없으므로)
+    queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+    await queue.bind(exchange)
+    # 처리 = 메모리 큐 추가뿐이라 실패할 일이 없으므로 자동 ack
+    await queue.consume(_handle_notification, no_ack=True)
+
+    reply_queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+    await reply_queue.consume(_handle_report, no_ack=True)
+    _default_exchange = channel.default_exchange
+
+    app.state.rabbit_connection = connection
+    app.state.rabbit_notification_exchange = exchange
+    app.state.rabbit_reply_queue = reply_queue.name
+    # 이미 떠 있는 레플리카들에게 알리고 목록을 받는다 (/notify/batch 조기 응답에 필요)
+    await _publish(app, {}, type=_HELLO, app_id=REPLICA_ID, reply_to=reply_queue.name)
+    logger.info("Notification consumer started", extra={"queue": queue.name, "replica": REPLICA_ID})
+
+
+async def close_consumer(app: FastAPI) -> None:
+    connection = getattr(app.state, "rabbit_connection", None)
+    if connection:
+        try:
+            await _publish(app, {}, type=_BYE, app_id=REPLICA_ID)
+        except Exception:
+            logger.warning("Failed to announce replica shutdown", exc_info=True)
+        await connection.close()
+
+
+async def _publish(app: FastAPI, body: dict, **properties) -> None:
+    exchange = app.state.rabbit_notification_exchange
+    await exchange.publish(
+        Message(
+            body=json.dumps(body, ensure_ascii=False).encode("utf-8"),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.NOT_PERSISTENT,
+            **properties,
+        ),
+        routing_key="",
+    )
+
+
+async def publish_notification(app: FastAPI, message: dict) -> str:
+    """
+    REST /notify로 들어온 알림을 exchange로 다시 publish (어느 레플리카가 받든 전체에 전달).
+    eventId가 없으면 붙여서 반환.
+    """
+    event_id = str(ensure_event_id(message))
+    await _publish(app, message, message_id=event_id)
+    return event_id
+
+
+async def publish_batch(
+    app: FastAPI,
+    entries: List[Entry],
+    report_timeout: float,
+) -> Dict[int, int]:
+    """
+    여러 알림을 메시지 1개로 publish하고, 레플리카들의 전달 결과를 report_timeout까지 모은다.
+    대상 직원 모두 전달이 확인되거나 알고 있는 레플리카가 모두 회신하면 바로 반환한다.
+    반환: employeeId → 전달된 세션 수 (모든 레플리카 합계, 응답이 없으면 0)
+    """
+    for _, _, payload in entries:
+        ensure_event_id(payload)
+    batch_id = uuid.uuid4().hex
+    targets = {e for employee_ids, _, _ in entries for e in employee_ids}
+    report = _reports[batch_id] = _Report(targets, _replicas)
+    try:
+        await _publish(
+            app,
+            {
+                "entries": [
+                    {"employeeIds": ids, "topics": topics, "message": payload}
+                    for ids, topics, payload in entries
+                ]
+            },
+            correlation_id=batch_id,
+            reply_to=app.state.rabbit_reply_queue,
+        )
+        try:
+            await asyncio.wait_for(report.done.wait(), report_timeout)
+        except asyncio.TimeoutError:
+            # 나머지 직원은 접속 중인 세션이 없는 것으로 본다.
+            # 회신하지 않은 레플리카는 내려간 것으로 보고 목록에서 뺀다 (다시 회신하면 추가됨)
+            _replicas.difference_update(report.waiting - {REPLICA_ID})
+        return dict(report.sessions)
+    finally:
+        _reports.pop(batch_id, None)
+
+
+def deliver_batch_locally(entries: List[Entry]) -> Dict[int, int]:
+    """브로커 없이 (NOTIFICATION_BROKER_ENABLED=false) 이 레플리카의 세션에만 전달."""
+    sessions: Dict[int, int] = {}
+    for employee_ids, topics, payload in entries:
+        for employee_id, count in manager.send_to_employees(employee_ids, payload, topics).items():
+            sessions[employee_id] = sessions.get(employee_id, 0) + count
+    return sessions
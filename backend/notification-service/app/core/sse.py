@@ -0,0 +1,110 @@
+"""
+Server-Sent Events 세션.
+
+GET /events/{employee_id} 응답 스트림을 WebSocket과 같은 인터페이스(accept / receive / send_text / close)로
+감싸서 ConnectionManager가 WebSocket 세션과 똑같이 등록 / 송신 큐 / 하트비트 / 정리를 하게 한다.
+알림 본문은 Encoded.sse (id + data 필드, 메시지당 1회 직렬화)를 그대로 body chunk로 보낸다.
+"""
+from typing import Optional
+
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from app.core.connection_manager import ENCODING_SSE, manager
+
+_HEADERS = [
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),  # nginx ingress가 응답을 모아 두지 않도록
+]
+_DISCONNECT = {"type": "websocket.disconnect"}
+
+
+class SseChannel:
+    """
+    ASGI http 연결 1개. 응답 헤더는 첫 송신(또는 첫 수신 대기) 때 보낸다.
+    그 전에 close되면 (연결 수 제한) 503 + Retry-After로 응답해 EventSource가 나중에 다시 접속하게 한다.
+    """
+
+    __slots__ = ("scope", "_receive", "_send", "_retry_ms", "_started", "_closed")
+
+    def __init__(self, scope: Scope, receive: Receive, send: Send, retry_ms: int) -> None:
+        self.scope = scope
+        self._receive = receive
+        self._send = send
+        self._retry_ms = retry_ms
+        self._started = False
+        self._closed = False
+
+    async def accept(self, subprotocol: Optional[str] = None) -> None:
+        pass
+
+    async def _start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        await self._send({"type": "http.response.start", "status": 200, "headers": _HEADERS})
+        # 끊겼을 때 EventSource가 다시 접속하기까지 기다릴 시간
+        await self._send_chunk(f"retry: {self._retry_ms}\n\n")
+
+    async def _send_chunk(self, data: str) -> None:
+        await self._send({"type": "http.response.body", "body": data.encode("utf-8"), "more_body": True})
+
+    async def send_text(self, data: str) -> None:
+        if self._closed:
+            raise RuntimeError("SSE stream closed")
+        await self._start()
+        await self._send_chunk(data)
+
+    async def receive(self) -> dict:
+        """클라이언트 → 서버 메시지는 없으므로 연결이 끊길 때까지 대기."""
+        if not self._closed:
+            await self._start()
+        while True:
+            message = await self._receive()
+            if message["type"] == "http.disconnect":
+                return _DISCONNECT
+
+    async def close(self, code: int = 1000) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if not self._started:
+            self._started = True
+            await self._send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [(b"retry-after", str(max(self._retry_ms // 1000, 1)).encode())],
+            })
+        await self._send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class EventStreamResponse(Response):
+    """GET /events 응답. 요청 처리 task 안에서 세션을 등록하고 끊길 때까지 전달한다."""
+
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        employee_id: int,
+        last_event_id: Optional[int],
+        topics: list[str],
+        retry_ms: int,
+    ) -> None:
+        self.employee_id = employee_id
+        self.last_event_id = last_event_id
+        self.topics = topics
+        self.retry_ms = retry_ms
+        self.background = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        channel = SseChannel(scope, receive, send, self.retry_ms)
+        conn = await manager.connect(self.employee_id, channel, self.last_event_id, encoding=ENCODING_SSE)
+        if conn is None:
+            return  # 연결 수 제한으로 거부됨 (503)
+        if self.topics:
+            manager.subscribe(conn, self.topics)
+        try:
+            await manager.serve(conn)
+        finally:
+            await channel.close()
@@ -1,16 +1,48 @@
-from fastapi import FastAPI, WebSocket
-from fastapi.websockets import WebSocketDisconnect
+from typing import Optional
 
+from fastapi import FastAPI, Query, WebSocket
+
+from app.api.events import router as events_router
 from app.api.notify import router as notify_router
+from app.core.config import NOTIFICATION_BROKER_ENABLED
 from app.core.connection_manager import manager
+from app.core.event_store import open_event_store
+from app.core.log import setup_logging, shutdown_logging
+from app.core.rabbitmq import close_consumer, start_consumer
+
+setup_logging("notification-service")
 
 app = FastAPI(
     title="Notification Service",
     version="0.1.0",
-    description="WebSocket notification service for approval results",
+    description="WebSocket / SSE notification service for approval results",
 )
 
 app.include_router(notify_router)
+app.include_router(events_router)
+
+
+@app.on_event("startup")
+async def on_startup():
+    # (옵션) 알림 영구 저장: 재시작 전 알림으로 메모리 버퍼를 채워 둔다
+    manager.store = await open_event_store()
+    if manager.store is not None:
+        for employee_id, event_id, text in await manager.store.recent(manager.buffer.max_events):
+            manager.buffer.append(employee_id, event_id, text)
+
+    # 다른 레플리카에 접속한 직원에게도 알림이 가도록 notification exchange 구독
+    if NOTIFICATION_BROKER_ENABLED:
+        await start_consumer(app)
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    if NOTIFICATION_BROKER_ENABLED:
+        await close_consumer(app)
+    await manager.close_all()
+    if manager.store is not None:
+        await manager.store.stop()
+    shutdown_logging()
 
 
 @app.get("/health")
@@ -19,15 +51,19 @@ async def health_check():
 
 
 @app.websocket("/ws/{employee_id}")
-async def websocket_endpoint(websocket: WebSocket, employee_id: int):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    employee_id: int,
+    last_event_id: Optional[int] = Query(None, alias="lastEventId", ge=0),
+):
     """
     클라이언트(프론트)가 employee_id로 접속하는 WebSocket 엔드포인트.
     예: ws://localhost:8004/ws/2
+    재접속 시 마지막으로 받은 eventId를 넘기면 그 이후 알림을 replay 메시지 1개로 먼저 받는다.
+    예: ws://localhost:8004/ws/2?lastEventId=2417851639229258349 (0이면 버퍼에 있는 알림 전체)
+    서버가 주기적으로 {"type":"ping"}을 보내므로 클라이언트는 아무 메시지(예: {"type":"pong"})로 응답해야 한다.
     """
-    await manager.connect(employee_id, websocket)
-    try:
-        while True:
-            # 클라이언트에서 오는 메시지는 지금은 무시(keep-alive 용)
-            await websocket.receive_text()
-    except WebSocketDisconnect:
-        manager.disconnect(employee_id, websocket)
+    conn = await manager.connect(employee_id, websocket, last_event_id)
+    if conn is None:
+        return  # 연결 수 제한으로 거부됨 (close 1013)
+    await manager.serve(conn)
@@ -0,0 +1,250 @@
+"""
+WebSocket 연결 용량 벤치마크: 실제 uvicorn 서버에 로컬 클라이언트 N개(기본 50,000개)를 붙여서
+연결 1개당 서버 메모리와 브로드캐스트 지연을 측정한다.
+
+- 서버    : uvicorn app.main:app (NOTIFICATION_BROKER_ENABLED=false, 연결 수 제한 해제, 별도 프로세스)
+- 클라이언트: --procs개 프로세스가 websockets로 나눠서 접속 (직원 1명당 1세션), 서버 ping에는 pong으로 응답
+- 메모리  : 접속 전후 서버 프로세스 RSS 차이 / 연결 수
+- 브로드캐스트: 전 직원 대상 POST /notify/batch를 --rounds번 보내고, 요청 시각부터 각 클라이언트 수신까지의 지연
+- idle 정리: --zombie-ratio 비율의 클라이언트는 ping에 응답하지 않는다.
+  브로드캐스트 후 idle timeout이 지나 서버가 정리한 연결 수(/stats의 evictedIdle)를 확인한다.
+
+로컬 포트(ip_local_port_range)가 모자라지 않도록 127.0.0.0/8의 여러 주소로 나눠 접속한다.
+파일 디스크립터 한도(ulimit -n, hard)는 연결 수보다 커야 한다.
+
+실행 (notification-service 디렉터리에서):
+    python -m benchmarks.bench_connections --clients 50000 --procs 4
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+import httpx
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed
+
+# /notify/batch 항목당 최대 직원 수 (app.api.notify.NotificationBatchItem)
+_BATCH_EMPLOYEES = 5000
+_PONG = '{"type":"pong"}'
+
+
+def _raise_nofile() -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def _rss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _start_server(args) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "NOTIFICATION_BROKER_ENABLED": "false",
+        "NOTIFICATION_MONGODB_URI": "",
+        "LOG_LEVEL": "ERROR",  # 정리(evict) 로그 생략
+        "WS_MAX_CONNECTIONS": "0",
+        "WS_MAX_CONNECTIONS_PER_EMPLOYEE": "0",
+        "WS_HEARTBEAT_INTERVAL_SECONDS": str(args.heartbeat),
+        "WS_IDLE_TIMEOUT_SECONDS": str(args.idle_timeout),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "0.0.0.0", "--port", str(args.port),
+            "--log-level", "warning", "--backlog", "4096",
+        ],
+        env=env,
+    )
+
+
+def _wait_healthy(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("notification-service did not start")
+
+
+# ---- 클라이언트 프로세스 ----
+
+async def _client(uri: str, zombie: bool, latencies: List[float], ready, stop: asyncio.Event) -> None:
+    async with connect(uri, ping_interval=None, compression=None, proxy=None, open_timeout=60) as ws:
+        ready()
+        reader = asyncio.ensure_future(_read(ws, zombie, latencies))
+        await stop.wait()
+        reader.cancel()
+
+
+async def _read(ws, zombie: bool, latencies: List[float]) -> None:
+    try:
+        async for text in ws:
+            if text.startswith('{"type":"ping"'):
+                if not zombie:
+                    await ws.send(_PONG)
+                continue
+            latencies.append(time.time() - json.loads(text)["sentAt"])
+    except ConnectionClosed:
+        pass
+
+
+async def _run_clients(employee_ids: List[int], args, pipe) -> None:
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    latencies: List[float] = []
+    limit = asyncio.Semaphore(args.connect_concurrency)
+    connected = failed = 0
+    every = int(1 / args.zombie_ratio) if args.zombie_ratio > 0 else 0
+
+    async def open_one(employee_id: int) -> None:
+        nonlocal connected, failed
+        handshaking = True
+
+        def ready() -> None:
+            nonlocal connected, handshaking
+            connected += 1
+            handshaking = False
+            limit.release()
+
+        await limit.acquire()
+        host = f"127.0.0.{1 + employee_id % args.hosts}"
+        zombie = bool(every) and employee_id % every == 0
+        try:
+            await _client(f"ws://{host}:{args.port}/ws/{employee_id}", zombie, latencies, ready, stop)
+        except Exception:
+            if handshaking:
+                failed += 1
+        finally:
+            if handshaking:
+                limit.release()
+
+    tasks = [asyncio.create_task(open_one(e)) for e in employee_ids]
+    while connected + failed < len(employee_ids):
+        await asyncio.sleep(0.1)
+    pipe.send(connected)
+
+    await loop.run_in_executor(None, pipe.recv)  # 측정 종료 신호
+    pipe.send(latencies)
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _client_main(employee_ids: List[int], args, pipe) -> None:
+    _raise_nofile()
+    asyncio.run(_run_clients(employee_ids, args, pipe))
+
+
+# ---- 측정 ----
+
+def _broadcast(client: httpx.Client, employee_ids: List[int]) -> float:
+    payload = {"type": "bench", "sentAt": time.time()}
+    items = [
+        {"employeeIds": employee_ids[i:i + _BATCH_EMPLOYEES], "payload": payload}
+        for i in range(0, len(employee_ids), _BATCH_EMPLOYEES)
+    ]
+    start = time.perf_counter()
+    client.post("/notify/batch", json={"items": items}).raise_for_status()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=50_000)
+    parser.add_argument("--procs", type=int, default=4, help="클라이언트 프로세스 수")
+    parser.add_argument("--hosts", type=int, default=16, help="접속에 나눠 쓸 127.0.0.x 주소 수")
+    parser.add_argument("--port", type=int, default=18004)
+    parser.add_argument("--connect-concurrency", type=int, default=500, help="프로세스당 동시 핸드셰이크 수")
+    parser.add_argument("--rounds", type=int, default=5, help="브로드캐스트 횟수")
+    parser.add_argument("--interval", type=float, default=1.0, help="브로드캐스트 간격 (초)")
+    parser.add_argument("--heartbeat", type=float, default=5.0, help="WS_HEARTBEAT_INTERVAL_SECONDS")
+    parser.add_argument("--idle-timeout", type=float, default=12.0, help="WS_IDLE_TIMEOUT_SECONDS")
+    parser.add_argument("--zombie-ratio", type=float, default=0.01, help="ping에 응답하지 않는 클라이언트 비율")
+    args = parser.parse_args()
+
+    _raise_nofile()
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = _start_server(args)
+    procs, pipes = [], []
+    try:
+        _wait_healthy(base_url)
+        http = httpx.Client(base_url=base_url, timeout=120.0)
+        rss_before = _rss_kib(server.pid)
+
+        employee_ids = list(range(1, args.clients + 1))
+        start = time.perf_counter()
+        for n in range(args.procs):
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(
+                target=_client_main, args=(employee_ids[n::args.procs], args, child), daemon=True
+            )
+            proc.start()
+            procs.append(proc)
+            pipes.append(parent)
+        connected = sum(p.recv() for p in pipes)
+        connect_seconds = time.perf_counter() - start
+        time.sleep(1.0)  # 마지막 핸드셰이크 정리
+        rss_after = _rss_kib(server.pid)
+        stats_connected = http.get("/stats").json()["connections"]
+
+        notify_seconds = []
+        for _ in range(args.rounds):
+            notify_seconds.append(_broadcast(http, employee_ids))
+            time.sleep(args.interval)
+
+        # 좀비 연결이 idle timeout으로 정리될 때까지 대기
+        time.sleep(max(args.idle_timeout + args.heartbeat - args.rounds * args.interval, 0) + 1.0)
+        stats = http.get("/stats").json()
+
+        for p in pipes:
+            p.send("stop")
+        latencies = [lat for p in pipes for lat in p.recv()]
+    finally:
+        for proc in procs:
+            proc.join(timeout=30)
+            if proc.is_alive():
+                proc.terminate()
+        server.terminate()
+        server.wait()
+
+    per_conn = (rss_after - rss_before) * 1024 / max(connected, 1)
+    expected = connected * args.rounds
+    print(
+        f"clients={args.clients:,} connected={connected:,} (server saw {stats_connected:,}) "
+        f"connect={connect_seconds:.1f}s procs={args.procs}"
+    )
+    print(
+        f"server RSS {rss_before / 1024:.1f} MiB -> {rss_after / 1024:.1f} MiB "
+        f"= {per_conn / 1024:.1f} KiB/connection"
+    )
+    if latencies:
+        q = statistics.quantiles(latencies, n=100)
+        print(
+            f"broadcast x{args.rounds}: POST /notify/batch {statistics.mean(notify_seconds) * 1e3:.1f} ms, "
+            f"delivered {len(latencies):,}/{expected:,}, "
+            f"latency p50={q[49] * 1e3:.1f} ms p99={q[98] * 1e3:.1f} ms max={max(latencies) * 1e3:.1f} ms"
+        )
+    print(
+        f"idle reaping: zombies={int(connected * args.zombie_ratio):,} "
+        f"evictedIdle={stats['evictedIdle']:,} remaining={stats['connections']:,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+알림 인코딩 벤치마크: JSON 텍스트 vs msgpack, permessage-deflate 유무에 따른 전송 바이트와 인코딩 비용.
+
+결재 알림 스트림(--messages건)을 세션 1개가 받는다고 보고 메시지당 평균 프레임 payload 크기를 비교한다.
+deflate는 permessage-deflate와 같은 방식(context takeover, window 12bit / memLevel 5, 메시지마다 sync flush)으로
+압축하므로 반복되는 키 이름(finalStatus, approverId ...)은 두 번째 메시지부터 back-reference가 된다.
+
+인코딩 비용은 알림 1건을 세션 --sockets개(JSON / msgpack / SSE 세션 모두 있다고 가정)에 보낼 때
+- per-socket : 세션마다 직렬화 (변경 전 send_json 방식)
+- shared     : app.core.connection_manager.Encoded (메시지당 1회, 세션끼리 공유)
+를 비교한다.
+
+실행 (notification-service 디렉터리에서):
+    python -m benchmarks.bench_encoding --messages 2000 --sockets 1000
+"""
+import argparse
+import json
+import random
+import time
+import zlib
+from typing import Callable, List
+
+import msgpack
+
+from app.core.connection_manager import Encoded, encode_message
+
+_STATUSES = ("approved", "rejected", "in_progress")
+
+
+def _messages(count: int) -> List[dict]:
+    rng = random.Random(7)
+    messages = []
+    for n in range(count):
+        final = rng.choice(_STATUSES)
+        messages.append({
+            "type": "approval_result",
+            "requestId": rng.randint(1, 50_000),
+            "step": rng.randint(1, 3),
+            "approverId": rng.randint(1, 3_000),
+            "finalStatus": final,
+            "stepStatus": "rejected" if final == "rejected" else "approved",
+            "title": rng.choice(("연차 신청", "출장비 정산", "구매 요청", "교육 신청")) + f" #{n}",
+            "eventId": str(899828382147014656 + n),
+        })
+    return messages
+
+
+def _frame_bytes(payloads: List[bytes], deflate: bool) -> float:
+    """메시지당 평균 프레임 payload 크기."""
+    if not deflate:
+        return sum(len(p) for p in payloads) / len(payloads)
+    compressor = zlib.compressobj(wbits=-12, memLevel=5)
+    total = 0
+    for payload in payloads:
+        data = compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        total += len(data) - 4  # permessage-deflate는 끝의 00 00 ff ff를 빼고 보낸다
+    return total / len(payloads)
+
+
+def _time(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--sockets", type=int, default=1000, help="알림 1건을 받는 세션 수 (인코딩 비용)")
+    args = parser.parse_args()
+
+    messages = _messages(args.messages)
+    as_json = [encode_message(m).encode("utf-8") for m in messages]
+    as_msgpack = [msgpack.packb(m) for m in messages]
+
+    print(f"messages={args.messages:,} (bytes/message, frame payload only)")
+    print(f"{'format':<16} {'bytes':>8} {'vs json':>8}")
+    base = _frame_bytes(as_json, False)
+    for name, payloads, deflate in (
+        ("json", as_json, False),
+        ("json+deflate", as_json, True),
+        ("msgpack", as_msgpack, False),
+        ("msgpack+deflate", as_msgpack, True),
+    ):
+        size = _frame_bytes(payloads, deflate)
+        print(f"{name:<16} {size:>8.1f} {size / base:>8.0%}")
+
+    sample = messages[: min(len(messages), 200)]
+    per_socket = _time(lambda: [
+        (encode_message(m), msgpack.packb(m), f"id: {m['eventId']}\ndata: {encode_message(m)}\n\n")
+        for m in sample for _ in range(args.sockets)
+    ])
+    shared = _time(lambda: [
+        (e.text, e.packed, e.sse) for e in (Encoded.of(dict(m)) for m in sample) for _ in range(args.sockets)
+    ])
+    print(f"\nencode json+msgpack+sse for {len(sample)} messages x {args.sockets:,} sockets")
+    print(f"{'method':<12} {'total(ms)':>10} {'us/message':>11}")
+    for name, elapsed in (("per-socket", per_socket), ("shared", shared)):
+        print(f"{name:<12} {elapsed * 1e3:>10.1f} {elapsed / len(sample) * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
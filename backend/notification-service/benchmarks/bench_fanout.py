@@ -0,0 +1,182 @@
+"""
+WebSocket fan-out 벤치마크: 소켓마다 순차 send_json vs 세션별 송신 큐 + writer task.
+
+소켓 N개(기본 10,000개)를 직원 N / sessions 명에게 나눠 연결해 두고,
+직원마다 /notify를 --interval 초 간격으로 --burst 건씩(requestId는 --request-ids 종류를 순환) 보냈을 때
+notify 1건의 지연과 정상 소켓까지 모두 전달되는 시간을 비교한다.
+소켓은 메모리 안의 가짜 WebSocket이고, 그중 --slow-ratio 비율은 send 1회에 --slow-delay 초가 걸린다
+(멈춘 브라우저 탭 / 끊겼지만 FIN이 오지 않은 연결).
+
+- sequential  : 기존 구현 (notify 안에서 소켓마다 send_json을 차례로 await, 타임아웃 없음)
+- drop_oldest / coalesce / disconnect : ConnectionManager (notify는 큐에 넣기만 함, 정책별 큐 초과 처리)
+
+실행 (notification-service 디렉터리에서):
+    python -m benchmarks.bench_fanout --sockets 10000
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from typing import Dict, List, Set, Tuple
+
+from app.core.connection_manager import OVERFLOW_POLICIES, ConnectionManager
+
+
+class FakeWebSocket:
+    """send에 걸리는 시간만 흉내 내는 WebSocket."""
+
+    scope = {"subprotocols": []}
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def _write(self) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        else:
+            await asyncio.sleep(0)  # 실제 소켓처럼 한 번은 이벤트 루프에 양보
+
+    async def accept(self, subprotocol=None) -> None:
+        pass
+
+    async def send_json(self, data: dict) -> None:
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        await self._write()
+
+    async def send_text(self, data: str) -> None:
+        await self._write()
+
+    async def close(self, code: int = 1000) -> None:
+        await asyncio.sleep(0)
+
+
+def _sockets(args) -> Dict[int, List[FakeWebSocket]]:
+    rng = random.Random(7)
+    sockets: Dict[int, List[FakeWebSocket]] = {}
+    for n in range(args.sockets):
+        delay = args.slow_delay if rng.random() < args.slow_ratio else 0.0
+        sockets.setdefault(n // args.sessions, []).append(FakeWebSocket(delay))
+    return sockets
+
+
+def _message(employee_id: int, seq: int, request_ids: int) -> dict:
+    return {
+        "employeeId": employee_id,
+        "type": "approval_result",
+        "requestId": seq % request_ids,
+        "step": seq,
+        "approverId": 2,
+        "finalStatus": "in_progress",
+        "stepStatus": "approved",
+        "title": "연차 신청 (12/1~12/2)",
+    }
+
+
+async def _sequential_send(conns: Dict[int, Set[FakeWebSocket]], employee_id: int, message: dict) -> None:
+    # 변경 전 ConnectionManager.send_to_employee
+    for ws in list(conns.get(employee_id, [])):
+        try:
+            await ws.send_json(message)
+        except Exception:
+            pass
+
+
+async def _burst(send, employees: List[int], args) -> List[float]:
+    latencies: List[float] = []
+
+    async def one(employee_id: int, seq: int) -> None:
+        start = time.perf_counter()
+        result = send(employee_id, _message(employee_id, seq, args.request_ids))
+        if asyncio.iscoroutine(result):
+            await result
+        latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    for seq in range(args.burst):
+        tasks.extend(asyncio.create_task(one(e, seq)) for e in employees)
+        await asyncio.sleep(args.interval)
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+async def _drained(manager: ConnectionManager) -> None:
+    """정상 소켓의 송신 큐가 모두 빌 때까지 대기."""
+    fast = [
+        conn
+        for conns in manager.active_connections.values()
+        for conn in conns.values()
+        if not conn.websocket.delay
+    ]
+    while any(conn.depth for conn in fast):
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0)  # 마지막 send 완료
+
+
+async def _bench_sequential(args) -> Tuple[float, List[float], dict]:
+    conns = {e: set(ws) for e, ws in _sockets(args).items()}
+    start = time.perf_counter()
+    latencies = await _burst(lambda e, m: _sequential_send(conns, e, m), list(conns), args)
+    return time.perf_counter() - start, latencies, {}
+
+
+async def _bench_queued(args, policy: str) -> Tuple[float, List[float], dict]:
+    sockets = _sockets(args)
+    manager = ConnectionManager(
+        send_timeout=args.timeout, max_queue=args.queue_size, policy=policy
+    )
+    for employee_id, websockets in sockets.items():
+        for ws in websockets:
+            await manager.connect(employee_id, ws)
+
+    start = time.perf_counter()
+    latencies = await _burst(manager.send_to_employee, list(sockets), args)
+    await _drained(manager)
+    elapsed = time.perf_counter() - start
+    stats = manager.stats()
+    await manager.close_all()
+    return elapsed, latencies, stats
+
+
+async def _bench(args) -> None:
+    results = [("sequential",) + await _bench_sequential(args)]
+    for policy in OVERFLOW_POLICIES:
+        results.append((policy,) + await _bench_queued(args, policy))
+
+    print(
+        f"sockets={args.sockets:,} sessions/employee={args.sessions} burst={args.burst} "
+        f"interval={args.interval}s requestIds={args.request_ids} queue={args.queue_size} "
+        f"slow={args.slow_ratio:.1%} x {args.slow_delay}s timeout={args.timeout}s"
+    )
+    print(
+        f"{'method':<12} {'deliver(s)':>10} {'notify p50(ms)':>15} {'notify p99(ms)':>15} "
+        f"{'dropped':>8} {'coalesced':>10} {'evicted':>8}"
+    )
+    for name, elapsed, latencies, stats in results:
+        q = statistics.quantiles(latencies, n=100)
+        evicted = stats.get("evictedSlow", 0) + stats.get("evictedOverflow", 0)
+        print(
+            f"{name:<12} {elapsed:>10.2f} {q[49] * 1e3:>15.3f} {q[98] * 1e3:>15.3f} "
+            f"{stats.get('dropped', 0):>8} {stats.get('coalesced', 0):>10} {evicted:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sockets", type=int, default=10_000)
+    parser.add_argument("--sessions", type=int, default=4, help="직원 1명당 세션(탭) 수")
+    parser.add_argument("--burst", type=int, default=20, help="직원 1명당 notify 건수")
+    parser.add_argument("--interval", type=float, default=0.01, help="notify 라운드 간격 (초)")
+    parser.add_argument("--request-ids", type=int, default=5, help="burst 안의 requestId 종류 수")
+    parser.add_argument("--queue-size", type=int, default=16)
+    parser.add_argument("--slow-ratio", type=float, default=0.01)
+    parser.add_argument("--slow-delay", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    logging.disable(logging.WARNING)  # 연결 제거 로그 생략
+    asyncio.run(_bench(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()